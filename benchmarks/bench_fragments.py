@@ -0,0 +1,110 @@
+"""Time building article title lines and footer tables in bulk.
+
+Compares element-by-element construction (a trimmed copy of what the
+generators did before, without the footer's page field) with cloning the precompiled templates in :mod:`journal_updater.fragments`::
+
+    python benchmarks/bench_fragments.py [COUNT]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from docx.oxml import OxmlElement
+from docx.oxml.ns import nsmap, qn
+
+from journal_updater import fragments
+
+
+def _shape_by_element(style):
+    if "v" not in nsmap:
+        nsmap["v"] = fragments.VML
+    pict = OxmlElement("w:pict")
+    shape = OxmlElement("v:shape")
+    shape.set("type", "#_x0000_t75")
+    shape.set("style", style)
+    shape.set("strokecolor", "000000")
+    shape.set("fillcolor", "none")
+    pict.append(shape)
+    return pict
+
+
+def _footer_by_element(col, left, right):
+    tbl = OxmlElement("w:tbl")
+    tbl_pr = OxmlElement("w:tblPr")
+    borders = OxmlElement("w:tblBorders")
+    for side in ("top", "left", "bottom", "right", "insideH", "insideV"):
+        el = OxmlElement(f"w:{side}")
+        el.set(qn("w:val"), "nil")
+        borders.append(el)
+    tbl_pr.append(borders)
+    tbl.append(tbl_pr)
+    grid = OxmlElement("w:tblGrid")
+    tr = OxmlElement("w:tr")
+    for text, fill in ((left, None), ("1", "000000"), (right, None)):
+        grid_col = OxmlElement("w:gridCol")
+        grid_col.set(qn("w:w"), col)
+        grid.append(grid_col)
+        tc = OxmlElement("w:tc")
+        tc_pr = OxmlElement("w:tcPr")
+        tc_w = OxmlElement("w:tcW")
+        tc_w.set(qn("w:type"), "dxa")
+        tc_w.set(qn("w:w"), col)
+        tc_pr.append(tc_w)
+        if fill:
+            shd = OxmlElement("w:shd")
+            shd.set(qn("w:fill"), fill)
+            tc_pr.append(shd)
+        tc.append(tc_pr)
+        p = OxmlElement("w:p")
+        r = OxmlElement("w:r")
+        r_pr = OxmlElement("w:rPr")
+        sz = OxmlElement("w:sz")
+        sz.set(qn("w:val"), "20")
+        r_pr.append(sz)
+        r.append(r_pr)
+        t = OxmlElement("w:t")
+        t.text = text
+        r.append(t)
+        p.append(r)
+        tc.append(p)
+        tr.append(tc)
+    tbl.append(grid)
+    tbl.append(tr)
+    return tbl
+
+
+def _time(label, func, count):
+    start = time.perf_counter()
+    for i in range(count):
+        func(i)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28}{elapsed * 1000:9.1f} ms  ({elapsed / count * 1e6:6.1f} us each)")
+
+
+def main(count=5000):
+    style = "width:468pt;height:1pt"
+    _time("title line, elements", lambda i: _shape_by_element(style), count)
+    _time(
+        "title line, fragment",
+        lambda i: fragments.SHAPE.build(style=style, fill="none", stroke="000000"),
+        count,
+    )
+    _time(
+        "footer table, elements",
+        lambda i: _footer_by_element("4080", "The ABNFF Journal", f"Volume {i}"),
+        count,
+    )
+    _time(
+        "footer table, fragment",
+        lambda i: fragments.FOOTER_TABLE.build(
+            col="4080", left="The ABNFF Journal", right=f"Volume {i}"
+        ),
+        count,
+    )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -0,0 +1,65 @@
+"""Check command line and GUI start-up against a time budget.
+
+Each case runs in a fresh interpreter and is repeated; the best time is
+compared with its budget and the script exits non-zero if one is exceeded::
+
+    python benchmarks/bench_startup.py [RUNS]
+
+The GUI case needs a display and is skipped without one.
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# seconds, including interpreter start-up
+BUDGETS = {
+    "cli --help": 0.15,
+    "cli bad arguments": 0.15,
+    "gui first window": 0.6,
+}
+
+_GUI = (
+    "from journal_updater import gui\n"
+    "root = gui.build_window()\n"
+    "root.update()\n"
+    "root.destroy()\n"
+)
+
+CASES = {
+    "cli --help": [sys.executable, "-m", "journal_updater", "--help"],
+    "cli bad arguments": [sys.executable, "-m", "journal_updater", "a", "b", "c"],
+    "gui first window": [sys.executable, "-c", _GUI],
+}
+
+
+def _best(cmd, runs):
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(cmd, cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main(runs=5):
+    has_display = sys.platform in ("win32", "darwin") or os.environ.get("DISPLAY")
+    failed = False
+    for name, cmd in CASES.items():
+        if name.startswith("gui") and not has_display:
+            print(f"{name:<20} skipped (no display)")
+            continue
+        best = _best(cmd, runs)
+        budget = BUDGETS[name]
+        ok = best <= budget
+        failed |= not ok
+        print(f"{name:<20}{best * 1000:7.0f} ms  budget {budget * 1000:.0f} ms  {'ok' if ok else 'OVER'}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 5))
@@ -0,0 +1,69 @@
+"""Time the page scan and line lookups with and without the compiled queries.
+
+The "before" variants are trimmed copies of the code replaced by
+:mod:`journal_updater.xpaths`: walking every block for break markers and
+calling ``element.xpath()`` per paragraph::
+
+    python benchmarks/bench_xpath.py [PARAGRAPHS]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from docx.enum.text import WD_BREAK
+
+import journal_updater.journal_updater as ju
+from journal_updater import xpaths
+
+
+def _document(count):
+    doc = ju.Document()
+    for i in range(count):
+        p = doc.add_paragraph()
+        for j in range(6):
+            p.add_run(f"word{j} text ")
+        if i % 40 == 0:
+            p.add_run().add_break(WD_BREAK.PAGE)
+    return doc
+
+
+def _scan_every_block(body):
+    for el in body.iterchildren():
+        breaks = ju._BlockBreaks(el)
+        for node in el.iter(*ju._BREAK_TAGS):
+            breaks.feed(node)
+
+
+def _best(func, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main(count=6000):
+    doc = _document(count)
+    body = doc.element.body
+    paragraphs = list(xpaths.BODY_PARAGRAPHS(body))
+    rows = [
+        ("walk every block", _best(lambda: _scan_every_block(body))),
+        ("scan_pages", _best(lambda: ju.scan_pages(doc))),
+        (
+            "page breaks, xpath() per paragraph",
+            _best(lambda: [p.xpath('.//w:br[@w:type="page"]') for p in paragraphs]),
+        ),
+        ("page breaks, one set query", _best(lambda: set(xpaths.PAGE_BREAK_PARAGRAPHS(body)))),
+        ("bordered, one set query", _best(lambda: set(xpaths.BORDERED_PARAGRAPHS(body)))),
+    ]
+    print(f"{count} paragraphs")
+    for name, ms in rows:
+        print(f"  {name:<36} {ms:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 6000)
@@ -0,0 +1,36 @@
+"""Entry point for ``python -m journal_updater``.
+
+``serve`` starts the warm worker, ``submit`` sends it a job, ``archive``
+indexes and searches past issues and anything else is handled like the
+``journal_updater.py`` script. The document
+libraries are only imported once a command actually needs them.
+"""
+
+import sys
+from typing import List, Optional
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    command = argv[0] if argv else None
+    if command == "serve":
+        from .server import serve_main
+
+        serve_main(argv[1:])
+        return 0
+    if command == "submit":
+        from .server import submit_main
+
+        return submit_main(argv[1:])
+    if command == "archive":
+        from .archive import archive_main
+
+        return archive_main(argv[1:])
+    from .cli import main as update_main
+
+    update_main(argv, prog="python -m journal_updater")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,297 @@
+"""Searchable index of past issues in a local SQLite database.
+
+Finding the issue that carried an article, an author or an editor used to
+mean opening old issues one by one. :class:`Archive` reads each issue once
+and stores what identifies it in an FTS5 full-text table:
+
+- ``title``: article titles from the Table of Contents, see
+  :func:`extract_article_titles_from_toc`;
+- ``author``: the author line below each article title;
+- ``editorial``: editorial headings and the President's Message;
+- ``masthead``: the lines of page 2, where the editors are listed.
+
+Every entry keeps the page it starts on. Files are re-read only when their
+size or modification time changed and then only if their SHA-256 did, so
+indexing a folder of decades of issues again takes a moment. Queries are a
+single FTS lookup.
+
+Usage::
+
+    python -m journal_updater archive index ISSUES_FOLDER [--db archive.db]
+    python -m journal_updater archive search "Smith" [--kind author]
+"""
+
+import argparse
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import time
+from bisect import bisect_right
+from pathlib import Path
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+DEFAULT_DB = "journal_archive.db"
+
+KINDS = ("title", "author", "editorial", "masthead")
+
+# the page listing the editors, see update_associate_editors
+MASTHEAD_PAGE = 2
+
+# longest paragraph still taken for an editorial heading
+_HEADING_MAX = 120
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    indexed_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY,
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    kind TEXT NOT NULL,
+    text TEXT NOT NULL,
+    page INTEGER
+);
+CREATE INDEX IF NOT EXISTS entries_file ON entries(file_id);
+CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts USING fts5(
+    text, content='entries', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS entries_ai AFTER INSERT ON entries BEGIN
+    INSERT INTO entries_fts(rowid, text) VALUES (new.id, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS entries_ad AFTER DELETE ON entries BEGIN
+    INSERT INTO entries_fts(entries_fts, rowid, text) VALUES ('delete', old.id, old.text);
+END;
+"""
+
+
+def _updater():
+    """Import the updater on first use; searching never needs it."""
+    try:
+        from . import journal_updater
+    except ImportError:  # run as a script
+        import journal_updater
+    return journal_updater
+
+
+class Hit(NamedTuple):
+    """One search result."""
+
+    path: str
+    kind: str
+    text: str
+    page: Optional[int]
+
+
+def _sha256(path: Path) -> str:
+    sha = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def issue_entries(doc) -> List[Tuple[str, str, Optional[int]]]:
+    """Return ``(kind, text, page)`` for everything indexed from ``doc``.
+
+    Titles listed in the TOC but not found in the body get page ``None``.
+    """
+    ju = _updater()
+    page_map = ju.scan_pages(doc)
+    entries: List[Tuple[str, str, Optional[int]]] = []
+
+    found = set()
+    paragraphs = page_map.paragraph_indices()
+    for title, offset in ju.find_article_boundaries(page_map):
+        if title == "ARTICLES":
+            continue
+        found.add(title)
+        entries.append(("title", title, page_map.page_of(offset)))
+        for i in paragraphs[bisect_right(paragraphs, offset):]:
+            text = page_map.text(i).strip()
+            if text:
+                entries.append(("author", text, page_map.page_of(i)))
+                break
+    for title in ju.extract_article_titles_from_toc(doc):
+        if title not in found:
+            entries.append(("title", title, None))
+
+    for i in paragraphs:
+        text = page_map.text(i).strip()
+        if not text:
+            continue
+        page = page_map.page_of(i)
+        lower = text.lower()
+        if (
+            len(text) <= _HEADING_MAX
+            and ("editorial" in lower or lower == "president's message")
+            and not ju._TOC_ENTRY.search(text)
+        ):
+            entries.append(("editorial", text, page))
+        if page == MASTHEAD_PAGE:
+            entries.append(("masthead", text, page))
+    return entries
+
+
+def _match_expression(query: str) -> str:
+    """Turn free text into an FTS query: every word must occur, as a prefix."""
+    words = re.findall(r"\w+", query)
+    return " ".join(f'"{word}"*' for word in words)
+
+
+class Archive:
+    """An index of issue files stored in the SQLite database ``path``."""
+
+    def __init__(self, path=DEFAULT_DB):
+        self.path = str(path)
+        self.conn = sqlite3.connect(self.path)
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "Archive":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def index_file(self, path) -> bool:
+        """Index ``path`` unless it is unchanged; return whether it was read."""
+        path = Path(path).resolve()
+        st = os.stat(path)
+        key = str(path)
+        row = self.conn.execute(
+            "SELECT id, size, mtime_ns, sha256 FROM files WHERE path = ?", (key,)
+        ).fetchone()
+        if row is not None and (row[1], row[2]) == (st.st_size, st.st_mtime_ns):
+            return False
+        digest = _sha256(path)
+        with self.conn:
+            if row is not None and row[3] == digest:
+                self.conn.execute(
+                    "UPDATE files SET size = ?, mtime_ns = ? WHERE id = ?",
+                    (st.st_size, st.st_mtime_ns, row[0]),
+                )
+                return False
+            entries = issue_entries(_updater().load_document(path))
+            if row is not None:
+                self.conn.execute("DELETE FROM files WHERE id = ?", (row[0],))
+            file_id = self.conn.execute(
+                "INSERT INTO files (path, size, mtime_ns, sha256, indexed_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, st.st_size, st.st_mtime_ns, digest, time.time()),
+            ).lastrowid
+            self.conn.executemany(
+                "INSERT INTO entries (file_id, kind, text, page) VALUES (?, ?, ?, ?)",
+                [(file_id, kind, text, page) for kind, text, page in entries],
+            )
+        return True
+
+    def index(self, paths: Iterable) -> int:
+        """Index every file in ``paths``; return how many were (re)read.
+
+        Files that can't be read are logged and skipped.
+        """
+        count = 0
+        for path in paths:
+            try:
+                count += self.index_file(path)
+            except Exception as e:  # corrupt or unreadable issue
+                logging.warning("Skipping %s: %s", path, e)
+        return count
+
+    def index_folder(self, folder, recursive: bool = True, prune: bool = True) -> int:
+        """Index the ``.docx`` files in ``folder``.
+
+        With ``prune`` set, files indexed from ``folder`` earlier that are gone
+        now are dropped from the archive. Word's ``~$`` lock files are skipped.
+        """
+        folder = Path(folder).resolve()
+        pattern = "**/*.docx" if recursive else "*.docx"
+        paths = sorted(p for p in folder.glob(pattern) if not p.name.startswith("~$"))
+        count = self.index(paths)
+        if prune:
+            present = {str(p) for p in paths}
+            prefix = str(folder) + os.sep
+            with self.conn:
+                for file_id, path in self.conn.execute(
+                    "SELECT id, path FROM files WHERE substr(path, 1, ?) = ?",
+                    (len(prefix), prefix),
+                ).fetchall():
+                    if path not in present:
+                        self.conn.execute("DELETE FROM files WHERE id = ?", (file_id,))
+        return count
+
+    def search(self, query: str, kind: Optional[str] = None, limit: int = 50) -> List[Hit]:
+        """Return the entries matching every word of ``query``, best first.
+
+        Words match as prefixes, so ``"Smi"`` finds Smith. ``kind`` restricts
+        the result to one of :data:`KINDS`.
+        """
+        expression = _match_expression(query)
+        if not expression:
+            return []
+        sql = (
+            "SELECT files.path, entries.kind, entries.text, entries.page"
+            " FROM entries_fts"
+            " JOIN entries ON entries.id = entries_fts.rowid"
+            " JOIN files ON files.id = entries.file_id"
+            " WHERE entries_fts MATCH ?"
+        )
+        params: list = [expression]
+        if kind is not None:
+            sql += " AND entries.kind = ?"
+            params.append(kind)
+        sql += " ORDER BY bm25(entries_fts), files.path, entries.page LIMIT ?"
+        params.append(limit)
+        return [Hit(*row) for row in self.conn.execute(sql, params)]
+
+    def files(self) -> List[str]:
+        """Return the paths of the indexed issues."""
+        return [row[0] for row in self.conn.execute("SELECT path FROM files ORDER BY path")]
+
+
+def format_hits(hits: List[Hit]) -> str:
+    if not hits:
+        return "No matches."
+    lines = []
+    for hit in hits:
+        page = f"p. {hit.page}" if hit.page is not None else "p. ?"
+        lines.append(f"{Path(hit.path).name}  {page:>6}  {hit.kind:<9}  {hit.text}")
+    return "\n".join(lines)
+
+
+def archive_main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m journal_updater archive", description="Index and search past issues"
+    )
+    parser.add_argument("--db", default=DEFAULT_DB, help="SQLite database file")
+    commands = parser.add_subparsers(dest="command", required=True)
+    index = commands.add_parser("index", help="Add new or changed issues in a folder")
+    index.add_argument("folder")
+    index.add_argument("--no-recursive", action="store_false", dest="recursive")
+    search = commands.add_parser("search", help="Find titles, authors and editors")
+    search.add_argument("query")
+    search.add_argument("--kind", choices=KINDS)
+    search.add_argument("--limit", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    with Archive(args.db) as archive:
+        if args.command == "index":
+            started = time.perf_counter()
+            count = archive.index_folder(args.folder, recursive=args.recursive)
+            print(
+                f"Indexed {count} new or changed issue(s) of {len(archive.files())}"
+                f" in {time.perf_counter() - started:.1f}s"
+            )
+        else:
+            print(format_hits(archive.search(args.query, args.kind, args.limit)))
+    return 0
@@ -0,0 +1,49 @@
+"""Replace files in one step.
+
+Issues, checkpoints, caches and ``instructions.json`` are written to a
+temporary file in the target folder first and renamed over the target once
+complete, so a reader never sees a partial file and a failed write leaves
+the old one in place. ``tempfile.mkstemp`` creates its file readable by the
+owner only; before the rename it gets the mode of the file it replaces, or
+the mode a plain ``open`` would have given a new file. Issues kept in a
+shared folder stay readable for everyone who could read them before.
+"""
+
+import os
+import stat
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterator, Optional
+
+# read once at import; os.umask can only be queried by setting it, which is
+# not safe while other threads create files
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _new_file_mode(path: Path) -> int:
+    """Return the mode ``path`` should get: the existing one, else the umask default."""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+
+@contextmanager
+def atomic_write(path, mode: str = "wb", encoding: Optional[str] = None) -> Iterator[IO]:
+    """Open a temporary file that replaces ``path`` when the block succeeds.
+
+    On an exception the temporary file is removed and ``path`` is untouched.
+    """
+    path = Path(path)
+    fd, tmp = tempfile.mkstemp(prefix=f".{path.name}-", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, mode, encoding=encoding) as f:
+            yield f
+        os.chmod(tmp, _new_file_mode(path))
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
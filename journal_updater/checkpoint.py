@@ -0,0 +1,174 @@
+"""Snapshots taken between the stages of :func:`update_journal`.
+
+A failure late in an update (a formatting step, saving, the PDF export)
+used to mean starting again from loading the base document. After each
+expensive stage the document is now written to a checkpoint file next to
+the output. The checkpoint only holds the members that differ from the base
+document plus a manifest naming the stage, the list of members and a key
+over every input. ``--resume`` rebuilds the document from the base file and
+the checkpoint and continues with the next stage, provided the key still
+matches; otherwise the update starts over.
+
+The checkpoint is removed once the issue was saved.
+"""
+
+import hashlib
+import io
+import json
+import logging
+import os
+import weakref
+import zipfile
+from pathlib import Path
+from typing import Iterable, Optional, Tuple
+
+try:
+    from . import atomic
+except ImportError:  # run as a script
+    import atomic
+
+STAGES = ("clear", "import", "format", "cleanup")
+
+SUFFIX = ".checkpoint"
+_MANIFEST = "checkpoint.json"
+# bump when the stages or the manifest change
+_VERSION = 1
+
+# Members a resumed document took from its checkpoint rather than the base
+# file, keyed by package. They differ from the base even when unchanged since
+# the resume, so the next checkpoint has to store them again.
+_CARRIED: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def _updater():
+    try:
+        from . import journal_updater
+    except ImportError:  # run as a script
+        import journal_updater
+    return journal_updater
+
+
+def checkpoint_path(output_path) -> Path:
+    """Return where the checkpoint for ``output_path`` is kept."""
+    output_path = Path(output_path)
+    return output_path.with_name(output_path.name + SUFFIX)
+
+
+def input_key(paths: Iterable[Optional[Path]], settings: dict) -> str:
+    """Return a key over the content of ``paths`` and the ``settings``.
+
+    Missing files and ``None`` entries count as absent, so adding one later
+    changes the key as well.
+    """
+    sha = hashlib.sha256()
+    sha.update(json.dumps([_VERSION, settings], sort_keys=True, default=str).encode())
+    for path in paths:
+        sha.update(b"\0" + str(path).encode())
+        if path is None or not os.path.isfile(path):
+            sha.update(b"-")
+            continue
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                sha.update(chunk)
+    return sha.hexdigest()
+
+
+def save_checkpoint(doc, path: Path, stage: str, key: str, state: dict) -> int:
+    """Write the members of ``doc`` changed since it was loaded to ``path``.
+
+    ``state`` holds whatever later stages need besides the document. Members
+    a resumed document took from the previous checkpoint are stored again,
+    so every checkpoint only needs the base file. Returns how many members
+    were stored.
+    """
+    ju = _updater()
+    package = doc.part.package
+    carried = _CARRIED.get(package, frozenset())
+    for part in package.parts:
+        part.before_marshal()
+    source = ju._SOURCES.get(package)
+    src_zip = None
+    if source is not None:
+        try:
+            src_zip = source.open()
+        except OSError:
+            source = None
+
+    names = []
+    stored = 0
+    path = Path(path)
+    try:
+        with atomic.atomic_write(path) as fh, zipfile.ZipFile(
+            fh, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1
+        ) as dst:
+            for name, item in ju._package_members(package):
+                names.append(name)
+                info = None
+                if src_zip is not None:
+                    try:
+                        info = src_zip.getinfo(name)
+                    except KeyError:
+                        info = None
+                unchanged, data = ju._compare_member(source, src_zip, info, name, item)
+                if unchanged and name not in carried:
+                    continue
+                if not (unchanged and ju._try_copy_raw_member(src_zip, info, dst)):
+                    dst.writestr(name, data if data is not None else ju._member_blob(item))
+                stored += 1
+            manifest = {
+                "version": _VERSION,
+                "stage": stage,
+                "key": key,
+                "members": names,
+                "state": state,
+            }
+            dst.writestr(_MANIFEST, json.dumps(manifest))
+    finally:
+        if src_zip is not None:
+            src_zip.close()
+    return stored
+
+
+def load_checkpoint(path: Path, key: str, base_path: Path) -> Optional[Tuple[object, str, dict]]:
+    """Rebuild the document saved in the checkpoint ``path``.
+
+    Returns ``(document, stage, state)``, or ``None`` when there is no
+    checkpoint, it is unreadable or it was made for other inputs.
+    """
+    ju = _updater()
+    try:
+        snapshot = zipfile.ZipFile(path)
+    except (OSError, zipfile.BadZipFile):
+        return None
+    with snapshot:
+        try:
+            manifest = json.loads(snapshot.read(_MANIFEST))
+        except (KeyError, ValueError):
+            return None
+        if (
+            manifest.get("version") != _VERSION
+            or manifest.get("key") != key
+            or manifest.get("stage") not in STAGES
+        ):
+            return None
+        buffer = io.BytesIO()
+        try:
+            with zipfile.ZipFile(base_path) as base, zipfile.ZipFile(buffer, "w") as merged:
+                stored = set(snapshot.namelist())
+                for name in manifest["members"]:
+                    src = snapshot if name in stored else base
+                    if not ju._try_copy_raw_member(src, src.getinfo(name), merged):
+                        merged.writestr(name, src.read(name))
+        except (OSError, KeyError, zipfile.BadZipFile) as e:
+            logging.warning("Checkpoint %s is unusable: %s", path, e)
+            return None
+    doc = ju.load_document(buffer)
+    _CARRIED[doc.part.package] = frozenset(stored & set(manifest["members"]))
+    return doc, manifest["stage"], manifest["state"]
+
+
+def discard_checkpoint(path: Path) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
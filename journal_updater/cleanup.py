@@ -0,0 +1,134 @@
+"""Strip editing leftovers that bloat every XML part of a document.
+
+A base issue that went through many editing rounds carries revision save
+ids (``w:rsid*`` attributes) on nearly every element and a table of them in
+the settings, spell-check markers, Word's ``_GoBack`` bookmark, bookmarks
+missing their other half and often embedded fonts. None of it changes what
+is printed. :func:`strip_bloat` removes all of it with one walk over each
+XML part.
+
+Word's ``w:lastRenderedPageBreak`` markers are stale once a document is
+edited, but :func:`journal_updater.scan_pages` uses the ones in the body to
+find pages, so by default only those outside the body are dropped.
+"""
+
+from typing import Dict, List
+
+from docx.oxml.ns import qn
+from lxml import etree
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_RSID = _W + "rsid"
+_R_ID = qn("r:id")
+_W_ID = qn("w:id")
+_W_NAME = qn("w:name")
+_PROOF_ERR = qn("w:proofErr")
+_RENDERED_BREAK = qn("w:lastRenderedPageBreak")
+_BOOKMARK_START = qn("w:bookmarkStart")
+_BOOKMARK_END = qn("w:bookmarkEnd")
+_RSIDS = qn("w:rsids")
+_FONT_SETTINGS = frozenset(
+    qn(f"w:{tag}") for tag in ("embedTrueTypeFonts", "embedSystemFonts", "saveSubsetFonts")
+)
+_FONT_EMBEDS = frozenset(
+    qn(f"w:{tag}") for tag in ("embedRegular", "embedBold", "embedItalic", "embedBoldItalic")
+)
+
+# Word's "last edit position" bookmark
+GO_BACK = "_GoBack"
+
+
+def _is_xml(part) -> bool:
+    ct = part.content_type
+    return ct.endswith("+xml") or ct.endswith("/xml")
+
+
+def _strip_root(root, rendered_breaks: bool, fonts: bool, stats: Dict[str, int]) -> List[str]:
+    """Clean the tree ``root`` in place; return the rIds of dropped font embeds."""
+    drop = []
+    starts: Dict[str, object] = {}
+    ends: Dict[str, object] = {}
+    font_rids = []
+    for el in root.iter():
+        tag = el.tag
+        if not isinstance(tag, str):
+            continue
+        rsids = [k for k in el.attrib if k.startswith(_RSID)]
+        for key in rsids:
+            del el.attrib[key]
+        stats["attributes"] += len(rsids)
+        if tag == _PROOF_ERR or tag == _RSIDS:
+            drop.append(el)
+        elif tag == _RENDERED_BREAK:
+            if rendered_breaks:
+                drop.append(el)
+        elif tag == _BOOKMARK_START:
+            starts[el.get(_W_ID)] = el
+        elif tag == _BOOKMARK_END:
+            ends[el.get(_W_ID)] = el
+        elif fonts and tag in _FONT_SETTINGS:
+            drop.append(el)
+        elif fonts and tag in _FONT_EMBEDS:
+            font_rids.append(el.get(_R_ID))
+            drop.append(el)
+
+    for mark_id, start in starts.items():
+        end = ends.get(mark_id)
+        if end is None or start.get(_W_NAME) == GO_BACK:
+            stats["bookmarks"] += 1
+            drop.append(start)
+            if end is not None:
+                drop.append(end)
+    for mark_id, end in ends.items():
+        if mark_id not in starts:
+            stats["bookmarks"] += 1
+            drop.append(end)
+
+    for el in drop:
+        parent = el.getparent()
+        if parent is not None:
+            parent.remove(el)
+            stats["elements"] += 1
+    return font_rids
+
+
+def strip_bloat(
+    doc, rendered_breaks: bool = False, fonts: bool = True, measure: bool = False
+) -> Dict[str, int]:
+    """Remove editing leftovers from every XML part of ``doc``.
+
+    Drops ``w:rsid*`` attributes, the ``w:rsids`` table, ``w:proofErr``,
+    the ``_GoBack`` bookmark and unpaired bookmark starts and ends. With
+    ``fonts`` set embedded fonts are removed together with the settings
+    asking Word to embed them. ``w:lastRenderedPageBreak`` is dropped outside
+    the body, and in the body too with ``rendered_breaks``.
+
+    Returns how many attributes, elements, bookmarks and fonts went; with
+    ``measure`` set also the total size of the XML parts before and after.
+    """
+    stats = {"parts": 0, "attributes": 0, "elements": 0, "bookmarks": 0, "fonts": 0}
+    if measure:
+        stats["bytes_before"] = stats["bytes_after"] = 0
+    for part in list(doc.part.package.iter_parts()):
+        if not _is_xml(part):
+            continue
+        element = getattr(part, "_element", None)
+        root = element if element is not None else etree.fromstring(part.blob)
+        if measure:
+            stats["bytes_before"] += len(part.blob)
+        before = stats["attributes"] + stats["elements"]
+        font_rids = _strip_root(root, rendered_breaks or part is not doc.part, fonts, stats)
+        for rid in font_rids:
+            if rid in part.rels:
+                del part.rels[rid]
+                stats["fonts"] += 1
+        changed = stats["attributes"] + stats["elements"] != before
+        if changed:
+            stats["parts"] += 1
+            if element is None:
+                part._blob = etree.tostring(
+                    root, xml_declaration=True, encoding="UTF-8", standalone=True
+                )
+        if measure:
+            stats["bytes_after"] += len(part.blob)
+    return stats
@@ -0,0 +1,61 @@
+"""Command line parsing for the updater.
+
+Nothing here imports python-docx or lxml, so ``--help`` and argument errors
+return without loading them; :func:`main` imports the updater only once the
+arguments are valid.
+"""
+
+import argparse
+from typing import List, Optional
+
+
+def add_update_arguments(
+    parser: argparse.ArgumentParser, plan: bool = True, resume: bool = True
+) -> None:
+    """Add the arguments describing one update run to ``parser``.
+
+    ``plan`` and ``resume`` add ``--plan`` and ``--resume``, which only make
+    sense for runs in this process.
+    """
+    parser.add_argument("base_doc")
+    parser.add_argument("content_folder")
+    parser.add_argument("output_doc")
+    parser.add_argument("--volume", required=True)
+    parser.add_argument("--issue", required=True)
+    parser.add_argument("--month-year", required=True, dest="month_year")
+    parser.add_argument("--cover-page", type=int, default=1, dest="cover_page")
+    parser.add_argument(
+        "--start-page", type=int, default=None, dest="start_page",
+        help="Page number where new articles begin"
+    )
+    parser.add_argument(
+        "--draft", action="store_true",
+        help="Fast preview: skip PDF export and footer tables, mark pages DRAFT"
+    )
+    parser.add_argument(
+        "--recursive", action="store_true",
+        help="Also look for articles in subfolders of the content folder"
+    )
+    if resume:
+        parser.add_argument(
+            "--resume", action="store_true",
+            help="Continue after the last stage a failed run over the same inputs saved"
+        )
+    if plan:
+        parser.add_argument(
+            "--plan", action="store_true",
+            help="Only print what would be deleted, imported and formatted"
+        )
+
+
+def build_parser(prog: Optional[str] = None) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog=prog, description="Update ABNFF Journal document")
+    add_update_arguments(parser)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None, prog: Optional[str] = None):
+    args = build_parser(prog).parse_args(argv)
+    from . import journal_updater
+
+    return journal_updater.run_from_args(args)
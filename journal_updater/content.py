@@ -0,0 +1,164 @@
+"""Single-pass scanner for the content folder of an issue.
+
+:func:`scan_content` lists each directory once with ``os.scandir`` and
+classifies every file (articles, the President's message and photo, other
+images, ``instructions.json``). Directory listings are kept in a manifest
+together with the size and modification time of each file; a directory
+whose own modification time has not changed is taken from the manifest
+without listing or statting its files again. Adding, removing or renaming a
+file updates the directory time. A file rewritten in place keeps its old
+entry until ``refresh=True`` is passed.
+"""
+
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+ARTICLE_PREFIX = "article"
+MESSAGE_NAME = "president_message.txt"
+PRESIDENT_IMAGE = "president.jpg"
+INSTRUCTIONS_NAME = "instructions.json"
+IMAGE_SUFFIXES = frozenset({".jpg", ".jpeg", ".png", ".gif", ".bmp", ".tif", ".tiff"})
+
+
+class ContentFile:
+    """A classified file of the content folder."""
+
+    __slots__ = ("path", "kind", "size", "mtime_ns")
+
+    def __init__(self, path: Path, kind: str, size: int, mtime_ns: int):
+        self.path = path
+        self.kind = kind
+        self.size = size
+        self.mtime_ns = mtime_ns
+
+    def __repr__(self) -> str:
+        return f"ContentFile({str(self.path)!r}, {self.kind!r})"
+
+
+class _DirRecord:
+    __slots__ = ("mtime_ns", "files", "subdirs")
+
+    def __init__(self, mtime_ns: int, files: List[ContentFile], subdirs: List[str]):
+        self.mtime_ns = mtime_ns
+        self.files = files
+        self.subdirs = subdirs
+
+
+# (directory, is the content root) -> listing, shared by all scans
+_MANIFEST: Dict[Tuple[str, bool], _DirRecord] = {}
+
+
+def classify(name: str, top_level: bool = True) -> str:
+    """Return the kind of the file called ``name``.
+
+    The message, the President's photo and the instructions are only
+    recognised at the top of the content folder.
+    """
+    lower = name.lower()
+    suffix = os.path.splitext(lower)[1]
+    if top_level:
+        if lower == MESSAGE_NAME:
+            return "message"
+        if lower == INSTRUCTIONS_NAME:
+            return "instructions"
+        if lower == PRESIDENT_IMAGE:
+            return "president_image"
+    if lower.startswith(ARTICLE_PREFIX) and suffix == ".docx":
+        return "article"
+    if suffix in IMAGE_SUFFIXES:
+        return "image"
+    return "other"
+
+
+class ContentFolder:
+    """Result of :func:`scan_content`."""
+
+    __slots__ = ("root", "files")
+
+    def __init__(self, root: Path, files: List[ContentFile]):
+        self.root = root
+        self.files = files
+
+    def of_kind(self, kind: str) -> List[ContentFile]:
+        return [f for f in self.files if f.kind == kind]
+
+    def _single(self, kind: str) -> Optional[Path]:
+        found = self.of_kind(kind)
+        return found[0].path if found else None
+
+    @property
+    def articles(self) -> List[Path]:
+        return sorted(f.path for f in self.files if f.kind == "article")
+
+    @property
+    def images(self) -> List[Path]:
+        return sorted(f.path for f in self.files if f.kind == "image")
+
+    @property
+    def message(self) -> Optional[Path]:
+        return self._single("message")
+
+    @property
+    def president_image(self) -> Optional[Path]:
+        return self._single("president_image")
+
+    @property
+    def instructions(self) -> Optional[Path]:
+        return self._single("instructions")
+
+
+def _list_dir(directory: Path, top_level: bool, mtime_ns: int) -> _DirRecord:
+    files: List[ContentFile] = []
+    subdirs: List[str] = []
+    with os.scandir(directory) as it:
+        for entry in it:
+            name = entry.name
+            # hidden files and Word's ~$ lock files
+            if name.startswith((".", "~$")):
+                continue
+            if entry.is_dir():
+                subdirs.append(name)
+            elif entry.is_file():
+                st = entry.stat()
+                files.append(
+                    ContentFile(
+                        directory / name, classify(name, top_level), st.st_size, st.st_mtime_ns
+                    )
+                )
+    subdirs.sort()
+    return _DirRecord(mtime_ns, files, subdirs)
+
+
+def scan_content(
+    content_path: Path,
+    recursive: bool = False,
+    refresh: bool = False,
+    manifest: Optional[dict] = None,
+) -> ContentFolder:
+    """Classify every file in ``content_path``.
+
+    With ``recursive`` set, subfolders (for example one per submission) are
+    scanned too. ``manifest`` defaults to one shared by the whole process;
+    ``refresh`` lists every directory again. A folder that does not exist
+    counts as empty.
+    """
+    manifest = _MANIFEST if manifest is None else manifest
+    root = Path(content_path)
+    files: List[ContentFile] = []
+    stack = [(root, True)]
+    while stack:
+        directory, top_level = stack.pop()
+        key = (os.path.abspath(directory), top_level)
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except FileNotFoundError:
+            continue
+        record = manifest.get(key)
+        if refresh or record is None or record.mtime_ns != mtime_ns:
+            record = _list_dir(directory, top_level, mtime_ns)
+            manifest[key] = record
+        files.extend(record.files)
+        if recursive:
+            stack.extend((directory / name, False) for name in reversed(record.subdirs))
+    return ContentFolder(root, files)
@@ -0,0 +1,253 @@
+"""Structural diff between two journal issues.
+
+Every top-level block (paragraph, table, content control) of both documents
+is hashed from its text and normalized properties, and the two hash
+sequences are aligned with an anchored (patience style) diff: blocks that
+occur exactly once on both sides anchor the alignment, the longest
+increasing run of anchors is kept and the gaps between anchors are solved
+the same way. The result lists inserted, removed and changed blocks together
+with the page each block is on.
+
+Run it from the command line with::
+
+    python -m journal_updater.diff OLD_DOCX NEW_DOCX [--json]
+"""
+
+import argparse
+import hashlib
+import json
+from bisect import bisect_left
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from . import journal_updater
+
+_RSID_RE = journal_updater._RSID_RE
+
+
+class Block:
+    """Fingerprint of one top-level body element."""
+
+    __slots__ = ("kind", "key", "text_key", "text", "page")
+
+    def __init__(self, kind: bytes, key: bytes, text_key: bytes, text: str, page: int):
+        self.kind = kind
+        self.key = key
+        self.text_key = text_key
+        self.text = text
+        self.page = page
+
+
+def _props(el) -> bytes:
+    """Return the paragraph and run properties of ``el`` without rsids."""
+    from docx.oxml.ns import qn
+    from lxml import etree
+
+    chunks = []
+    for pPr in el.iter(qn("w:pPr")):
+        chunks.append(etree.tostring(pPr))
+    chunks.extend(sorted({etree.tostring(rPr) for rPr in el.iter(qn("w:rPr"))}))
+    return _RSID_RE.sub(b"", b"".join(chunks))
+
+
+def _block_text(el) -> str:
+    from docx.oxml.ns import qn
+
+    tag_t, tag_tc = qn("w:t"), qn("w:tc")
+    parts = []
+    for node in el.iter(tag_t, tag_tc):
+        if node.tag == tag_tc:
+            if parts:
+                parts.append(" | ")
+        elif node.text:
+            parts.append(node.text)
+    return "".join(parts)
+
+
+def fingerprint(doc) -> List[Block]:
+    """Return a :class:`Block` for every top-level element of ``doc``."""
+    page_map = journal_updater.scan_pages(doc)
+    blocks = []
+    for i, el in enumerate(page_map.elements):
+        text = _block_text(el)
+        tag = el.tag.rsplit("}", 1)[-1].encode()
+        text_key = hashlib.blake2b(tag + b"\0" + text.encode("utf-8"), digest_size=16).digest()
+        key = hashlib.blake2b(text_key + _props(el), digest_size=16).digest()
+        blocks.append(Block(tag, key, text_key, text, page_map.page_of(i)))
+    return blocks
+
+
+def _longest_increasing(pairs: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Return the longest subsequence of ``pairs`` increasing in both items.
+
+    ``pairs`` must be sorted by the first item; runs in ``O(n log n)``.
+    """
+    tails: List[int] = []
+    tail_idx: List[int] = []
+    prev = [-1] * len(pairs)
+    for n, (_, j) in enumerate(pairs):
+        k = bisect_left(tails, j)
+        if k == len(tails):
+            tails.append(j)
+            tail_idx.append(n)
+        else:
+            tails[k] = j
+            tail_idx[k] = n
+        prev[n] = tail_idx[k - 1] if k else -1
+    result = []
+    n = tail_idx[-1] if tail_idx else -1
+    while n != -1:
+        result.append(pairs[n])
+        n = prev[n]
+    result.reverse()
+    return result
+
+
+def _match(a: List[bytes], b: List[bytes]) -> List[Tuple[int, int]]:
+    """Return the matched ``(i, j)`` index pairs of an anchored diff."""
+    matches: List[Tuple[int, int]] = []
+    stack = [(0, len(a), 0, len(b))]
+    while stack:
+        a0, a1, b0, b1 = stack.pop()
+        # common prefix and suffix
+        while a0 < a1 and b0 < b1 and a[a0] == b[b0]:
+            matches.append((a0, b0))
+            a0 += 1
+            b0 += 1
+        while a0 < a1 and b0 < b1 and a[a1 - 1] == b[b1 - 1]:
+            a1 -= 1
+            b1 -= 1
+            matches.append((a1, b1))
+        if a0 >= a1 or b0 >= b1:
+            continue
+
+        counts: Dict[bytes, List[int]] = {}
+        for i in range(a0, a1):
+            counts.setdefault(a[i], [0, 0, i, -1])[0] += 1
+        for j in range(b0, b1):
+            entry = counts.get(b[j])
+            if entry is not None:
+                entry[1] += 1
+                entry[3] = j
+        anchors = sorted(
+            (e[2], e[3]) for e in counts.values() if e[0] == 1 and e[1] == 1
+        )
+        anchors = _longest_increasing(anchors)
+        if not anchors:
+            continue
+        matches.extend(anchors)
+        bounds = [(a0 - 1, b0 - 1)] + anchors + [(a1, b1)]
+        for (i0, j0), (i1, j1) in zip(bounds, bounds[1:]):
+            if i1 - i0 > 1 and j1 - j0 > 1:
+                stack.append((i0 + 1, i1, j0 + 1, j1))
+    matches.sort()
+    return matches
+
+
+def diff_documents(old_doc, new_doc) -> List[dict]:
+    """Return the inserted, removed and changed blocks between two documents.
+
+    Each entry holds ``op`` (``"inserted"``, ``"removed"`` or ``"changed"``),
+    the block offsets ``old_index``/``new_index`` (``None`` when absent),
+    ``old_page``/``new_page`` and a ``text`` preview. Removed blocks report
+    the new page they would have appeared on. A changed block either kept
+    its text and changed formatting, or was edited in place (the gap between
+    two matched blocks has the same length on both sides and the blocks are
+    of the same kind).
+    """
+    old_blocks = fingerprint(old_doc)
+    new_blocks = fingerprint(new_doc)
+    matches = _match([b.key for b in old_blocks], [b.key for b in new_blocks])
+    last_page = new_blocks[-1].page if new_blocks else 1
+
+    def new_page_at(j: int) -> int:
+        return new_blocks[j].page if j < len(new_blocks) else last_page
+
+    changes: List[dict] = []
+
+    def emit(op: str, i: Optional[int], j: Optional[int], at: int) -> None:
+        old = old_blocks[i] if i is not None else None
+        new = new_blocks[j] if j is not None else None
+        changes.append(
+            {
+                "op": op,
+                "old_index": i,
+                "new_index": j,
+                "old_page": old.page if old else None,
+                "new_page": new.page if new else new_page_at(at),
+                "text": (new or old).text[:80],
+            }
+        )
+
+    prev_i, prev_j = -1, -1
+    for next_i, next_j in matches + [(len(old_blocks), len(new_blocks))]:
+        gap_a = list(range(prev_i + 1, next_i))
+        gap_b = list(range(prev_j + 1, next_j))
+        if len(gap_a) == len(gap_b):
+            for i, j in zip(gap_a, gap_b):
+                if old_blocks[i].kind == new_blocks[j].kind:
+                    emit("changed", i, j, next_j)
+                else:
+                    emit("removed", i, None, next_j)
+                    emit("inserted", None, j, next_j)
+        else:
+            by_text: Dict[bytes, List[int]] = {}
+            for i in gap_a:
+                by_text.setdefault(old_blocks[i].text_key, []).append(i)
+            paired = {}
+            for j in gap_b:
+                candidates = by_text.get(new_blocks[j].text_key)
+                if candidates:
+                    paired[candidates.pop(0)] = j
+            used = set(paired.values())
+            for i in gap_a:
+                if i in paired:
+                    emit("changed", i, paired[i], next_j)
+                else:
+                    emit("removed", i, None, next_j)
+            for j in gap_b:
+                if j not in used:
+                    emit("inserted", None, j, next_j)
+        prev_i, prev_j = next_i, next_j
+    return changes
+
+
+def diff_files(old_path: Path, new_path: Path) -> List[dict]:
+    """Load both issues with :func:`load_document` and diff them."""
+    return diff_documents(
+        journal_updater.load_document(old_path), journal_updater.load_document(new_path)
+    )
+
+
+def format_diff(changes: List[dict]) -> str:
+    """Return ``changes`` grouped by page as readable text."""
+    if not changes:
+        return "No differences"
+    by_page: Dict[int, List[dict]] = {}
+    for change in changes:
+        by_page.setdefault(change["new_page"], []).append(change)
+    marks = {"inserted": "+", "removed": "-", "changed": "~"}
+    lines = []
+    for page in sorted(by_page):
+        lines.append(f"Page {page}:")
+        for c in by_page[page]:
+            lines.append(f"  {marks[c['op']]} {c['text']}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Compare two journal issues")
+    parser.add_argument("old_doc")
+    parser.add_argument("new_doc")
+    parser.add_argument("--json", action="store_true", help="Print JSON instead of text")
+    args = parser.parse_args(argv)
+
+    changes = diff_files(Path(args.old_doc), Path(args.new_doc))
+    if args.json:
+        print(json.dumps(changes, indent=2))
+    else:
+        print(format_diff(changes))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+"""Pages and sections lifted from earlier issues, cached on disk.
+
+Recurring material such as the "Information for Authors" pages or the
+membership application is copied from a previous issue every time. A
+:class:`StoredFragment` holds the body blocks of such a piece together with
+everything their relationships point at (pictures and other parts by
+content, hyperlinks by URL), so it can be inserted into any document.
+
+:class:`FragmentStore` keeps fragments on disk keyed by the SHA-256 of the
+source issue and the fragment name, plus an in-memory copy for the current
+process. Once a fragment was extracted, later issues insert it by cloning
+the cached XML without opening the source issue again.
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import os
+from io import BytesIO
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from docx.oxml.ns import qn
+from docx.oxml.parser import parse_xml
+from lxml import etree
+
+try:
+    from . import atomic
+except ImportError:  # run as a script
+    import atomic
+
+_R = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_W_P = qn("w:p")
+_W_SECTPR = qn("w:sectPr")
+_RT_IMAGE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/image"
+
+# default store folder, created next to the source issue
+DEFAULT_DIRNAME = ".fragments"
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with atomic.atomic_write(path) as f:
+        f.write(data)
+
+
+class StoredFragment:
+    """Body blocks plus the targets of the relationships they use.
+
+    ``rels`` maps each relationship id used in ``blocks`` to a description:
+    ``reltype``, and either ``target`` (external URL) or ``content_type``,
+    ``ext`` and ``sha256`` of the part, whose bytes are in ``media``.
+    """
+
+    __slots__ = ("blocks", "rels", "media")
+
+    def __init__(self, blocks: list, rels: Dict[str, dict], media: Dict[str, bytes]):
+        self.blocks = blocks
+        self.rels = rels
+        self.media = media
+
+    @classmethod
+    def extract(cls, part, blocks: list) -> "StoredFragment":
+        """Copy ``blocks`` of the story ``part`` with what they refer to.
+
+        Section breaks are left out; the fragment starts on a page of its own
+        when inserted instead.
+        """
+        copies = []
+        rels: Dict[str, dict] = {}
+        media: Dict[str, bytes] = {}
+        for block in blocks:
+            if block.tag == _W_SECTPR:
+                continue
+            block = copy.deepcopy(block)
+            for sect in block.iter(_W_SECTPR):
+                sect.getparent().remove(sect)
+            for node in block.iter():
+                for name, rid in node.attrib.items():
+                    if not name.startswith(_R) or rid in rels or rid not in part.rels:
+                        continue
+                    rel = part.rels[rid]
+                    if rel.is_external:
+                        rels[rid] = {"reltype": rel.reltype, "target": rel.target_ref}
+                        continue
+                    target = rel.target_part
+                    blob = target.blob
+                    digest = hashlib.sha256(blob).hexdigest()
+                    media[digest] = blob
+                    rels[rid] = {
+                        "reltype": rel.reltype,
+                        "content_type": target.content_type,
+                        "ext": target.partname.ext,
+                        "sha256": digest,
+                    }
+            copies.append(block)
+        return cls(copies, rels, media)
+
+    def _relate(self, doc, info: dict) -> str:
+        if "target" in info:
+            return doc.part.relate_to(info["target"], info["reltype"], is_external=True)
+        blob = self.media[info["sha256"]]
+        if info["reltype"] == _RT_IMAGE:
+            from docx.image.exceptions import UnrecognizedImageError
+
+            try:
+                rid, _ = doc.part.get_or_add_image(BytesIO(blob))
+                return rid
+            except UnrecognizedImageError:
+                pass
+        from docx.opc.part import Part
+        from docx.parts.image import ImagePart
+
+        package = doc.part.package
+        if info["reltype"] == _RT_IMAGE:
+            partname = package.next_partname(f"/word/media/image%d.{info['ext']}")
+            target = ImagePart(partname, info["content_type"], blob)
+        else:
+            partname = package.next_partname(f"/word/embeddings/fragment%d.{info['ext']}")
+            target = Part(partname, info["content_type"], blob, package)
+        return doc.part.relate_to(target, info["reltype"])
+
+    def insert(self, doc, new_page: bool = True) -> list:
+        """Append a clone of the fragment to the body of ``doc``.
+
+        The blocks go before the body's final ``w:sectPr``; with ``new_page``
+        the first paragraph starts a new page. Returns the inserted blocks.
+        """
+        rids = {rid: self._relate(doc, info) for rid, info in self.rels.items()}
+        body = doc.element.body
+        tail = body.find(_W_SECTPR)
+        inserted = []
+        for block in self.blocks:
+            block = copy.deepcopy(block)
+            for node in block.iter():
+                for name, rid in node.attrib.items():
+                    if name.startswith(_R) and rid in rids:
+                        node.set(name, rids[rid])
+            if tail is not None:
+                tail.addprevious(block)
+            else:
+                body.append(block)
+            inserted.append(block)
+        if new_page and inserted and inserted[0].tag == _W_P:
+            inserted[0].get_or_add_pPr().get_or_add_pageBreakBefore()
+        return inserted
+
+    def to_json(self) -> bytes:
+        xml = [etree.tostring(block, encoding="unicode") for block in self.blocks]
+        return json.dumps({"blocks": xml, "rels": self.rels}).encode("utf-8")
+
+
+class FragmentStore:
+    """Fragments by source hash and name, in memory and under ``directory``.
+
+    Without a directory only the in-memory cache is used.
+    """
+
+    def __init__(self, directory: Optional[Path] = None):
+        self.directory = Path(directory) if directory is not None else None
+        self._memory: Dict[Tuple[str, str], StoredFragment] = {}
+        self._hashes: Dict[Tuple[str, int, int], str] = {}
+
+    @classmethod
+    def next_to(cls, source: Path) -> "FragmentStore":
+        """Return the store in a hidden folder beside the ``source`` issue.
+
+        One store is kept per folder for the life of the process, so its
+        memory cache and source hashes are shared by all callers.
+        """
+        directory = Path(source).resolve().parent / DEFAULT_DIRNAME
+        store = _STORES.get(directory)
+        if store is None:
+            store = _STORES[directory] = cls(directory)
+        return store
+
+    def source_hash(self, source: Path) -> str:
+        """Return the SHA-256 of ``source``; remembered while it is unchanged."""
+        st = os.stat(source)
+        stamp = (os.path.abspath(source), st.st_size, st.st_mtime_ns)
+        digest = self._hashes.get(stamp)
+        if digest is None:
+            sha = hashlib.sha256()
+            with open(source, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    sha.update(chunk)
+            digest = self._hashes[stamp] = sha.hexdigest()
+        return digest
+
+    def _paths(self, key: str, name: str) -> Tuple[Path, Path]:
+        return self.directory / key / f"{name}.json", self.directory / "media"
+
+    def get(self, source: Path, name: str) -> Optional[StoredFragment]:
+        """Return the fragment ``name`` of ``source`` if it was stored."""
+        key = self.source_hash(source)
+        fragment = self._memory.get((key, name))
+        if fragment is not None or self.directory is None:
+            return fragment
+        path, media_dir = self._paths(key, name)
+        try:
+            data = json.loads(path.read_bytes())
+            media = {
+                info["sha256"]: (media_dir / info["sha256"]).read_bytes()
+                for info in data["rels"].values()
+                if "sha256" in info
+            }
+        except (OSError, ValueError, KeyError):
+            return None
+        blocks = [parse_xml(xml) for xml in data["blocks"]]
+        fragment = self._memory[(key, name)] = StoredFragment(blocks, data["rels"], media)
+        return fragment
+
+    def put(self, source: Path, name: str, fragment: StoredFragment) -> None:
+        """Remember ``fragment`` as ``name`` of ``source``.
+
+        A folder that can't be written to only costs the disk copy.
+        """
+        key = self.source_hash(source)
+        self._memory[(key, name)] = fragment
+        if self.directory is None:
+            return
+        path, media_dir = self._paths(key, name)
+        try:
+            for digest, blob in fragment.media.items():
+                if not (media_dir / digest).exists():
+                    _write_atomic(media_dir / digest, blob)
+            _write_atomic(path, fragment.to_json())
+        except OSError as e:
+            logging.warning("Could not store fragment %s: %s", name, e)
+
+    def names(self, source: Path) -> List[str]:
+        """Return the names of the fragments stored on disk for ``source``."""
+        if self.directory is None:
+            return []
+        folder = self.directory / self.source_hash(source)
+        return sorted(p.stem for p in folder.glob("*.json"))
+
+
+# stores handed out by FragmentStore.next_to, by folder
+_STORES: Dict[Path, FragmentStore] = {}
@@ -0,0 +1,125 @@
+"""Precompiled XML fragments for the blocks :mod:`journal_updater` generates.
+
+Each template is parsed once when the module is imported. ``{name}``
+placeholders standing for a whole attribute value or text node are located
+at that point, so :meth:`Fragment.build` only deep-copies the template and
+fills the recorded nodes in. The copies are python-docx element classes and
+can be inserted into a document directly.
+"""
+
+from copy import deepcopy
+from typing import Dict, List, Optional, Tuple
+
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, nsmap
+
+VML = "urn:schemas-microsoft-com:vml"
+_VML_DECL = f'xmlns:v="{VML}"'
+
+# registered once so callers can keep using ``qn("v:shape")``
+nsmap.setdefault("v", VML)
+
+# (child index path from the root, attribute name or ``None`` for text)
+_Slot = Tuple[Tuple[int, ...], Optional[str]]
+
+
+class Fragment:
+    """An XML template with ``{name}`` placeholders."""
+
+    __slots__ = ("template", "slots")
+
+    def __init__(self, xml: str):
+        self.template = parse_xml(xml)
+        self.slots: Dict[str, List[_Slot]] = {}
+        self._collect(self.template, ())
+
+    def _collect(self, el, path: Tuple[int, ...]) -> None:
+        for attr, value in el.attrib.items():
+            name = _placeholder(value)
+            if name:
+                self.slots.setdefault(name, []).append((path, attr))
+        # only leaves: python-docx elements such as w:p derive ``text``
+        name = _placeholder(el.text) if len(el) == 0 else None
+        if name:
+            self.slots.setdefault(name, []).append((path, None))
+        for i, child in enumerate(el):
+            self._collect(child, path + (i,))
+
+    def build(self, **values: str):
+        """Return a copy of the template with the placeholders filled in.
+
+        Every placeholder must be given; unknown names raise ``KeyError``.
+        """
+        el = deepcopy(self.template)
+        missing = self.slots.keys() - values.keys()
+        if missing:
+            raise KeyError(f"missing fragment values: {', '.join(sorted(missing))}")
+        for name, value in values.items():
+            for path, attr in self.slots[name]:
+                node = el
+                for i in path:
+                    node = node[i]
+                if attr is None:
+                    node.text = value
+                else:
+                    node.set(attr, value)
+        return el
+
+
+def _placeholder(value: Optional[str]) -> Optional[str]:
+    if value and len(value) > 2 and value[0] == "{" and value[-1] == "}":
+        return value[1:-1]
+    return None
+
+
+SHAPE = Fragment(
+    f"<w:pict {nsdecls('w')} {_VML_DECL}>"
+    '<v:shape type="#_x0000_t75" style="{style}" strokecolor="{stroke}"'
+    ' fillcolor="{fill}"/>'
+    "</w:pict>"
+)
+
+CENTER_RULE = Fragment(
+    f"<w:pict {nsdecls('w')} {_VML_DECL}>"
+    '<w:shape w:id="{id}"'
+    ' w:style="position:absolute;left:50%;top:0;width:0;height:100%"/>'
+    '<v:shape id="{vml_id}"'
+    ' style="position:absolute;left:50%;top:0;width:0;height:100%"/>'
+    "</w:pict>"
+)
+
+_FOOTER_RPR = '<w:rPr><w:color w:val="{color}"/><w:sz w:val="20"/></w:rPr>'
+_BLACK = _FOOTER_RPR.replace("{color}", "000000")
+_WHITE = _FOOTER_RPR.replace("{color}", "FFFFFF")
+
+FOOTER_TABLE = Fragment(
+    f"<w:tbl {nsdecls('w')}>"
+    "<w:tblPr>"
+    '<w:tblW w:type="auto" w:w="0"/>'
+    '<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0"'
+    ' w:noHBand="0" w:noVBand="1" w:val="04A0"/>'
+    "<w:tblBorders>"
+    '<w:top w:val="nil"/><w:left w:val="nil"/><w:bottom w:val="nil"/>'
+    '<w:right w:val="nil"/><w:insideH w:val="nil"/><w:insideV w:val="nil"/>'
+    "</w:tblBorders>"
+    "</w:tblPr>"
+    '<w:tblGrid><w:gridCol w:w="{col}"/><w:gridCol w:w="{col}"/>'
+    '<w:gridCol w:w="{col}"/></w:tblGrid>'
+    "<w:tr>"
+    '<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{col}"/></w:tcPr>'
+    f'<w:p><w:pPr><w:jc w:val="left"/></w:pPr>'
+    f'<w:r>{_BLACK}<w:t xml:space="preserve">{{left}}</w:t></w:r></w:p></w:tc>'
+    '<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{col}"/><w:shd w:fill="000000"/></w:tcPr>'
+    '<w:p><w:pPr><w:jc w:val="center"/></w:pPr>'
+    f'<w:r>{_WHITE}<w:fldChar w:fldCharType="begin"/>'
+    '<w:instrText xml:space="preserve">PAGE</w:instrText>'
+    '<w:fldChar w:fldCharType="separate"/></w:r>'
+    f"<w:r>{_WHITE}<w:t>1</w:t></w:r>"
+    f'<w:r>{_WHITE}<w:fldChar w:fldCharType="end"/></w:r>'
+    "</w:p></w:tc>"
+    '<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{col}"/></w:tcPr>'
+    f'<w:p><w:pPr><w:jc w:val="right"/></w:pPr>'
+    f'<w:r>{_BLACK}<w:t xml:space="preserve">{{right}}</w:t></w:r></w:p></w:tc>'
+    "</w:tr>"
+    "</w:tbl>"
+)
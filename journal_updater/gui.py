@@ -1,11 +1,28 @@
+import importlib.util
+import threading
 import tkinter as tk
 from tkinter import filedialog, messagebox
 from tkinter import ttk
 from pathlib import Path
-from . import journal_updater
 
+# python-docx and lxml are loaded on a background thread once the window is
+# up; ``_load_updater`` waits for that import when an update is started.
+_loaded: dict = {}
+_loader_lock = threading.Lock()
 
-def run_gui():
+
+def _load_updater():
+    with _loader_lock:
+        if "module" not in _loaded:
+            from . import journal_updater
+
+            _loaded["module"] = journal_updater
+            _loaded["pdf"] = importlib.util.find_spec("docx2pdf") is not None
+    return _loaded["module"]
+
+
+def build_window() -> tk.Tk:
+    """Create the main window without importing the document libraries."""
     root = tk.Tk()
     root.title("ABNFF Journal Updater")
     root.columnconfigure(0, weight=1)
@@ -25,6 +42,9 @@ def run_gui():
     font_size = tk.StringVar()
     line_spacing = tk.StringVar()
     font_family = tk.StringVar()
+    draft = tk.BooleanVar(value=False)
+    save_settings = tk.BooleanVar(value=False)
+    status = tk.StringVar(value="Loading document libraries...")
 
     def choose_base():
         path = filedialog.askopenfilename(
@@ -76,7 +96,7 @@ def run_gui():
             fs = int(font_size.get()) if font_size.get() else None
             ls = float(line_spacing.get()) if line_spacing.get() else None
             ff = font_family.get() or None
-            journal_updater.main_from_gui(
+            _load_updater().main_from_gui(
                 Path(selected_base.get()),
                 Path(selected_content.get()),
                 Path(selected_output.get()),
@@ -89,6 +109,8 @@ def run_gui():
                 font_size=fs,
                 line_spacing=ls,
                 font_family=ff,
+                draft=draft.get(),
+                save_instructions=save_settings.get(),
             )
             messagebox.showinfo("Success", "Journal updated successfully")
         except Exception as e:
@@ -151,12 +173,50 @@ def run_gui():
     ttk.Label(frm, text="Font Family:").grid(row=row, column=0, sticky="e")
     ttk.Entry(frm, textvariable=font_family).grid(row=row, column=1, sticky="ew")
     row += 1
+    ttk.Checkbutton(
+        frm, text="Draft preview (no PDF, fast save)", variable=draft
+    ).grid(row=row, column=1, sticky="w")
+    row += 1
+    ttk.Checkbutton(
+        frm, text="Save font settings to instructions.json", variable=save_settings
+    ).grid(row=row, column=1, sticky="w")
+    row += 1
 
     ttk.Button(frm, text="Run Update", command=run_update).grid(
         row=row, column=0, columnspan=2, pady=5
     )
+    row += 1
+    ttk.Label(frm, textvariable=status, anchor="w").grid(
+        row=row, column=0, columnspan=2, sticky="ew"
+    )
 
-    root.mainloop()
+    def preload():
+        try:
+            _load_updater()
+        except Exception as e:  # reported again when an update is started
+            _loaded["error"] = e
+
+    loader = threading.Thread(target=preload, daemon=True)
+
+    def show_status():
+        # Tk is only touched from the main thread, so poll the loader
+        if loader.is_alive():
+            root.after(100, show_status)
+        elif "error" in _loaded:
+            status.set(f"Could not load python-docx: {_loaded['error']}")
+        else:
+            status.set("Ready" if _loaded["pdf"] else "Ready (PDF export needs docx2pdf)")
+
+    def start_loader():
+        loader.start()
+        show_status()
+
+    root.after_idle(start_loader)
+    return root
+
+
+def run_gui():
+    build_window().mainloop()
 
 
 if __name__ == "__main__":
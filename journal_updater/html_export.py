@@ -0,0 +1,445 @@
+"""Export an issue as static HTML pages, one per article.
+
+The body is walked once, straight over the XML: paragraphs become ``<p>``
+or, for heading styles and article titles, ``<h1>``-``<h6>``; runs keep
+bold, italic, underline and super-/subscript; numbered or bulleted
+paragraphs are grouped into lists; tables keep their column spans and
+web and mail hyperlinks their targets. Links to bookmarks point at the page
+holding the bookmark; other link targets (``javascript:``, ``data:``, files)
+are written as plain text. Pictures are written to ``media/`` under the hash
+of their bytes, so one used many times is stored once.
+
+The content before the first article goes to ``index.html`` together with a
+list of the articles; every article found by
+:func:`journal_updater.find_article_boundaries` gets a page of its own.
+
+Run it from the command line with::
+
+    python -m journal_updater.html_export ISSUE_DOCX OUTPUT_FOLDER
+"""
+
+import argparse
+import hashlib
+import re
+from bisect import bisect_right
+from html import escape
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from docx.oxml.ns import qn
+
+try:
+    from . import journal_updater
+except ImportError:  # run as a script
+    import journal_updater
+
+_W_P = qn("w:p")
+_W_R = qn("w:r")
+_W_T = qn("w:t")
+_W_TAB = qn("w:tab")
+_W_BR = qn("w:br")
+_W_CR = qn("w:cr")
+_W_TBL = qn("w:tbl")
+_W_TR = qn("w:tr")
+_W_TC = qn("w:tc")
+_W_SDT = qn("w:sdt")
+_W_SDT_CONTENT = qn("w:sdtContent")
+_W_HYPERLINK = qn("w:hyperlink")
+_W_BOOKMARK_START = qn("w:bookmarkStart")
+_W_ANCHOR = qn("w:anchor")
+_W_NAME = qn("w:name")
+_W_SMART_TAG = qn("w:smartTag")
+_W_INS = qn("w:ins")
+_W_MOVE_TO = qn("w:moveTo")
+_W_CUSTOM_XML = qn("w:customXml")
+_W_FLD_SIMPLE = qn("w:fldSimple")
+_W_DRAWING = qn("w:drawing")
+_W_PICT = qn("w:pict")
+_W_PPR = qn("w:pPr")
+_W_RPR = qn("w:rPr")
+_W_TCPR = qn("w:tcPr")
+_W_VAL = qn("w:val")
+_R_ID = qn("r:id")
+_R_EMBED = qn("r:embed")
+_A_BLIP = qn("a:blip")
+_WP_DOCPR = qn("wp:docPr")
+_V_IMAGEDATA = "{urn:schemas-microsoft-com:vml}imagedata"
+_MC = "{http://schemas.openxmlformats.org/markup-compatibility/2006}"
+_MC_ALTERNATE = _MC + "AlternateContent"
+
+# inline wrappers whose content is shown as if it stood in their place
+_CONTAINERS = frozenset(
+    {_W_SMART_TAG, _W_INS, _W_MOVE_TO, _W_CUSTOM_XML, _W_FLD_SIMPLE, _W_SDT_CONTENT}
+)
+
+# HTML stops at <h6>; Word's Heading 7 to 9 stay plain paragraphs
+_HEADING_STYLE = re.compile(r"heading ([1-6])$", re.IGNORECASE)
+
+# run properties and the element they map to, outermost first
+_RUN_TAGS = (("b", "strong"), ("i", "em"), ("u", "u"))
+
+# link targets that may become live links on the web page
+_SAFE_SCHEMES = frozenset({"http", "https", "mailto"})
+
+_ALIGN = {"center": "center", "right": "right", "end": "right", "both": "justify"}
+
+_STYLE = (
+    "body{max-width:48em;margin:2em auto;padding:0 1em;font-family:serif;line-height:1.4}"
+    "table{border-collapse:collapse}td{border:1px solid #999;padding:.2em .4em;"
+    "vertical-align:top}img{max-width:100%;height:auto}"
+    ".center{text-align:center}.right{text-align:right}.justify{text-align:justify}"
+)
+
+
+def _alternate(el):
+    """Return the branch of the ``mc:AlternateContent`` ``el`` to render.
+
+    The first choice holds what current Word writes; older consumers read
+    the fallback, which is used when there is no choice.
+    """
+    choice = el.find(_MC + "Choice")
+    return choice if choice is not None else el.find(_MC + "Fallback")
+
+
+def _on(props, name: str) -> bool:
+    el = props.find(qn(f"w:{name}"))
+    if el is None:
+        return False
+    return el.get(_W_VAL) not in ("0", "false", "none", "off")
+
+
+def _safe_url(target: str) -> Optional[str]:
+    """Return ``target`` if it is a web or mail address, else ``None``."""
+    target = target.strip()
+    try:
+        scheme = urlsplit(target).scheme.lower()
+    except ValueError:
+        return None
+    return target if scheme in _SAFE_SCHEMES else None
+
+
+def _slug(text: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")[:60] or "article"
+
+
+class HtmlWriter:
+    """Turns the blocks of one document into HTML strings."""
+
+    def __init__(
+        self,
+        doc,
+        media_dir: Path,
+        media_url: str = "media",
+        anchors: Optional[Dict[str, str]] = None,
+    ):
+        """``anchors`` maps the bookmarks links point at to their page file."""
+        self.doc = doc
+        self.media_dir = media_dir
+        self.media_url = media_url
+        self.anchors = anchors or {}
+        self.images: Dict[str, str] = {}
+        self._headings, self._list_styles = self._styles(doc)
+
+    @staticmethod
+    def _styles(doc) -> Tuple[Dict[str, int], set]:
+        """Read heading levels and numbered styles once from the styles part."""
+        levels = {}
+        listed = set()
+        styles = doc.styles.element
+        for style in styles.iterchildren(qn("w:style")):
+            name_el = style.find(qn("w:name"))
+            name = name_el.get(_W_VAL) if name_el is not None else ""
+            style_id = style.get(qn("w:styleId"))
+            m = _HEADING_STYLE.match(name)
+            if m:
+                levels[style_id] = int(m.group(1))
+            elif name.lower() == "title":
+                levels[style_id] = 1
+            elif style.find(f"{_W_PPR}/{qn('w:numPr')}") is not None:
+                listed.add(style_id)
+        return levels, listed
+
+    # -- images ---------------------------------------------------------
+
+    def _image(self, rid: Optional[str], alt: str) -> str:
+        rel = self.doc.part.rels.get(rid) if rid else None
+        if rel is None or rel.is_external:
+            return ""
+        part = rel.target_part
+        url = self.images.get(part.partname)
+        if url is None:
+            blob = part.blob
+            name = f"{hashlib.sha256(blob).hexdigest()[:16]}.{part.partname.ext}"
+            path = self.media_dir / name
+            if not path.exists():
+                self.media_dir.mkdir(parents=True, exist_ok=True)
+                path.write_bytes(blob)
+            url = self.images[part.partname] = f"{self.media_url}/{name}"
+        return f'<img src="{url}" alt="{escape(alt)}">'
+
+    def _drawing(self, drawing) -> str:
+        doc_pr = next(drawing.iter(_WP_DOCPR), None)
+        alt = ""
+        if doc_pr is not None:
+            alt = doc_pr.get("descr") or doc_pr.get("title") or ""
+        return "".join(self._image(blip.get(_R_EMBED), alt) for blip in drawing.iter(_A_BLIP))
+
+    # -- inline content -------------------------------------------------
+
+    def _run(self, run) -> str:
+        parts = []
+        rpr = None
+        for child in run:
+            tag = child.tag
+            if tag == _W_RPR:
+                rpr = child
+            elif tag == _W_T:
+                parts.append(escape(child.text or "", quote=False))
+            elif tag == _W_TAB:
+                parts.append("\t")
+            elif tag == _W_BR or tag == _W_CR:
+                if child.get(qn("w:type")) in (None, "textWrapping"):
+                    parts.append("<br>")
+            elif tag == _W_DRAWING:
+                parts.append(self._drawing(child))
+            elif tag == _W_PICT:
+                parts.extend(
+                    self._image(data.get(_R_ID), data.get(qn("o:title")) or "")
+                    for data in child.iter(_V_IMAGEDATA)
+                )
+            elif tag == _MC_ALTERNATE:
+                branch = _alternate(child)
+                if branch is not None:
+                    parts.append(self._run(branch))
+        html = "".join(parts)
+        if not html or rpr is None:
+            return html
+        for prop, tag in _RUN_TAGS:
+            if _on(rpr, prop):
+                html = f"<{tag}>{html}</{tag}>"
+        va = rpr.find(qn("w:vertAlign"))
+        if va is not None and va.get(_W_VAL) in ("superscript", "subscript"):
+            tag = "sup" if va.get(_W_VAL) == "superscript" else "sub"
+            html = f"<{tag}>{html}</{tag}>"
+        return html
+
+    def _inline(self, parent) -> str:
+        parts = []
+        for child in parent:
+            tag = child.tag
+            if tag == _W_R:
+                parts.append(self._run(child))
+            elif tag == _W_HYPERLINK:
+                inner = self._inline(child)
+                rel = self.doc.part.rels.get(child.get(_R_ID) or "")
+                anchor = child.get(_W_ANCHOR)
+                url = _safe_url(rel.target_ref) if rel is not None and rel.is_external else None
+                if url is not None:
+                    parts.append(f'<a href="{escape(url)}">{inner}</a>')
+                elif rel is None and anchor in self.anchors:
+                    href = f"{self.anchors[anchor]}#{anchor}"
+                    parts.append(f'<a href="{escape(href)}">{inner}</a>')
+                else:
+                    parts.append(inner)
+            elif tag == _W_BOOKMARK_START:
+                name = child.get(_W_NAME)
+                if name in self.anchors:
+                    parts.append(f'<a id="{escape(name)}"></a>')
+            elif tag in _CONTAINERS:
+                parts.append(self._inline(child))
+            elif tag == _MC_ALTERNATE:
+                branch = _alternate(child)
+                if branch is not None:
+                    parts.append(self._inline(branch))
+            elif tag == _W_SDT:
+                content = child.find(_W_SDT_CONTENT)
+                if content is not None:
+                    parts.append(self._inline(content))
+        return "".join(parts)
+
+    # -- blocks ---------------------------------------------------------
+
+    def paragraph(self, p, level: Optional[int] = None) -> Tuple[str, bool]:
+        """Return the HTML of ``p`` and whether it is a list item.
+
+        ``level`` forces a heading level, as for article titles.
+        """
+        ppr = p.find(_W_PPR)
+        attrs = ""
+        listed = False
+        if ppr is not None:
+            style = ppr.find(qn("w:pStyle"))
+            style_id = style.get(_W_VAL) if style is not None else None
+            if level is None:
+                level = self._headings.get(style_id)
+            if level is None:
+                outline = ppr.find(qn("w:outlineLvl"))
+                if outline is not None and outline.get(_W_VAL, "9").isdigit():
+                    value = int(outline.get(_W_VAL))
+                    level = value + 1 if value < 6 else None
+            jc = ppr.find(qn("w:jc"))
+            if jc is not None and jc.get(_W_VAL) in _ALIGN:
+                attrs = f' class="{_ALIGN[jc.get(_W_VAL)]}"'
+            num_id = ppr.find(f"{qn('w:numPr')}/{qn('w:numId')}")
+            if num_id is not None:
+                listed = level is None and num_id.get(_W_VAL) != "0"
+            else:
+                listed = level is None and style_id in self._list_styles
+        inner = self._inline(p)
+        if not inner.strip():
+            return "", False
+        if level is not None:
+            return f"<h{level}{attrs}>{inner}</h{level}>", False
+        if listed:
+            return f"<li{attrs}>{inner}</li>", True
+        return f"<p{attrs}>{inner}</p>", False
+
+    def table(self, tbl) -> str:
+        rows = []
+        for tr in tbl.iterchildren(_W_TR):
+            cells = []
+            for tc in tr.iterchildren(_W_TC):
+                span = ""
+                tcpr = tc.find(_W_TCPR)
+                if tcpr is not None:
+                    grid_span = tcpr.find(qn("w:gridSpan"))
+                    if grid_span is not None and grid_span.get(_W_VAL, "1") != "1":
+                        span = f' colspan="{int(grid_span.get(_W_VAL))}"'
+                cells.append(f"<td{span}>{self.blocks(tc)}</td>")
+            rows.append(f"<tr>{''.join(cells)}</tr>")
+        return f"<table>{''.join(rows)}</table>"
+
+    def blocks(self, parent, titles: Optional[Dict[object, int]] = None) -> str:
+        """Return the HTML of the block-level children of ``parent``."""
+        out = _BlockStream()
+        for el in parent:
+            out.add(self.block(el, titles))
+        return out.close()
+
+    def block(self, el, titles: Optional[Dict[object, int]] = None) -> Tuple[str, bool]:
+        """Return ``(html, is_list_item)`` for one block-level element."""
+        tag = el.tag
+        if tag == _W_P:
+            return self.paragraph(el, titles.get(el) if titles else None)
+        if tag == _W_TBL:
+            return self.table(el), False
+        if tag == _W_SDT:
+            content = el.find(_W_SDT_CONTENT)
+            return (self.blocks(content, titles) if content is not None else ""), False
+        return "", False
+
+
+class _BlockStream:
+    """Joins block HTML and wraps consecutive list items in ``<ul>``."""
+
+    def __init__(self):
+        self.parts: List[str] = []
+        self.in_list = False
+
+    def add(self, item: Tuple[str, bool]) -> None:
+        html, listed = item
+        if not html:
+            return
+        if listed != self.in_list:
+            self.parts.append("<ul>" if listed else "</ul>")
+            self.in_list = listed
+        self.parts.append(html)
+
+    def close(self) -> str:
+        if self.in_list:
+            self.parts.append("</ul>")
+            self.in_list = False
+        html = "\n".join(self.parts)
+        self.parts = []
+        return html
+
+
+def _page(title: str, body: str, nav: str = "") -> str:
+    return (
+        "<!DOCTYPE html>\n"
+        f'<html lang="en">\n<head>\n<meta charset="utf-8">\n<title>{escape(title)}</title>\n'
+        f"<style>{_STYLE}</style>\n</head>\n<body>\n"
+        f"{nav}<main>\n{body}\n</main>\n{nav}</body>\n</html>\n"
+    )
+
+
+def export_html(doc, out_dir, title: str = "Journal") -> List[Path]:
+    """Write ``doc`` as HTML pages into ``out_dir`` and return their paths.
+
+    ``index.html`` holds the content before the first article and links to
+    one page per article; pictures are written once to ``out_dir/media``.
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    page_map = journal_updater.scan_pages(doc)
+    boundaries = [
+        (t, offset)
+        for t, offset in journal_updater.find_article_boundaries(page_map)
+        if t != "ARTICLES"
+    ]
+    elements = page_map.elements
+    first = boundaries[0][1] if boundaries else len(elements)
+    # the ARTICLES heading belongs to the index, not the first article
+    titles = {elements[offset]: 1 for _, offset in boundaries}
+
+    names = []
+    for number, (article, _) in enumerate(boundaries, 1):
+        names.append(f"article-{number:02d}-{_slug(article)}.html")
+
+    # bookmarks that internal links point at, and the page each one lands on
+    body = doc.element.body
+    targets = {link.get(_W_ANCHOR) for link in body.iter(_W_HYPERLINK)}
+    anchors: Dict[str, str] = {}
+    if targets - {None}:
+        starts = [offset for _, offset in boundaries]
+        for i, el in enumerate(elements):
+            for mark in el.iter(_W_BOOKMARK_START):
+                name = mark.get(_W_NAME)
+                if name in targets and name not in anchors:
+                    page = bisect_right(starts, i)
+                    anchors[name] = names[page - 1] if page else "index.html"
+    writer = HtmlWriter(doc, out_dir / "media", anchors=anchors)
+
+    stream = _BlockStream()
+    for el in elements[:first]:
+        stream.add(writer.block(el))
+    links = "".join(
+        f'<li><a href="{name}">{escape(article)}</a></li>'
+        for (article, _), name in zip(boundaries, names)
+    )
+    index_body = stream.close()
+    if links:
+        index_body += f'\n<nav><h2>Articles</h2><ol>{links}</ol></nav>'
+    written = [out_dir / "index.html"]
+    written[0].write_text(_page(title, index_body), encoding="utf-8")
+
+    ends = [offset for _, offset in boundaries[1:]] + [len(elements)]
+    for number, ((article, start), end) in enumerate(zip(boundaries, ends)):
+        stream = _BlockStream()
+        for el in elements[start:end]:
+            stream.add(writer.block(el, titles))
+        prev_link = f'<a href="{names[number - 1]}">Previous</a> ' if number else ""
+        next_link = f' <a href="{names[number + 1]}">Next</a>' if number + 1 < len(names) else ""
+        nav = f'<nav>{prev_link}<a href="index.html">Contents</a>{next_link}</nav>\n'
+        path = out_dir / names[number]
+        path.write_text(_page(f"{article} - {title}", stream.close(), nav), encoding="utf-8")
+        written.append(path)
+    return written
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Export a journal issue as HTML")
+    parser.add_argument("issue_doc")
+    parser.add_argument("output_folder")
+    parser.add_argument("--title", default=None, help="Site title (default: file name)")
+    args = parser.parse_args(argv)
+
+    source = Path(args.issue_doc)
+    doc = journal_updater.load_document(source)
+    pages = export_html(doc, args.output_folder, args.title or source.stem)
+    print(f"Wrote {len(pages)} page(s) to {args.output_folder}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+"""Downsample and recompress the pictures of an issue.
+
+Submitted photos are often far larger than the space they fill on the page.
+:func:`optimize_images` looks up how large each JPEG or PNG picture is
+displayed (its DrawingML extent, adjusted for cropping), scales it down to
+``dpi`` pixels per inch at that size and recompresses it, keeping the
+format. Results are cached by the SHA-256 of the original bytes and the
+target size, in memory and optionally in ``cache_dir``, so running the
+update again on the same articles does no image work.
+
+Resampling needs Pillow; without it the document is left as is.
+"""
+
+import hashlib
+import logging
+import math
+from io import BytesIO
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from docx.oxml.ns import qn
+
+try:
+    from . import atomic, fragments
+except ImportError:  # run as a script
+    import atomic
+    import fragments
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional
+    Image = None
+
+DEFAULT_DPI = 200
+DEFAULT_QUALITY = 85
+EMU_PER_INCH = 914400
+
+# only scale down when it saves a meaningful number of pixels
+_MIN_SHRINK = 0.9
+
+_FORMATS = {"image/jpeg": "JPEG", "image/png": "PNG"}
+
+_BLIP = qn("a:blip")
+_EMBED = qn("r:embed")
+_EXT = qn("a:ext")
+_EXTENT = qn("wp:extent")
+_INLINE = qn("wp:inline")
+_ANCHOR = qn("wp:anchor")
+_PIC = qn("pic:pic")
+_SRC_RECT = qn("a:srcRect")
+_XFRM = qn("a:xfrm")
+_VML_IMAGEDATA = f"{{{fragments.VML}}}imagedata"
+
+# processed images shared by every document of this process, oldest first
+_MEMORY: Dict[str, bytes] = {}
+_MEMORY_ITEMS = 64
+
+
+class ImageCache:
+    """Optimized image bytes keyed by source hash, target size and quality."""
+
+    def __init__(self, directory: Optional[Path] = None):
+        self.directory = Path(directory) if directory is not None else None
+
+    @staticmethod
+    def key(blob: bytes, size: Tuple[int, int], quality: int) -> str:
+        digest = hashlib.sha256(blob).hexdigest()
+        return f"{digest}-{size[0]}x{size[1]}-q{quality}"
+
+    def get(self, key: str) -> Optional[bytes]:
+        data = _MEMORY.get(key)
+        if data is None and self.directory is not None:
+            try:
+                data = (self.directory / key).read_bytes()
+            except OSError:
+                return None
+            _MEMORY[key] = data
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        _MEMORY[key] = data
+        while len(_MEMORY) > _MEMORY_ITEMS:
+            del _MEMORY[next(iter(_MEMORY))]
+        if self.directory is None:
+            return
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with atomic.atomic_write(self.directory / key) as f:
+                f.write(data)
+        except OSError as e:
+            logging.warning("Could not cache optimized image: %s", e)
+
+
+def _displayed_extent(blip) -> Optional[Tuple[int, int]]:
+    """Return the size in EMU of the whole picture behind ``blip``.
+
+    When the picture is cropped only part of it is shown, so the extent is
+    scaled up to the size the uncropped picture would have.
+    """
+    pic = next((a for a in blip.iterancestors(_PIC)), None)
+    ext = None
+    if pic is not None:
+        xfrm = next(pic.iter(_XFRM), None)
+        if xfrm is not None:
+            ext = xfrm.find(_EXT)
+    if ext is None:
+        frame = next((a for a in blip.iterancestors(_INLINE, _ANCHOR)), None)
+        ext = frame.find(_EXTENT) if frame is not None else None
+    if ext is None:
+        return None
+    try:
+        cx, cy = int(ext.get("cx")), int(ext.get("cy"))
+    except (TypeError, ValueError):
+        return None
+    src = blip.getparent().find(_SRC_RECT)
+    if src is not None:
+        crop = {k: int(src.get(k, 0)) / 100000 for k in ("l", "t", "r", "b")}
+        cx /= max(1 - crop["l"] - crop["r"], 0.01)
+        cy /= max(1 - crop["t"] - crop["b"], 0.01)
+    return int(cx), int(cy)
+
+
+def displayed_extents(doc) -> Dict[object, Optional[Tuple[int, int]]]:
+    """Map every image part of ``doc`` to the largest size it is shown at.
+
+    Parts also used in a way whose size is unknown (VML pictures, a
+    reference without an extent) map to ``None`` and must not be resized.
+    """
+    extents: Dict[object, Optional[Tuple[int, int]]] = {}
+    for part in doc.part.package.iter_parts():
+        element = getattr(part, "_element", None)
+        if element is None:
+            continue
+        related = part.rels
+        for node in element.iter(_BLIP, _VML_IMAGEDATA):
+            for attr in (_EMBED, qn("r:id")):
+                rid = node.get(attr)
+                rel = related.get(rid) if rid else None
+                if rel is None or rel.is_external:
+                    continue
+                target = rel.target_part
+                size = _displayed_extent(node) if node.tag == _BLIP else None
+                if target in extents:
+                    old = extents[target]
+                    if old is None or size is None:
+                        size = None
+                    else:
+                        size = (max(old[0], size[0]), max(old[1], size[1]))
+                extents[target] = size
+    return extents
+
+
+def _target_pixels(extent: Tuple[int, int], dpi: int) -> Tuple[int, int]:
+    return (
+        max(1, math.ceil(extent[0] / EMU_PER_INCH * dpi)),
+        max(1, math.ceil(extent[1] / EMU_PER_INCH * dpi)),
+    )
+
+
+def _resample(blob: bytes, fmt: str, size: Tuple[int, int], quality: int) -> bytes:
+    with Image.open(BytesIO(blob)) as img:
+        if getattr(img, "n_frames", 1) > 1:
+            return blob
+        info = {k: img.info[k] for k in ("exif", "icc_profile", "dpi") if k in img.info}
+        small = img.resize(size, Image.LANCZOS)
+    out = BytesIO()
+    if fmt == "JPEG":
+        if small.mode not in ("RGB", "L", "CMYK"):
+            small = small.convert("RGB")
+        small.save(out, "JPEG", quality=quality, optimize=True, progressive=True, **info)
+    else:
+        small.save(out, "PNG", optimize=True, **info)
+    return out.getvalue()
+
+
+def optimize_images(
+    doc,
+    dpi: int = DEFAULT_DPI,
+    quality: int = DEFAULT_QUALITY,
+    cache_dir: Optional[Path] = None,
+) -> Dict[str, int]:
+    """Scale pictures of ``doc`` down to ``dpi`` at their displayed size.
+
+    Only JPEG and PNG pictures larger than needed are changed; ``quality``
+    is the JPEG quality used when recompressing. A result that is not
+    smaller than the original is discarded. Returns counts of the images
+    seen, resized and taken from the cache, and the bytes before and after.
+    """
+    stats = {"images": 0, "resized": 0, "cached": 0, "bytes_before": 0, "bytes_after": 0}
+    extents = displayed_extents(doc)
+    stats["images"] = len(extents)
+    if Image is None:
+        if extents:
+            logging.warning("Pillow is not installed; images are left unchanged")
+        return stats
+
+    cache = ImageCache(cache_dir)
+    for part, extent in extents.items():
+        fmt = _FORMATS.get(part.content_type)
+        if fmt is None or extent is None:
+            continue
+        blob = part.blob
+        try:
+            width, height = part.image.px_width, part.image.px_height
+        except Exception:  # unreadable header
+            continue
+        size = _target_pixels(extent, dpi)
+        if size[0] >= width * _MIN_SHRINK or size[1] >= height * _MIN_SHRINK:
+            continue
+        key = ImageCache.key(blob, size, quality)
+        data = cache.get(key)
+        if data is not None:
+            stats["cached"] += 1
+        else:
+            try:
+                data = _resample(blob, fmt, size, quality)
+            except Exception as e:  # corrupt image data
+                logging.warning("Could not resample %s: %s", part.partname, e)
+                continue
+            cache.put(key, data)
+        if len(data) >= len(blob):
+            continue
+        stats["resized"] += 1
+        stats["bytes_before"] += len(blob)
+        stats["bytes_after"] += len(data)
+        part._blob = data
+        part._image = None
+    return stats
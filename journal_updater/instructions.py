@@ -0,0 +1,244 @@
+"""Typed form of the ``instructions.json`` settings of a content folder.
+
+:class:`Instructions` is parsed and validated once, passed to
+:func:`journal_updater.update_journal` directly and only written back to the
+folder when :meth:`Instructions.save` is called.
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Union
+
+try:
+    from . import atomic
+except ImportError:  # run as a script
+    import atomic
+
+FILENAME = "instructions.json"
+
+
+class InstructionsError(ValueError):
+    """Raised for an unreadable file or a setting with an invalid value."""
+
+
+def _text(name: str, value: Any) -> str:
+    if isinstance(value, bool) or not isinstance(value, (str, int)) or str(value).strip() == "":
+        raise InstructionsError(f"{name} must be a non-empty string, got {value!r}")
+    return str(value).strip()
+
+
+def _flag(name: str, value: Any) -> bool:
+    if not isinstance(value, bool):
+        raise InstructionsError(f"{name} must be true or false, got {value!r}")
+    return value
+
+
+def _page(name: str, value: Any) -> int:
+    if isinstance(value, str) and value.strip().isdigit():
+        value = int(value)
+    if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+        raise InstructionsError(f"{name} must be a page number of 1 or more, got {value!r}")
+    return value
+
+
+def _positive(name: str, value: Any) -> Union[int, float]:
+    if isinstance(value, str):
+        try:
+            value = float(value) if "." in value else int(value)
+        except ValueError:
+            pass
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+        raise InstructionsError(f"{name} must be a positive number, got {value!r}")
+    return value
+
+
+def _whole(name: str, value: Any, low: int, high: Optional[int] = None) -> int:
+    """Parse a whole number from ``low`` to ``high``; ``85.0`` counts, ``0.5`` doesn't."""
+    number = value
+    if isinstance(number, str):
+        try:
+            number = float(number)
+        except ValueError:
+            pass
+    valid = (
+        not isinstance(number, bool)
+        and isinstance(number, (int, float))
+        and float(number).is_integer()
+        and low <= number <= (high if high is not None else number)
+    )
+    if not valid:
+        limits = f"{low} to {high}" if high is not None else f"{low} or more"
+        raise InstructionsError(f"{name} must be a whole number of {limits}, got {value!r}")
+    return int(number)
+
+
+def _from_page(field: str) -> Callable[[str, Any], Dict[str, Any]]:
+    def parse(name: str, value: Any) -> Dict[str, Any]:
+        if not isinstance(value, dict) or set(value) != {"page", field}:
+            raise InstructionsError(
+                f"{name} must be an object with 'page' and '{field}', got {value!r}"
+            )
+        return {
+            "page": _page(f"{name}.page", value["page"]),
+            field: _positive(f"{name}.{field}", value[field]),
+        }
+
+    return parse
+
+
+def _front_and_footer(name: str, value: Any) -> Dict[str, Any]:
+    # older files use a plain flag here
+    if isinstance(value, bool):
+        return {}
+    if not isinstance(value, dict):
+        raise InstructionsError(f"{name} must be an object or a flag, got {value!r}")
+    unknown = set(value) - {"font_size", "line_spacing"}
+    if unknown:
+        raise InstructionsError(f"{name} has unknown keys: {', '.join(sorted(unknown))}")
+    return {key: _positive(f"{name}.{key}", val) for key, val in value.items()}
+
+
+def _images(name: str, value: Any) -> Optional[Dict[str, Any]]:
+    if isinstance(value, bool):
+        return {} if value else None
+    if not isinstance(value, dict):
+        raise InstructionsError(f"{name} must be an object or a flag, got {value!r}")
+    unknown = set(value) - {"dpi", "quality"}
+    if unknown:
+        raise InstructionsError(f"{name} has unknown keys: {', '.join(sorted(unknown))}")
+    result = {}
+    if "dpi" in value:
+        result["dpi"] = _whole(f"{name}.dpi", value["dpi"], 1)
+    if "quality" in value:
+        result["quality"] = _whole(f"{name}.quality", value["quality"], 1, 100)
+    return result
+
+
+_PARSERS: Dict[str, Callable[[str, Any], Any]] = {
+    "volume": _text,
+    "issue": _text,
+    "delete_after_page": _page,
+    "delete_after_editorial": _flag,
+    "cleanup_black_lines": _flag,
+    "font_size": _positive,
+    "line_spacing": _positive,
+    "font_family": _text,
+    "font_size_from_page": _from_page("size"),
+    "line_spacing_from_page": _from_page("spacing"),
+    "autofit_table_on_page": _page,
+    "format_front_and_footer": _front_and_footer,
+    "optimize_images": _images,
+    "clean_xml": _flag,
+}
+
+
+class Instructions:
+    """Validated update settings; unset fields are ``None``.
+
+    Keys this version doesn't know are kept in :attr:`extra` and written
+    back unchanged by :meth:`save`.
+    """
+
+    __slots__ = tuple(_PARSERS) + ("extra",)
+
+    volume: Optional[str]
+    issue: Optional[str]
+    delete_after_page: Optional[int]
+    delete_after_editorial: Optional[bool]
+    cleanup_black_lines: Optional[bool]
+    font_size: Optional[Union[int, float]]
+    line_spacing: Optional[Union[int, float]]
+    font_family: Optional[str]
+    font_size_from_page: Optional[Dict[str, Any]]
+    line_spacing_from_page: Optional[Dict[str, Any]]
+    autofit_table_on_page: Optional[int]
+    format_front_and_footer: Optional[Dict[str, Any]]
+    optimize_images: Optional[Dict[str, Any]]
+    clean_xml: Optional[bool]
+
+    def __init__(self, **values: Any):
+        for name in _PARSERS:
+            object.__setattr__(self, name, None)
+        object.__setattr__(self, "extra", {})
+        for name, value in values.items():
+            if name not in _PARSERS:
+                raise InstructionsError(f"unknown instruction {name!r}")
+            if value is not None:
+                object.__setattr__(self, name, _PARSERS[name](name, value))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name not in _PARSERS:
+            raise AttributeError(f"unknown instruction {name!r}")
+        object.__setattr__(self, name, None if value is None else _PARSERS[name](name, value))
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, Instructions)
+            and self.to_dict() == other.to_dict()
+            and self.extra == other.extra
+        )
+
+    def __repr__(self) -> str:
+        return f"Instructions({self.to_dict()!r})"
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Instructions":
+        """Validate ``data``; unknown keys are logged and kept in :attr:`extra`."""
+        if not isinstance(data, dict):
+            raise InstructionsError("instructions must be a JSON object")
+        known = {}
+        extra = {}
+        for name, value in data.items():
+            if name in _PARSERS:
+                known[name] = value
+            else:
+                logging.warning("Ignoring unknown instruction %r", name)
+                extra[name] = value
+        instructions = cls(**known)
+        object.__setattr__(instructions, "extra", extra)
+        return instructions
+
+    @classmethod
+    def load(cls, content_path: Path) -> "Instructions":
+        """Read ``instructions.json`` from ``content_path`` if it exists."""
+        path = Path(content_path) / FILENAME
+        try:
+            with path.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return cls()
+        except (OSError, ValueError) as exc:
+            raise InstructionsError(f"Failed to read {path}: {exc}") from exc
+        try:
+            return cls.from_dict(data)
+        except InstructionsError as exc:
+            raise InstructionsError(f"{path}: {exc}") from exc
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the fields that are set, as stored in ``instructions.json``."""
+        result = {}
+        for name in _PARSERS:
+            value = getattr(self, name)
+            if value is not None:
+                result[name] = dict(value) if isinstance(value, dict) else value
+        return result
+
+    def merged(self, **overrides: Any) -> "Instructions":
+        """Return a copy with the non-``None`` ``overrides`` applied."""
+        values = self.to_dict()
+        values.update({k: v for k, v in overrides.items() if v is not None})
+        result = Instructions(**values)
+        object.__setattr__(result, "extra", dict(self.extra))
+        return result
+
+    def save(self, content_path: Path) -> Path:
+        """Write the settings to ``instructions.json`` in ``content_path``.
+
+        The file is replaced in one step, so a concurrent reader never sees
+        a partial file.
+        """
+        path = Path(content_path) / FILENAME
+        with atomic.atomic_write(path, "w", encoding="utf-8") as f:
+            json.dump({**self.extra, **self.to_dict()}, f, indent=2)
+        return path
@@ -1,24 +1,331 @@
 """Utility functions for updating ABNFF journal Word documents."""
 
 import argparse
-import json
+import io
 import logging
+import os
+import re
+import struct
+import weakref
+import zipfile
+import zlib
+from array import array
+from bisect import bisect_right
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
 from docx import Document
-from docx.shared import Pt, RGBColor
+from docx.oxml.ns import qn
+from lxml import etree
+from docx.shared import Emu, Pt, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 
+try:
+    from . import atomic
+    from . import checkpoint as checkpoints
+    from . import cleanup, cli, fragments, images, whitespace, xpaths
+    from .coalesce import coalesce_runs
+    from .fragment_store import FragmentStore, StoredFragment
+    from .content import ContentFolder, scan_content
+    from .instructions import Instructions, InstructionsError
+    from .preflight import PreflightError, format_report, preflight
+except ImportError:  # run as a script
+    import atomic
+    import checkpoint as checkpoints
+    import cli
+    import fragments
+    import cleanup
+    import images
+    import whitespace
+    import xpaths
+    from coalesce import coalesce_runs
+    from fragment_store import FragmentStore, StoredFragment
+    from content import ContentFolder, scan_content
+    from instructions import Instructions, InstructionsError
+    from preflight import PreflightError, format_report, preflight
+
+
+# Original archive of every document opened through ``load_document``, keyed
+# by its package so ``save_document`` can copy untouched parts verbatim.
+_SOURCES: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+# Revision ids (``w:rsidR`` and friends) in serialized XML; they change with
+# every edit session without changing what the document shows.
+_RSID_RE = re.compile(rb'\s[\w:]*rsid\w*="[^"]*"')
+
+
+class _SourcePackage:
+    """Where a loaded document came from and what its parts looked like."""
+
+    def __init__(self, source, stamp, fingerprints: dict, blobs: dict):
+        self.source = source
+        self.stamp = stamp
+        self.fingerprints = fingerprints
+        self.blobs = blobs
+
+    def fingerprint(self, name: str, zf: zipfile.ZipFile) -> Tuple[int, int]:
+        """Return CRC and size of member ``name`` as python-docx would write it.
+
+        XML parts are only fingerprinted the first time a save needs them,
+        by reading and re-serializing the original member from ``zf``.
+        """
+        fingerprint = self.fingerprints[name]
+        if fingerprint is None:
+            from docx.opc.oxml import serialize_part_xml
+            from docx.oxml.parser import parse_xml
+
+            data = serialize_part_xml(parse_xml(zf.read(name)))
+            fingerprint = self.fingerprints[name] = (zlib.crc32(data), len(data))
+        return fingerprint
+
+    def open(self) -> zipfile.ZipFile:
+        """Open the original archive, or raise ``OSError`` if it changed."""
+        if isinstance(self.source, bytes):
+            return zipfile.ZipFile(io.BytesIO(self.source))
+        st = os.stat(self.source)
+        if (st.st_size, st.st_mtime_ns) != self.stamp:
+            raise OSError(f"{self.source} changed since it was loaded")
+        return zipfile.ZipFile(self.source)
+
+
+def _package_members(package) -> List[Tuple[str, object]]:
+    """Return ``(membername, item)`` for every member python-docx would write.
+
+    ``item`` is a part, a relationships collection or a callable producing the
+    content types stream.
+    """
+    from docx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI
+
+    parts = package.parts
+    members: List[Tuple[str, object]] = [
+        (CONTENT_TYPES_URI.membername, lambda: _content_types_blob(parts)),
+        (PACKAGE_URI.rels_uri.membername, package.rels),
+    ]
+    for part in parts:
+        members.append((part.partname.membername, part))
+        if len(part.rels):
+            members.append((part.partname.rels_uri.membername, part.rels))
+    return members
+
+
+def _content_types_blob(parts) -> bytes:
+    """Return the ``[Content_Types].xml`` stream for ``parts``.
+
+    python-docx builds it with a private class; should that go away, every
+    part gets an override of its own, which Word reads just the same.
+    """
+    try:
+        from docx.opc.pkgwriter import _ContentTypesItem
+    except ImportError:
+        pass
+    else:
+        return _ContentTypesItem.from_parts(parts).blob
+    from xml.sax.saxutils import quoteattr
+
+    from docx.opc.constants import CONTENT_TYPE as CT
+
+    entries = [
+        f'<Default Extension="rels" ContentType="{CT.OPC_RELATIONSHIPS}"/>',
+        f'<Default Extension="xml" ContentType="{CT.XML}"/>',
+    ]
+    for part in parts:
+        entries.append(
+            f"<Override PartName={quoteattr(str(part.partname))}"
+            f" ContentType={quoteattr(part.content_type)}/>"
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        + "".join(entries)
+        + "</Types>"
+    ).encode("utf-8")
+
+
+def _member_blob(item) -> bytes:
+    from docx.opc.part import Part
+
+    if isinstance(item, Part):
+        return item.blob
+    if callable(item):
+        return item()
+    return item.xml
+
+
+def load_document(path) -> Document:
+    """Open the Word file at ``path`` and return a ``Document`` object.
+
+    ``path`` may also be a binary stream. The original archive is remembered
+    so :func:`save_document` can copy parts that were not modified straight
+    from it instead of recompressing them. XML parts are not serialized here;
+    :func:`save_document` fingerprints them when it first needs to.
+    """
+    from docx.opc.part import XmlPart
+
+    if isinstance(path, (str, Path)):
+        doc = Document(str(path))
+        st = os.stat(path)
+        source, stamp = str(path), (st.st_size, st.st_mtime_ns)
+    else:
+        path.seek(0)
+        source, stamp = path.read(), None
+        doc = Document(io.BytesIO(source))
+
+    fingerprints = {}
+    blobs = {}
+    for name, item in _package_members(doc.part.package):
+        if isinstance(item, XmlPart):
+            fingerprints[name] = None
+        elif hasattr(item, "blob"):
+            blobs[name] = item.blob
+        else:
+            data = _member_blob(item)
+            fingerprints[name] = (zlib.crc32(data), len(data))
+    _SOURCES[doc.part.package] = _SourcePackage(source, stamp, fingerprints, blobs)
+    return doc
+
+
+def clone_document(doc: Document) -> Document:
+    """Return an independent copy of ``doc``.
+
+    Copying the parsed tree is much cheaper than parsing the file again. A
+    copy of a document opened with :func:`load_document` keeps its source,
+    so :func:`save_document` still copies unchanged parts verbatim.
+    """
+    import copy
+
+    clone = copy.deepcopy(doc)
+    source = _SOURCES.get(doc.part.package)
+    if source is not None:
+        _SOURCES[clone.part.package] = source
+    return clone
+
+
+def _copy_raw_member(src: zipfile.ZipFile, info: zipfile.ZipInfo, dst: zipfile.ZipFile) -> None:
+    """Copy the compressed bytes of ``info`` from ``src`` into ``dst``."""
+    filelist, name_to_info, fp = dst.filelist, dst.NameToInfo, dst.fp
+    src.fp.seek(info.header_offset)
+    header = src.fp.read(30)
+    if header[:4] != b"PK\x03\x04":
+        raise zipfile.BadZipFile(f"bad local header for {info.filename}")
+    name_len, extra_len = struct.unpack("<HH", header[26:30])
+    src.fp.seek(info.header_offset + 30 + name_len + extra_len)
+    raw = src.fp.read(info.compress_size)
+
+    zinfo = zipfile.ZipInfo(info.filename, info.date_time)
+    zinfo.compress_type = info.compress_type
+    zinfo.flag_bits = info.flag_bits & 0x800  # keep only the UTF-8 name flag
+    zinfo.external_attr = info.external_attr
+    zinfo.CRC = info.CRC
+    zinfo.compress_size = info.compress_size
+    zinfo.file_size = info.file_size
+    header = zinfo.FileHeader()
+    zinfo.header_offset = fp.tell()
+    fp.write(header)
+    fp.write(raw)
+    filelist.append(zinfo)
+    name_to_info[zinfo.filename] = zinfo
+    dst.start_dir = fp.tell()
+    dst._didModify = True
+
+
+def _try_copy_raw_member(src: zipfile.ZipFile, info: zipfile.ZipInfo, dst: zipfile.ZipFile) -> bool:
+    """Copy ``info`` with :func:`_copy_raw_member` and return whether it worked.
+
+    The raw copy relies on ``zipfile`` internals. When they are missing or
+    the source member is damaged, whatever was written is dropped again and
+    ``False`` is returned so the caller can fall back to ``writestr``.
+    """
+    fp = getattr(dst, "fp", None)
+    start = fp.tell() if fp is not None else None
+    try:
+        _copy_raw_member(src, info, dst)
+    except (AttributeError, struct.error, zipfile.BadZipFile) as e:
+        logging.warning("Recompressing %s: %s", info.filename, e)
+        if start is not None:
+            fp.seek(start)
+            fp.truncate()
+        return False
+    return True
 
-def load_document(path: Path) -> Document:
-    """Open the Word file at ``path`` and return a ``Document`` object."""
-    return Document(str(path))
 
+def _compare_member(
+    source: Optional[_SourcePackage],
+    src_zip: Optional[zipfile.ZipFile],
+    info: Optional[zipfile.ZipInfo],
+    name: str,
+    item,
+) -> Tuple[bool, Optional[bytes]]:
+    """Return whether member ``name`` equals ``info`` of the source archive ``src_zip``.
 
-def save_document(doc: Document, path_out: Path) -> None:
-    """Save ``doc`` to ``path_out``."""
-    doc.save(str(path_out))
+    The second item is the member's content when it had to be produced for
+    the comparison, so callers don't serialize it twice.
+    """
+    if info is None:
+        return False, None
+    if name in source.blobs:
+        data = item.blob
+        return data is source.blobs[name] or (
+            len(data) == info.file_size and zlib.crc32(data) == info.CRC
+        ), data
+    if name in source.fingerprints:
+        data = _member_blob(item)
+        fingerprint = (zlib.crc32(data), len(data))
+        # byte for byte the stored member, e.g. a file saved by python-docx
+        if fingerprint == (info.CRC, info.file_size):
+            return True, data
+        return fingerprint == source.fingerprint(name, src_zip), data
+    return False, None
+
+
+def save_document(
+    doc: Document, path_out: Path, compresslevel: Optional[int] = None
+) -> Dict[str, int]:
+    """Save ``doc`` to ``path_out`` and return how many members were copied.
+
+    For documents opened with :func:`load_document` every member whose
+    content is unchanged is copied compressed from the original archive, so
+    untouched media, fonts and XML parts are neither recompressed nor, for
+    binary parts, rehashed. Only modified members are deflated, using
+    ``compresslevel`` when given. XML parts are still serialized to detect
+    changes since lxml keeps no dirty flag; the original member is only
+    parsed for comparison when the bytes differ. Members that cannot be
+    copied raw are recompressed instead. The file is written to a temporary
+    name first so saving over the source is safe.
+    """
+    path_out = Path(path_out)
+    package = doc.part.package
+    for part in package.parts:
+        part.before_marshal()
+    source = _SOURCES.get(package)
+    src_zip = None
+    if source is not None:
+        try:
+            src_zip = source.open()
+        except OSError as e:
+            logging.warning("Recompressing all parts: %s", e)
+
+    stats = {"copied": 0, "written": 0}
+    try:
+        with atomic.atomic_write(path_out) as fh, zipfile.ZipFile(
+            fh, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=compresslevel
+        ) as dst:
+            for name, item in _package_members(package):
+                info = None
+                if src_zip is not None:
+                    try:
+                        info = src_zip.getinfo(name)
+                    except KeyError:
+                        info = None
+                unchanged, data = _compare_member(source, src_zip, info, name, item)
+                if unchanged and _try_copy_raw_member(src_zip, info, dst):
+                    stats["copied"] += 1
+                else:
+                    dst.writestr(name, data if data is not None else _member_blob(item))
+                    stats["written"] += 1
+    finally:
+        if src_zip is not None:
+            src_zip.close()
+    return stats
 
 
 def replace_text_in_paragraphs(paragraphs, search_text, replace_text):
@@ -41,7 +348,6 @@ def update_front_cover(
     try:
         from docx.enum.text import WD_ALIGN_PARAGRAPH
         from docx.oxml import OxmlElement
-        from docx.oxml.ns import qn
     except Exception:
         WD_ALIGN_PARAGRAPH = None  # type: ignore
 
@@ -168,11 +474,15 @@ def insert_presidents_message(
 
 def extract_article_titles_from_toc(doc: Document) -> List[str]:
     """Return article titles listed under the ARTICLES section in the TOC."""
+    return _toc_titles([p.text for p in doc.paragraphs])
+
+
+def _toc_titles(texts: List[str]) -> List[str]:
+    """Return the TOC article titles found in the paragraph ``texts``."""
     toc_start = None
-    paragraphs = doc.paragraphs
     # locate table of contents
-    for i, p in enumerate(paragraphs):
-        if "TABLE OF CONTENTS" in p.text.upper():
+    for i, text in enumerate(texts):
+        if "TABLE OF CONTENTS" in text.upper():
             toc_start = i
             break
     if toc_start is None:
@@ -180,8 +490,8 @@ def extract_article_titles_from_toc(doc: Document) -> List[str]:
 
     # find ARTICLES heading within TOC
     start = None
-    for j in range(toc_start + 1, len(paragraphs)):
-        text = paragraphs[j].text.strip()
+    for j in range(toc_start + 1, len(texts)):
+        text = texts[j].strip()
         if text.upper().startswith("ARTICLES"):
             start = j + 1
             break
@@ -189,10 +499,8 @@ def extract_article_titles_from_toc(doc: Document) -> List[str]:
         return []
 
     titles: List[str] = []
-    import re
-
-    for k in range(start, len(paragraphs)):
-        line = paragraphs[k].text.strip()
+    for k in range(start, len(texts)):
+        line = texts[k].strip()
         if not line:
             break
         if line.isupper():
@@ -206,173 +514,149 @@ def extract_article_titles_from_toc(doc: Document) -> List[str]:
     return titles
 
 
-def clear_articles(doc: Document):
-    """Remove article sections based on TOC titles if available."""
-    titles = extract_article_titles_from_toc(doc)
-
-    def remove_range(start_p, end_p=None):
-        body = doc.element.body
-        end_el = end_p._element if end_p is not None else None
-        started = False
-        for el in list(body):
-            if el is start_p._element:
-                started = True
-            if not started:
-                continue
-            if el is end_el:
-                break
-            tag = el.tag.rsplit("}", 1)[-1]
-            if tag in ("p", "tbl"):
-                body.remove(el)
+def find_article_boundaries(
+    page_map: "PageMap", limit: Optional[int] = None
+) -> List[Tuple[str, int]]:
+    """Return ``(title, offset)`` for the old articles found in the body.
 
+    Titles come from the TOC and are matched against body paragraphs the same
+    way :func:`clear_articles` does; the ARTICLES heading right before the
+    first match is reported as well. Only elements before ``limit`` are
+    considered. The result is sorted by element offset.
+    """
+    return _article_boundaries(page_map, limit)[1]
+
+
+def _article_boundaries(
+    page_map: "PageMap", limit: Optional[int] = None
+) -> Tuple[List[str], List[Tuple[str, int]]]:
+    limit = len(page_map.elements) if limit is None else limit
+    indices = page_map.paragraph_indices(0, limit)
+    texts = [page_map.text(i) for i in indices]
+    titles = _toc_titles(texts)
+    if not titles:
+        return titles, []
+
+    upper = [t.strip().upper() for t in texts]
+    boundaries: List[Tuple[str, int]] = []
+    heading = None
+    for title in titles:
+        try:
+            k = upper.index(title.upper())
+        except ValueError:
+            continue
+        boundaries.append((title, indices[k]))
+        if heading is None and k > 0 and upper[k - 1] == "ARTICLES":
+            heading = ("ARTICLES", indices[k - 1])
+    boundaries.sort(key=lambda b: b[1])
+    if heading is not None and (not boundaries or heading[1] < boundaries[0][1]):
+        boundaries.insert(0, heading)
+    return titles, boundaries
+
+
+def _clear_articles_start(page_map: "PageMap", limit: Optional[int] = None) -> Optional[int]:
+    """Return the offset from which :func:`clear_articles` removes content."""
+    limit = len(page_map.elements) if limit is None else limit
+    titles, boundaries = _article_boundaries(page_map, limit)
     if titles:
-        article_heading_idx = None
-
-        # find start indices of each article title and detect the heading
-        start_indices = []
-        for title in titles:
-            for i, p in enumerate(doc.paragraphs):
-                if p.text.strip().upper() == title.upper():
-                    start_indices.append(i)
-                    if article_heading_idx is None and i > 0:
-                        prev = doc.paragraphs[i - 1].text.strip().upper()
-                        if prev == "ARTICLES":
-                            article_heading_idx = i - 1
-                    break
-        start_indices.sort()
-        if article_heading_idx is not None and (
-            not start_indices or article_heading_idx < start_indices[0]
-        ):
-            start_indices.insert(0, article_heading_idx)
-
-        start_paragraphs = [doc.paragraphs[i] for i in start_indices]
-        for idx in reversed(range(len(start_paragraphs))):
-            start_p = start_paragraphs[idx]
-            end_p = (
-                start_paragraphs[idx + 1] if idx + 1 < len(start_paragraphs) else None
-            )
-            remove_range(start_p, end_p)
-        return
+        return boundaries[0][1] if boundaries else None
 
     # fallback to previous behaviour if we cannot parse TOC
-    found = False
-    start_idx = 0
-    for i, p in enumerate(doc.paragraphs):
-        if "ARTICLES" in p.text.upper():
-            found = True
-            start_idx = i
-            break
-    if found:
-        remove_range(doc.paragraphs[start_idx])
+    for i in page_map.paragraph_indices(0, limit):
+        if "ARTICLES" in page_map.text(i).upper():
+            return i
+    return None
 
 
-def clear_articles_preserve_editorials(doc: Document) -> None:
-    """Remove article content while keeping editorial sections."""
+def clear_articles(doc: Document):
+    """Remove article sections based on TOC titles if available."""
+    page_map = scan_pages(doc)
+    start = _clear_articles_start(page_map)
+    if start is None:
+        return
+    keep = (_W_P, qn("w:tbl"))
+    for i in range(start, len(page_map.elements)):
+        if page_map.elements[i].tag in keep:
+            page_map.delete_range(i, i + 1)
 
-    headings = ["President's Message"]
-    pages = map_pages_to_paragraphs(doc)
-    para_index = {id(p): i for i, p in enumerate(doc.paragraphs)}
+
+def _editorial_clear_start(
+    page_map: "PageMap", limit: Optional[int] = None
+) -> Tuple[Optional[int], bool]:
+    """Return where :func:`clear_articles_preserve_editorials` starts removing.
+
+    The second item is ``True`` when the editorial-aware search succeeded and
+    ``False`` when the TOC based :func:`clear_articles` fallback applies.
+    """
+    headings = ["president's message"]
+    limit = len(page_map.elements) if limit is None else limit
+    indices = page_map.paragraph_indices(0, limit)
 
     last_editorial_page = 0
-    for page_num, paragraphs in pages.items():
-        for p in paragraphs:
-            text = p.text.strip().lower()
-            if text in [h.lower() for h in headings] or "editorial" in text:
-                if page_num > last_editorial_page:
-                    last_editorial_page = page_num
-
-    if last_editorial_page == 0:
-        clear_articles(doc)
-        return
+    for i in indices:
+        text = page_map.text(i).strip().lower()
+        if text in headings or "editorial" in text:
+            last_editorial_page = max(last_editorial_page, page_map.page_of(i))
 
-    article_start_idx = None
-    for page in sorted(pages):
-        if page >= last_editorial_page:
-            for p in pages[page]:
-                if p.text.strip().upper() == "ARTICLES":
-                    article_start_idx = para_index.get(id(p))
-                    break
-            if article_start_idx is not None:
-                break
+    if last_editorial_page:
+        start, _ = page_map.span(last_editorial_page)
+        for i in indices:
+            if i >= start and page_map.text(i).strip().upper() == "ARTICLES":
+                return i, True
+    return _clear_articles_start(page_map, limit), False
 
-    if article_start_idx is None:
-        clear_articles(doc)
-        return
 
-    def remove_paragraph(paragraph):
-        el = paragraph._element
-        el.getparent().remove(el)
+def clear_articles_preserve_editorials(doc: Document) -> None:
+    """Remove article content while keeping editorial sections."""
 
-    for _ in range(len(doc.paragraphs) - article_start_idx):
-        remove_paragraph(doc.paragraphs[article_start_idx])
+    page_map = scan_pages(doc)
+    start, found = _editorial_clear_start(page_map)
+    if not found:
+        clear_articles(doc)
+        return
+    page_map.delete_range(start)
 
 
 def load_instructions(content_path: Path) -> dict:
-    """Load instructions from ``instructions.json`` if present."""
-    inst_file = content_path / "instructions.json"
-    if inst_file.exists():
-        try:
-            with inst_file.open("r", encoding="utf-8") as f:
-                data = json.load(f)
-                if "format_front_and_footer" in data and not isinstance(
-                    data["format_front_and_footer"], dict
-                ):
-                    data["format_front_and_footer"] = {}
-                return data
-        except Exception as e:
-            print(f"Failed to read instructions: {e}")
+    """Load instructions from ``instructions.json`` if present.
+
+    Returns the validated settings as a dictionary; use
+    :meth:`Instructions.load` to get the typed object and its errors.
+    """
+    try:
+        return Instructions.load(content_path).to_dict()
+    except InstructionsError as e:
+        print(f"Failed to read instructions: {e}")
     return {}
 
 
 def delete_after_page(doc: Document, page_number: int) -> None:
-    """Remove all paragraphs after ``page_number``.
+    """Remove all content after ``page_number``.
 
-    The function relies on :func:`map_pages_to_paragraphs` to determine the first
-    paragraph of the next page and deletes everything that follows.
+    The function relies on :func:`scan_pages` to determine where the next
+    page starts and deletes every body element that follows, tables included.
     """
 
-    pages = map_pages_to_paragraphs(doc)
-
-    # Find the first page that comes after ``page_number``
-    next_page = None
-    for num in sorted(pages):
-        if num > page_number:
-            next_page = num
-            break
-
-    if next_page is None:
-        return
-
-    paragraphs = pages.get(next_page)
-    if not paragraphs:
+    page_map = scan_pages(doc)
+    next_page = max(page_number + 1, 1)
+    if next_page not in page_map:
         return
 
-    first_el = paragraphs[0]._element
-    idx = None
-    for i, p in enumerate(doc.paragraphs):
-        if p._element is first_el:
-            idx = i
-            break
-
-    if idx is None:
+    start, end = page_map.span(next_page)
+    if start == end:
         return
-
-    while len(doc.paragraphs) > idx:
-        el = doc.paragraphs[idx]._element
-        el.getparent().remove(el)
+    page_map.delete_range(start)
 
 
 def _find_last_editorial_page(doc: Document) -> Optional[int]:
     """Return the last page number containing an editorial heading."""
 
-    pages = map_pages_to_paragraphs(doc)
+    page_map = scan_pages(doc)
     last = None
-    for page_num, paragraphs in pages.items():
-        for p in paragraphs:
-            text = p.text.strip().lower()
-            if "editorial" in text or "president's message" in text:
-                if last is None or page_num > last:
-                    last = page_num
+    for i in page_map.paragraph_indices():
+        text = page_map.text(i).strip().lower()
+        if "editorial" in text or "president's message" in text:
+            last = page_map.page_of(i)
     return last
 
 
@@ -387,50 +671,112 @@ def delete_after_editorial(doc: Document) -> None:
 def _is_line_paragraph(paragraph) -> bool:
     """Return ``True`` if ``paragraph`` represents a horizontal line."""
 
-    text = paragraph.text.strip()
+    return _is_line_element(paragraph._p, paragraph.text)
+
+
+_CSS_LENGTH = re.compile(r"^\s*(-?[\d.]+)\s*(pt|in|cm|mm|px|%)?\s*$")
+_PT_PER_UNIT = {"pt": 1.0, "in": 72.0, "cm": 72 / 2.54, "mm": 72 / 25.4, "px": 0.75, None: 0.75}
+_EMU_PER_PT = 12700
+# thickest and shortest shape still taken for a horizontal rule, in points
+_RULE_HEIGHT = 3
+_RULE_WIDTH = 36
+
+
+def _css_points(style: str, name: str) -> Optional[float]:
+    """Return the ``name`` length of a VML ``style`` in points.
+
+    Percentages count as full width; ``None`` if the length is missing.
+    """
+    for item in style.split(";"):
+        key, _, value = item.partition(":")
+        if key.strip().lower() != name:
+            continue
+        match = _CSS_LENGTH.match(value)
+        if match is None:
+            return None
+        number, unit = float(match.group(1)), match.group(2)
+        return float("inf") if unit == "%" and number > 0 else number * _PT_PER_UNIT.get(unit, 0)
+    return None
+
+
+def _is_rule_shape(shape) -> bool:
+    """Return ``True`` if the VML or DrawingML ``shape`` draws a horizontal rule."""
+    tag = shape.tag.rsplit("}", 1)[-1]
+    if tag == "rect" and shape.get(f"{{{xpaths.NS['o']}}}hr") in ("t", "true"):
+        return True
+    if tag == "line":
+        start = shape.get("from", "0,0").split(",")
+        end = shape.get("to", "0,0").split(",")
+        return len(start) == 2 and len(end) == 2 and start[1] == end[1] and start[0] != end[0]
+    if tag == "wsp":
+        geom = xpaths.SHAPE_GEOMETRY(shape)
+        ext = xpaths.SHAPE_EXTENT(shape)
+        if not geom or not ext:
+            return False
+        cx, cy = int(ext[0].get("cx", 0)), int(ext[0].get("cy", 0))
+        if geom[0] in ("line", "straightConnector1"):
+            return cx > cy
+        return cy <= _RULE_HEIGHT * _EMU_PER_PT and cx >= _RULE_WIDTH * _EMU_PER_PT
+    style = shape.get("style", "")
+    height, width = _css_points(style, "height"), _css_points(style, "width")
+    return (
+        height is not None and width is not None
+        and height <= _RULE_HEIGHT and width >= _RULE_WIDTH
+    )
+
+
+def _is_line_element(p, text: str) -> bool:
+    """Return ``True`` if the ``w:p`` element ``p`` with ``text`` is a line.
+
+    A line is a paragraph with a bottom border, a run of at least three
+    dashes or underscores, or nothing but a horizontal VML/DrawingML rule
+    such as :func:`make_article_title` draws.
+    """
+
+    text = text.strip()
     if text and len(text) >= 3 and all(ch in "-_—–" for ch in text):
         return True
-    try:
-        from docx.oxml.ns import qn
-    except Exception:
-        return False
-    pPr = paragraph._p.pPr
-    if pPr is not None:
-        for b in pPr.findall(qn("w:pBdr")):
-            bottom = b.find(qn("w:bottom"))
-            if bottom is not None and bottom.get(qn("w:val")) != "nil":
-                return True
-    return False
+    if xpaths.HAS_BOTTOM_BORDER(p):
+        return True
+    return not text and any(_is_rule_shape(s) for s in xpaths.LINE_SHAPES(p))
 
 
 def cleanup_black_lines(doc: Document) -> None:
-    """Remove duplicate horizontal lines from each page."""
-
-    pages = map_pages_to_paragraphs(doc)
-    for paragraphs in pages.values():
-        found = False
-        for p in list(paragraphs):
-            if _is_line_paragraph(p):
-                if found:
-                    el = p._element
-                    el.getparent().remove(el)
-                else:
-                    found = True
+    """Remove duplicate horizontal lines from each page.
+
+    One query selects every paragraph that may be a line; their pages are
+    looked up in a single walk over the page map and all but the first line
+    of each page are removed.
+    """
+
+    page_map = scan_pages(doc)
+    candidates = xpaths.LINE_CANDIDATES(doc.element.body)
+    if len(candidates) < 2:
+        return
+    seen = set()
+    for p, page in zip(candidates, page_map.pages_of(candidates)):
+        text = "".join(t.text or "" for t in p.iter(_W_T))
+        if page is None or not _is_line_element(p, text):
+            continue
+        if page in seen:
+            p.getparent().remove(p)
+        else:
+            seen.add(page)
 
 
 def remove_pages_from(doc: Document, start_page: int) -> int:
     """Remove all pages beginning with ``start_page`` and return insertion index."""
-    pages = map_pages_to_paragraphs(doc)
-    paragraphs = pages.get(start_page)
-    if not paragraphs:
+    page_map = scan_pages(doc)
+    if start_page not in page_map or not page_map.paragraph_indices(
+        *page_map.span(start_page)
+    ):
         return len(doc.paragraphs)
-    first_p = paragraphs[0]
-    idx = doc.paragraphs.index(first_p)
-    while len(doc.paragraphs) > idx:
-        el = doc.paragraphs[idx]._element
-        el.getparent().remove(el)
+    start, _ = page_map.span(start_page)
+    idx = page_map.paragraph_count_before(start)
+    page_map.delete_range(start)
     return idx
-  
+
+
 def apply_basic_formatting(
     doc: Document, font_size: Optional[int], line_spacing: Optional[float]
 ) -> None:
@@ -443,14 +789,145 @@ def apply_basic_formatting(
                 run.font.size = Pt(font_size)
 
 
+ARTICLES_BOOKMARK = "_JournalUpdaterArticles"
+
+
+# attributes holding the relationship id of a picture
+_IMAGE_REF_ATTRS = (qn("r:embed"), qn("r:link"), qn("r:id"))
+
+
+def _copy_image_part(doc: Document, target) -> str:
+    """Relate a copy of the image part ``target`` to ``doc`` and return its rId."""
+    from docx.image.exceptions import UnrecognizedImageError
+    from docx.opc.constants import RELATIONSHIP_TYPE as RT
+    from docx.parts.image import ImagePart
+
+    try:
+        rid, _ = doc.part.get_or_add_image(io.BytesIO(target.blob))
+        return rid
+    except UnrecognizedImageError:  # EMF, WMF, SVG, ...
+        package = doc.part.package
+        partname = package.next_partname(f"/word/media/image%d.{target.partname.ext}")
+        part = ImagePart(partname, target.content_type, target.blob)
+        return doc.part.relate_to(part, RT.IMAGE)
+
+
+def _import_images(doc: Document, article_doc: Document, element, rids: dict) -> None:
+    """Point the picture references in ``element`` at images copied into ``doc``.
+
+    ``rids`` maps the article's relationship ids to the new ones (``None`` for
+    relationships that are not embedded images) and is shared by all blocks
+    of one article.
+    """
+    from docx.opc.constants import RELATIONSHIP_TYPE as RT
+
+    rels = article_doc.part.rels
+    for node in element.iter():
+        for attr in _IMAGE_REF_ATTRS:
+            rid = node.get(attr)
+            if rid is None:
+                continue
+            if rid not in rids:
+                rel = rels.get(rid)
+                if rel is None or rel.is_external or rel.reltype != RT.IMAGE:
+                    rids[rid] = None
+                else:
+                    rids[rid] = _copy_image_part(doc, rel.target_part)
+            if rids[rid] is not None:
+                node.set(attr, rids[rid])
+
+
 def append_article(doc: Document, article_doc: Document):
-    for element in article_doc.element.body:
-        doc.element.body.append(element)
+    body = doc.element.body
+    tail = body.find(qn("w:sectPr"))
+    rids: dict = {}
+    for element in list(article_doc.element.body):
+        # the article's own section settings would end up mid-body
+        if element.tag == qn("w:sectPr"):
+            continue
+        _import_images(doc, article_doc, element, rids)
+        if tail is not None:
+            tail.addprevious(element)
+        else:
+            body.append(element)
+
+
+def _mark_imported(doc: Document, first) -> None:
+    """Place the hidden ``ARTICLES_BOOKMARK`` at the body element ``first``."""
+    from docx.oxml import OxmlElement
+
+    body = doc.element.body
+    ids = [0]
+    for mark in body.iter(qn("w:bookmarkStart")):
+        if mark.get(qn("w:name")) == ARTICLES_BOOKMARK:
+            mark_id = mark.get(qn("w:id"))
+            for end in body.iter(qn("w:bookmarkEnd")):
+                if end.get(qn("w:id")) == mark_id:
+                    end.getparent().remove(end)
+                    break
+            mark.getparent().remove(mark)
+        else:
+            try:
+                ids.append(int(mark.get(qn("w:id"))))
+            except (TypeError, ValueError):
+                pass
+    start = OxmlElement("w:bookmarkStart")
+    start.set(qn("w:id"), str(max(ids) + 1))
+    start.set(qn("w:name"), ARTICLES_BOOKMARK)
+    end = OxmlElement("w:bookmarkEnd")
+    end.set(qn("w:id"), str(max(ids) + 1))
+    target = next(first.iter(qn("w:p")), None)
+    if target is None:
+        first.addprevious(start)
+        first.addprevious(end)
+        return
+    pPr = target.find(qn("w:pPr"))
+    index = 1 if pPr is not None else 0
+    target.insert(index, end)
+    target.insert(index, start)
+
+
+def _imported_articles_start(page_map: "PageMap") -> Optional[int]:
+    """Return the offset of the block holding ``ARTICLES_BOOKMARK``, if any."""
+    for mark in page_map.doc.element.body.iter(qn("w:bookmarkStart")):
+        if mark.get(qn("w:name")) == ARTICLES_BOOKMARK:
+            return page_map.index_of(mark)
+    return None
+
+
+def remove_imported_articles(doc: Document) -> bool:
+    """Delete the articles a previous run imported.
+
+    The region starts at the ``ARTICLES_BOOKMARK`` placed by
+    :func:`import_articles` and runs to the end of the document. Returns
+    ``True`` if the bookmark was found.
+    """
+    body = doc.element.body
+    for mark in body.iter(qn("w:bookmarkStart")):
+        if mark.get(qn("w:name")) == ARTICLES_BOOKMARK:
+            break
+    else:
+        return False
+    block = mark
+    while block.getparent() is not body:
+        block = block.getparent()
+    for el in list(block.itersiblings()):
+        if el.tag != _W_SECTPR:
+            body.remove(el)
+    body.remove(block)
+    return True
 
 
 def import_articles(doc: Document, paths: List[Path]) -> None:
-    """Append articles from ``paths`` into ``doc`` after cleaning headers."""
+    """Append articles from ``paths`` into ``doc`` after cleaning headers.
+
+    The first imported block is marked with a hidden bookmark so a later run
+    can replace the articles with :func:`remove_imported_articles`.
+    """
     paths = sorted(paths, key=lambda p: p.name.lower())
+    body = doc.element.body
+    tail = body.find(qn("w:sectPr"))
+    last = tail.getprevious() if tail is not None else (body[-1] if len(body) else None)
     for path in paths:
         article_doc = Document(path)
         for section in article_doc.sections:
@@ -461,76 +938,295 @@ def import_articles(doc: Document, paths: List[Path]) -> None:
             for p in list(footer.paragraphs):
                 p._element.getparent().remove(p._element)
             sectPr = section._sectPr
-            try:
-                from docx.oxml.ns import qn
-
-                for tag in ("headerReference", "footerReference"):
-                    for ref in sectPr.findall(qn(f"w:{tag}")):
-                        sectPr.remove(ref)
-            except Exception:
-                pass
+            for tag in ("headerReference", "footerReference"):
+                for ref in sectPr.findall(qn(f"w:{tag}")):
+                    sectPr.remove(ref)
         append_article(doc, article_doc)
+    first = last.getnext() if last is not None else (body[0] if len(body) else None)
+    if first is not None and first is not tail:
+        _mark_imported(doc, first)
 
 
-def find_article_files(content_path: Path) -> List[Path]:
-    """Return article files matching ``article*.docx`` case-insensitively."""
-    pattern = "article"
-    files = sorted(
-        p
-        for p in content_path.iterdir()
-        if p.is_file()
-        and p.name.lower().startswith(pattern)
-        and p.suffix.lower() == ".docx"
-    )
+# optimized pictures kept between runs; hidden so the content scan skips it
+IMAGE_CACHE = ".image_cache"
+
+
+def _content_articles(content: ContentFolder) -> List[Path]:
+    files = content.articles
     if not files:
         logging.warning(
-            "No article files found matching '%s*.docx' in %s", pattern, content_path
+            "No article files found matching 'article*.docx' in %s", content.root
         )
     return files
 
 
+def find_article_files(content_path: Path, recursive: bool = False) -> List[Path]:
+    """Return article files matching ``article*.docx`` case-insensitively.
+
+    The folder is read through :func:`scan_content`; ``recursive`` includes
+    articles in subfolders.
+    """
+    return _content_articles(scan_content(content_path, recursive))
+
+
+class PageMap:
+    """Compact page table produced by :func:`scan_pages`.
+
+    ``elements`` holds the block-level children of the document body
+    (paragraphs, tables, content controls) in document order and ``starts`` is
+    an ``array('I')`` with the offset of the first element of each page, so
+    page ``n`` covers ``elements[starts[n - 1]:starts[n]]``. Lookups from an
+    element offset to its page use binary search and ``Paragraph`` proxies
+    are only created when a caller asks for them.
+
+    The table describes the body at scan time; rescan after adding or
+    removing elements.
+    """
+
+    def __init__(self, doc: Document, elements: list, starts: "array"):
+        self.doc = doc
+        self.elements = elements
+        self.starts = starts
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __contains__(self, page: int) -> bool:
+        return 1 <= page <= len(self.starts)
+
+    @property
+    def pages(self) -> range:
+        """Page numbers present in the document, starting at 1."""
+        return range(1, len(self.starts) + 1)
+
+    def span(self, page: int) -> Tuple[int, int]:
+        """Return the half-open ``(start, end)`` element range of ``page``."""
+        start = self.starts[page - 1]
+        end = self.starts[page] if page < len(self.starts) else len(self.elements)
+        return start, end
+
+    def page_of(self, index: int) -> int:
+        """Return the page holding the element at offset ``index``."""
+        return bisect_right(self.starts, index)
+
+    def index_of(self, element) -> Optional[int]:
+        """Return the offset of the body element containing ``element``."""
+        body = self.doc.element.body
+        while element is not None and element.getparent() is not body:
+            element = element.getparent()
+        if element is None:
+            return None
+        index = body.index(element)
+        # ``elements`` skips non-block children such as the body ``sectPr``
+        # and comments, so walk back to the matching offset if needed.
+        index = min(index, len(self.elements) - 1)
+        while index >= 0 and self.elements[index] is not element:
+            index -= 1
+        return index if index >= 0 else None
+
+    def pages_of(self, blocks) -> List[Optional[int]]:
+        """Return the page of each top-level block in ``blocks``.
+
+        ``blocks`` must be in document order, as query results are, so the
+        element table is walked only once for all of them. Blocks not in the
+        map get ``None``.
+        """
+        pages: List[Optional[int]] = []
+        elements = self.elements
+        count = len(elements)
+        i = 0
+        for block in blocks:
+            j = i
+            while j < count and elements[j] is not block:
+                j += 1
+            if j == count:
+                pages.append(None)
+                continue
+            pages.append(self.page_of(j))
+            i = j + 1
+        return pages
+
+    def page_of_element(self, element) -> Optional[int]:
+        """Return the page of ``element`` or ``None`` if it is not in the body."""
+        index = self.index_of(element)
+        return self.page_of(index) if index is not None else None
+
+    def elements_on(self, page: int) -> list:
+        """Return the body elements that start on ``page``."""
+        if page not in self:
+            return []
+        start, end = self.span(page)
+        return self.elements[start:end]
+
+    def is_paragraph(self, index: int) -> bool:
+        """Return ``True`` if the element at ``index`` is a ``w:p``."""
+        return self.elements[index].tag == _W_P
+
+    def paragraph(self, index: int) -> "Paragraph":
+        """Return a ``Paragraph`` proxy for the element at ``index``."""
+        from docx.text.paragraph import Paragraph
+
+        return Paragraph(self.elements[index], self.doc._body)
+
+    def text(self, index: int) -> str:
+        """Return the text of the element at ``index`` without a proxy."""
+        return "".join(t.text or "" for t in self.elements[index].iter(_W_T))
+
+    def paragraph_indices(self, start: int = 0, end: Optional[int] = None) -> List[int]:
+        """Return offsets of the top-level paragraphs within ``[start, end)``."""
+        end = len(self.elements) if end is None else end
+        return [i for i in range(start, end) if self.elements[i].tag == _W_P]
+
+    def paragraphs_on(self, page: int) -> List["Paragraph"]:
+        """Return ``Paragraph`` objects for the top-level paragraphs on ``page``."""
+        if page not in self:
+            return []
+        return [self.paragraph(i) for i in self.paragraph_indices(*self.span(page))]
+
+    def paragraph_count_before(self, index: int) -> int:
+        """Return how many top-level paragraphs precede offset ``index``."""
+        return len(self.paragraph_indices(0, index))
+
+    def delete_range(self, start: int, end: Optional[int] = None) -> None:
+        """Remove the body elements in ``[start, end)`` from the document.
+
+        The map itself is left untouched and is stale afterwards.
+        """
+        end = len(self.elements) if end is None else end
+        for el in self.elements[start:end]:
+            parent = el.getparent()
+            if parent is not None:
+                parent.remove(el)
+
+
+_W_P = qn("w:p")
+_W_T = qn("w:t")
+_W_BR = qn("w:br")
+_W_SECTPR = qn("w:sectPr")
+_W_LRPB = qn("w:lastRenderedPageBreak")
+_W_PBB = qn("w:pageBreakBefore")
+_BREAK_TAGS = (_W_T, _W_BR, _W_LRPB, _W_PBB, _W_SECTPR)
+
+
+class _BlockBreaks:
+    """Page-break flags of one top-level body block, fed node by node."""
+
+    __slots__ = ("block", "before", "after", "seen_text")
+
+    def __init__(self, block):
+        self.block = block
+        self.before = False
+        self.after = False
+        self.seen_text = False
+
+    def feed(self, node) -> None:
+        tag = node.tag
+        if tag == _W_T:
+            if node.text:
+                self.seen_text = True
+        elif tag == _W_BR:
+            if node.get(qn("w:type")) == "page":
+                self.after = True
+        elif tag == _W_LRPB:
+            if self.seen_text:
+                self.after = True
+            else:
+                self.before = True
+        elif tag == _W_PBB:
+            owner = node.getparent().getparent()
+            if owner is self.block and node.get(qn("w:val")) not in ("0", "false", "off"):
+                self.before = True
+        elif tag == _W_SECTPR:
+            kind = node.find(qn("w:type"))
+            val = kind.get(qn("w:val")) if kind is not None else "nextPage"
+            if val not in ("continuous", "nextColumn"):
+                self.after = True
+
+
+class _PageCounter:
+    """Turns the break flags of consecutive blocks into page numbers."""
+
+    __slots__ = ("page", "count", "pending")
+
+    def __init__(self):
+        self.page = 1
+        self.count = 0
+        self.pending = False
+
+    def place(self, before: bool, after: bool) -> int:
+        """Return the page of the next block given its break flags."""
+        if (before or self.pending) and self.count:
+            self.page += 1
+            self.count = 0
+        self.count += 1
+        self.pending = after
+        return self.page
+
+
+def scan_pages(doc: Document) -> PageMap:
+    """Scan the document body once and return its :class:`PageMap`.
+
+    A page ends after a manual ``w:br w:type="page"``, after a paragraph
+    carrying a section break (``w:sectPr`` inside ``w:pPr``) that is not
+    ``continuous`` or ``nextColumn`` and at Word's cached
+    ``w:lastRenderedPageBreak`` markers. A paragraph with ``w:pageBreakBefore``
+    starts a new page. Tables and content controls are placed on the page they
+    start on and breaks inside them are honoured as well. Several sources
+    describing the same boundary, such as a manual break followed by Word's
+    rendered marker, only count once.
+
+    Pagination that depends solely on layout cannot be detected, so the
+    result may still undercount pages for documents Word never saved.
+    """
+    elements: list = []
+    starts = array("I", [0])
+    counter = _PageCounter()
+    body = doc.element.body
+    # one query finds the few blocks that can break; the rest are not walked
+    breaking = set(xpaths.BREAK_BLOCKS(body))
+    for el in body.iterchildren():
+        if el.tag == _W_SECTPR or not isinstance(el.tag, str):
+            continue
+        breaks = _BlockBreaks(el)
+        if el in breaking:
+            for node in el.iter(*_BREAK_TAGS):
+                breaks.feed(node)
+        if counter.place(breaks.before, breaks.after) > len(starts):
+            starts.append(len(elements))
+        elements.append(el)
+    if counter.pending:
+        starts.append(len(elements))
+
+    return PageMap(doc, elements, starts)
+
+
 def map_pages_to_paragraphs(doc: Document) -> Dict[int, List["Paragraph"]]:
     """Return a mapping of page numbers to paragraph objects.
 
-    The detection relies on explicit ``w:br`` elements with ``w:type="page"``
-    inserted by Word when a manual page break is present. If the document
-    pagination depends solely on layout, the mapping may be inaccurate.
+    This is a compatibility view over :func:`scan_pages`; new code should use
+    the :class:`PageMap` directly instead of materialising every paragraph.
     """
 
-    pages: Dict[int, List["Paragraph"]] = {1: []}
-    current_page = 1
-    for p in doc.paragraphs:
-        pages.setdefault(current_page, []).append(p)
-        if p._element.xpath('.//w:br[@w:type="page"]'):
-            current_page += 1
-            pages.setdefault(current_page, [])
-    return pages
+    page_map = scan_pages(doc)
+    return {page: page_map.paragraphs_on(page) for page in page_map.pages}
 
 
 def autofit_first_table(doc: Document, page_num: int) -> None:
     """Autofit the first table on ``page_num`` if one exists."""
 
-    pages = map_pages_to_paragraphs(doc)
-    if page_num not in pages:
+    page_map = scan_pages(doc)
+    if page_num not in page_map:
         return
 
-    para_to_page = {p._element: n for n, ps in pages.items() for p in ps}
-
     try:
         from docx.table import Table
         from docx.oxml import OxmlElement
-        from docx.oxml.ns import qn
     except Exception:  # pragma: no cover - python-docx not installed
         Table = None  # type: ignore
 
-    current_page = 1
-    for el in doc.element.body.iterchildren():
+    for el in page_map.elements_on(page_num):
         tag = el.tag.rsplit("}", 1)[-1]
-        if tag == "p" and el in para_to_page:
-            current_page = para_to_page[el]
-            if el.xpath('.//w:br[@w:type="page"]'):
-                current_page += 1
-        elif tag == "tbl" and current_page == page_num and Table is not None:
+        if tag == "tbl" and Table is not None:
             try:
                 table = Table(el, doc)
                 try:
@@ -546,7 +1242,7 @@ def autofit_first_table(doc: Document, page_num: int) -> None:
                             layout = OxmlElement("w:tblLayout")
                             tbl_pr.append(layout)
                         layout.set(qn("w:type"), "autofit")
-                        for col in table._tbl.findall(qn("w:gridCol")):
+                        for col in xpaths.GRID_COLS(table._tbl):
                             col.set(qn("w:w"), "0")
                     except Exception:
                         pass
@@ -579,22 +1275,24 @@ def set_font_family(doc: Document, start_paragraph: int, font_name: str) -> None
 def set_font_size_from_page(doc: Document, page_num: int, size: int) -> None:
     """Apply ``size`` point font to all paragraphs on and after ``page_num``."""
 
-    pages = map_pages_to_paragraphs(doc)
-    for num in sorted(pages):
-        if num >= page_num:
-            for p in pages[num]:
-                for run in p.runs:
-                    run.font.size = Pt(size)
+    page_map = scan_pages(doc)
+    if page_num > len(page_map):
+        return
+    start, _ = page_map.span(max(page_num, 1))
+    for i in page_map.paragraph_indices(start):
+        for run in page_map.paragraph(i).runs:
+            run.font.size = Pt(size)
 
 
 def set_line_spacing_from_page(doc: Document, page_num: int, spacing: float) -> None:
     """Set line spacing for paragraphs on and after ``page_num``."""
 
-    pages = map_pages_to_paragraphs(doc)
-    for num in sorted(pages):
-        if num >= page_num:
-            for p in pages[num]:
-                p.paragraph_format.line_spacing = spacing
+    page_map = scan_pages(doc)
+    if page_num > len(page_map):
+        return
+    start, _ = page_map.span(max(page_num, 1))
+    for i in page_map.paragraph_indices(start):
+        page_map.paragraph(i).paragraph_format.line_spacing = spacing
 
 
 def format_front_and_footer(
@@ -623,22 +1321,91 @@ def format_front_and_footer(
                     run.font.size = Pt(font_size)
 
 
+GENERATED_PREFIX = "journal_updater:"
+_VML_SHAPE = f"{{{fragments.VML}}}shape"
+
+
+def _mark_generated(el, kind: str) -> None:
+    """Tag the generated ``w:tbl`` or ``w:pict`` element ``el`` as ``kind``.
+
+    Tables carry the marker as their ``w:tblCaption`` and pictures as the
+    ``alt`` text of their VML shapes, so it survives saving and reloading.
+    """
+    from docx.oxml import OxmlElement
+
+    marker = GENERATED_PREFIX + kind
+    if el.tag == qn("w:tbl"):
+        tblPr = el.find(qn("w:tblPr"))
+        if tblPr is None:
+            tblPr = OxmlElement("w:tblPr")
+            el.insert(0, tblPr)
+        for old in tblPr.findall(qn("w:tblCaption")):
+            tblPr.remove(old)
+        caption = OxmlElement("w:tblCaption")
+        caption.set(qn("w:val"), marker)
+        tblPr.append(caption)
+    else:
+        for shape in el.iter(_VML_SHAPE):
+            shape.set("alt", marker)
+
+
+def _wrap_generated(p, kind: str):
+    """Wrap the paragraph element ``p`` in a content control tagged ``kind``."""
+    from docx.oxml import OxmlElement
+
+    sdt = OxmlElement("w:sdt")
+    sdt_pr = OxmlElement("w:sdtPr")
+    tag = OxmlElement("w:tag")
+    tag.set(qn("w:val"), GENERATED_PREFIX + kind)
+    sdt_pr.append(tag)
+    content = OxmlElement("w:sdtContent")
+    sdt.append(sdt_pr)
+    sdt.append(content)
+    p.addprevious(sdt)
+    content.append(p)
+    return sdt
+
+
+def find_generated(root, kind: str) -> list:
+    """Return the elements under ``root`` generated as ``kind``.
+
+    Marked tables and content controls are returned as is; for marked shapes
+    the paragraph holding them is returned.
+    """
+    marker = GENERATED_PREFIX + kind
+    tag_tbl, tag_sdt, tag_p = qn("w:tbl"), qn("w:sdt"), qn("w:p")
+    found = []
+    for el in root.iter(tag_tbl, tag_sdt, _VML_SHAPE):
+        if el.tag == tag_tbl:
+            caption = el.find(f"{qn('w:tblPr')}/{qn('w:tblCaption')}")
+            if caption is not None and caption.get(qn("w:val")) == marker:
+                found.append(el)
+        elif el.tag == tag_sdt:
+            tag = el.find(f"{qn('w:sdtPr')}/{qn('w:tag')}")
+            if tag is not None and tag.get(qn("w:val")) == marker:
+                found.append(el)
+        elif el.get("alt") == marker:
+            p = el
+            while p is not None and p.tag != tag_p:
+                p = p.getparent()
+            if p is not None and (not found or found[-1] is not p):
+                found.append(p)
+    return found
+
+
+def remove_generated(root, kind: str) -> int:
+    """Remove the elements :func:`find_generated` returns; return the count."""
+    found = find_generated(root, kind)
+    for el in found:
+        parent = el.getparent()
+        if parent is not None:
+            parent.remove(el)
+    return len(found)
+
+
 def _shape_element(style: str, fill: str = "none", stroke: str = "000000"):
     """Return a ``<w:pict>/<v:shape>`` element with the given style."""
-    from docx.oxml import OxmlElement
-    from docx.oxml.ns import nsmap
-
-    if "v" not in nsmap:
-        nsmap["v"] = "urn:schemas-microsoft-com:vml"
-
-    pict = OxmlElement("w:pict")
-    shape = OxmlElement("v:shape")
-    shape.set("type", "#_x0000_t75")
-    shape.set("style", style)
-    shape.set("strokecolor", stroke)
-    shape.set("fillcolor", fill)
-    pict.append(shape)
-    return pict
+    return fragments.SHAPE.build(style=style, fill=fill, stroke=stroke)
 
 
 def make_article_title() -> "CT_P":
@@ -673,29 +1440,126 @@ def white_header_block(width: int = 468, height: int = 24) -> "CT_P":
 
 
 def insert_article_title(doc: Document, text: str) -> None:
-    """Insert a stylized article title and decorative line."""
+    """Insert a stylized article title and decorative line.
+
+    A title with the same text inserted earlier is replaced rather than
+    duplicated.
+    """
 
     p = doc.add_paragraph(text)
     p.alignment = WD_ALIGN_PARAGRAPH.CENTER
     for r in p.runs:
         r.font.bold = True
-    p._p.append(make_article_title())
+    line = make_article_title()
+    _mark_generated(line, "article_title")
+    p._p.append(line)
+
+    # a title inserted by an earlier run is replaced in place
+    for old in find_generated(doc.element.body, "article_title"):
+        if old is not p._p and "".join(t.text or "" for t in old.iter(_W_T)) == text:
+            old.addprevious(p._p)
+            old.getparent().remove(old)
+            break
 
 
-def reuse_journal_page(doc: Document, source_doc: Document, page_number: int) -> None:
-    """Copy the specified page from ``source_doc`` into ``doc``."""
-    # Complex page-level manipulation is not implemented; placeholder only.
-    pass
+# a TOC line such as "Information for Authors .......... 45"
+_TOC_ENTRY = re.compile(r"(\.{2,}|\t)\s*\d+$")
 
 
-def reuse_info_for_authors(doc: Document, source_doc: Document) -> None:
-    """Insert the 'Information for Authors' section from ``source_doc``."""
-    pass
+def _page_locator(page_number: int):
+    def locate(source: Document) -> list:
+        return scan_pages(source).elements_on(page_number)
+
+    return locate
 
 
-def reuse_membership_app(doc: Document, source_doc: Document) -> None:
+def _section_locator(heading: str):
+    """Find the paragraph starting with ``heading`` and the rest of its page.
+
+    TOC entries naming the section are skipped.
+    """
+    wanted = heading.upper()
+
+    def locate(source: Document) -> list:
+        page_map = scan_pages(source)
+        for index in page_map.paragraph_indices():
+            text = page_map.text(index).strip()
+            if text.upper().startswith(wanted) and not _TOC_ENTRY.search(text):
+                _, end = page_map.span(page_map.page_of(index))
+                return page_map.elements[index:end]
+        return []
+
+    return locate
+
+
+def _reuse_fragment(
+    doc: Document,
+    source: Union[Document, str, Path],
+    name: str,
+    locate,
+    store: Optional[FragmentStore] = None,
+) -> bool:
+    """Insert the fragment ``name`` of ``source`` at the end of ``doc``.
+
+    ``source`` is a path or a document opened with :func:`load_document`.
+    The fragment comes from ``store`` (by default the shared store next to
+    the source file) when it was extracted before; otherwise ``locate`` picks its blocks
+    from the parsed source and the result is stored. Returns ``False`` when
+    the source has no such fragment.
+    """
+    if isinstance(source, (str, Path)):
+        path: Optional[Path] = Path(source)
+    else:
+        origin = _SOURCES.get(source.part.package)
+        path = Path(origin.source) if origin is not None and isinstance(origin.source, str) else None
+    if path is not None and store is None:
+        store = FragmentStore.next_to(path)
+
+    fragment = store.get(path, name) if path is not None else None
+    if fragment is None:
+        source_doc = load_document(path) if isinstance(source, (str, Path)) else source
+        blocks = locate(source_doc)
+        if not blocks:
+            logging.warning("No %s found in %s", name, path or "the source issue")
+            return False
+        fragment = StoredFragment.extract(source_doc.part, blocks)
+        if path is not None:
+            store.put(path, name, fragment)
+    fragment.insert(doc)
+    return True
+
+
+def reuse_journal_page(
+    doc: Document,
+    source_doc: Union[Document, str, Path],
+    page_number: int,
+    store: Optional[FragmentStore] = None,
+) -> bool:
+    """Copy the specified page from ``source_doc`` to the end of ``doc``."""
+    return _reuse_fragment(
+        doc, source_doc, f"page-{page_number}", _page_locator(page_number), store
+    )
+
+
+def reuse_info_for_authors(
+    doc: Document, source_doc: Union[Document, str, Path], store: Optional[FragmentStore] = None
+) -> bool:
+    """Insert the 'Information for Authors' section from ``source_doc``.
+
+    The section runs from its heading to the end of that page.
+    """
+    return _reuse_fragment(
+        doc, source_doc, "info-for-authors", _section_locator("Information for Authors"), store
+    )
+
+
+def reuse_membership_app(
+    doc: Document, source_doc: Union[Document, str, Path], store: Optional[FragmentStore] = None
+) -> bool:
     """Insert the membership application page from ``source_doc``."""
-    pass
+    return _reuse_fragment(
+        doc, source_doc, "membership-app", _section_locator("Membership Application"), store
+    )
 
 
 def add_editor_titles(doc: Document, page: int, editor_titles: List[str]) -> None:
@@ -703,11 +1567,37 @@ def add_editor_titles(doc: Document, page: int, editor_titles: List[str]) -> Non
     pass
 
 
+def find_author_line(doc: Document, page: int, article_index: int):
+    """Return the ``w:p`` of the author line of an article, or ``None``.
+
+    Articles are those listed in the Table of Contents; ``article_index``
+    counts from 0 among the titles on ``page``. The author line is the first
+    paragraph with text after the title.
+    """
+    page_map = scan_pages(doc)
+    if page not in page_map:
+        return None
+    titles = [
+        offset for title, offset in find_article_boundaries(page_map)
+        if title != "ARTICLES" and page_map.page_of(offset) == page
+    ]
+    if not 0 <= article_index < len(titles):
+        return None
+    for i in page_map.paragraph_indices(titles[article_index] + 1):
+        if page_map.text(i).strip():
+            return page_map.elements[i]
+    return None
+
+
 def remove_extra_spaces_in_author_line(
     doc: Document, page: int, article_index: int
-) -> None:
-    """Collapse multiple spaces in the given author line."""
-    pass
+) -> bool:
+    """Collapse multiple spaces in the given author line and trim its ends.
+
+    Returns ``True`` if the line was found and changed.
+    """
+    p = find_author_line(doc, page, article_index)
+    return p is not None and whitespace.normalize_paragraph(p, strip=True)
 
 
 def await_presidents_message_placeholder(doc: Document, page: int) -> None:
@@ -827,17 +1717,38 @@ def normalize_table_formatting(
     pass
 
 
+def normalize_whitespace(doc: Document, pages: Optional[Iterable[int]] = None) -> int:
+    """Collapse repeated spaces in the body, or only on ``pages``.
+
+    Every paragraph is handled by :func:`whitespace.normalize_paragraph`, so
+    spaces split over several runs, non-breaking spaces and spaces around
+    tabs are fixed as well. Paragraphs in tables on those pages are
+    included. Returns the number of paragraphs changed.
+    """
+    if pages is None:
+        blocks = [doc.element.body]
+    else:
+        page_map = scan_pages(doc)
+        blocks = []
+        for page in sorted(set(pages)):
+            if page in page_map:
+                blocks.extend(page_map.elements_on(page))
+    changed = 0
+    for block in blocks:
+        for p in block.iter(_W_P):
+            changed += whitespace.normalize_paragraph(p)
+    return changed
+
+
 def detect_and_remove_extra_spaces(
     doc: Document, page_range: Iterable[int], pattern: str = "  "
 ) -> None:
-    """Collapse multiple spaces across paragraphs in ``page_range``."""
+    """Collapse multiple spaces across paragraphs in ``page_range``.
 
-    pages = map_pages_to_paragraphs(doc)
-    for page_num in page_range:
-        for p in pages.get(page_num, []):
-            for run in p.runs:
-                while pattern in run.text:
-                    run.text = run.text.replace(pattern, " ")
+    ``pattern`` is kept for compatibility; any run of two or more spaces is
+    collapsed, see :func:`normalize_whitespace`.
+    """
+    normalize_whitespace(doc, page_range)
 
 
 def ensure_blank_line_before_headings(
@@ -864,7 +1775,6 @@ def apply_two_column_layout(doc: Document, start_page: int) -> None:
 
     try:
         from docx.oxml import OxmlElement
-        from docx.oxml.ns import qn
     except Exception:
         return
 
@@ -901,7 +1811,6 @@ def apply_page_borders(doc: Document, start_section: int, border_specs) -> None:
 
     try:
         from docx.oxml import OxmlElement
-        from docx.oxml.ns import qn
     except Exception:
         # If python-docx is unavailable we silently exit
         return
@@ -949,7 +1858,6 @@ def add_page_borders(doc: Document, start_section: int) -> None:
 
     try:
         from docx.oxml import OxmlElement
-        from docx.oxml.ns import qn
     except Exception:
         return
 
@@ -988,121 +1896,415 @@ def add_page_borders(doc: Document, start_section: int) -> None:
 def add_page_borders_with_rule(
     doc: Document, start_section: int, add_center_line: bool = False
 ) -> None:
-    """Add borders and optionally a vertical rule at the page center."""
+    """Add borders and optionally a vertical rule at the page center.
+
+    A rule added by an earlier run is replaced.
+    """
 
     add_page_borders(doc, start_section)
 
     if not add_center_line:
         return
 
-    try:
-        from docx.oxml import OxmlElement
-        from docx.oxml.ns import qn, nsmap
-    except Exception:
-        return
-
-    # ensure the ``v`` namespace is available for callers using ``qn('v:shape')``
-    nsmap.setdefault("v", "urn:schemas-microsoft-com:vml")
-
     for idx, section in enumerate(doc.sections):
         if idx < start_section:
             continue
 
         header = section.header
+        remove_generated(header._element, "center_rule")
         paragraph = header.add_paragraph()
-        pict = OxmlElement("w:pict")
+        pict = fragments.CENTER_RULE.build(
+            id=f"center_rule_{idx}", vml_id=f"center_rule_{idx}_v"
+        )
+        _mark_generated(pict, "center_rule")
 
-        shape_w = OxmlElement("w:shape")
-        shape_w.set(qn("w:id"), f"center_rule_{idx}")
-        shape_w.set(qn("w:style"), "position:absolute;left:50%;top:0;width:0;height:100%")
-        pict.append(shape_w)
+        paragraph._p.append(pict)
 
-        shape_v = OxmlElement("v:shape")
-        shape_v.set("id", f"center_rule_{idx}_v")
-        shape_v.set("style", "position:absolute;left:50%;top:0;width:0;height:100%")
-        pict.append(shape_v)
 
-        paragraph._p.append(pict)
+def _footer_signature(ftr) -> Optional[bytes]:
+    """Return a key for the existing content of the footer element ``ftr``.
 
+    Footers without text or graphics give ``None``, the same as a section
+    that has no footer of its own.
+    """
+    graphic = ftr.find(".//" + qn("w:drawing")) is not None or ftr.find(
+        ".//" + qn("w:pict")
+    ) is not None
+    if not graphic and not "".join(ftr.itertext()).strip():
+        return None
+    xml = b"".join(etree.tostring(child) for child in ftr)
+    return _RSID_RE.sub(b"", xml)
 
-def apply_footer_layout(doc: Document, volume: str, issue: str, year: str) -> None:
-    """Add standardized footers and leave the first page blank."""
 
-    try:
-        from docx.oxml import OxmlElement
-        from docx.oxml.ns import qn
-    except Exception:
-        return
+def apply_footer_layout(
+    doc: Document, volume: str, issue: str, year: str, shared: bool = False
+) -> None:
+    """Add standardized footers and leave the first page blank.
+
+    By default every section gets its own footer part. With ``shared`` set a
+    section whose footer would come out identical to the previous section's
+    (same existing content and page width) is linked to it instead, so the
+    footer table is only built once per distinct layout.
+
+    Footer tables from an earlier run are replaced, so running the layout on
+    its own output does not stack them.
+    """
 
     if not doc.sections:
         return
 
     first = doc.sections[0]
     first.different_first_page_header_footer = True
+    right = f"Volume {volume} ({year}), Issue {issue}"
 
-    def _clear_borders(table):
-        tbl_pr = table._tbl.tblPr
-        if tbl_pr is None:
-            tbl_pr = OxmlElement("w:tblPr")
-            table._tbl.insert(0, tbl_pr)
-        borders = OxmlElement("w:tblBorders")
-        for side in ("top", "left", "bottom", "right", "insideH", "insideV"):
-            el = OxmlElement(f"w:{side}")
-            el.set(qn("w:val"), "nil")
-            borders.append(el)
-        tbl_pr.append(borders)
-
-    def _add_page_field(paragraph):
-        run = paragraph.add_run()
-        begin = OxmlElement("w:fldChar")
-        begin.set(qn("w:fldCharType"), "begin")
-        run._r.append(begin)
-        instr = OxmlElement("w:instrText")
-        instr.set(qn("xml:space"), "preserve")
-        instr.text = "PAGE"
-        run._r.append(instr)
-        separate = OxmlElement("w:fldChar")
-        separate.set(qn("w:fldCharType"), "separate")
-        run._r.append(separate)
-        paragraph.add_run("1")
-        end = OxmlElement("w:fldChar")
-        end.set(qn("w:fldCharType"), "end")
-        paragraph.add_run()._r.append(end)
-
+    prev_key = None
     for idx, section in enumerate(doc.sections):
+        footer = section.footer
+        if not (idx > 0 and footer.is_linked_to_previous):
+            remove_generated(footer._element, "footer")
+        if shared:
+            linked = idx > 0 and footer.is_linked_to_previous
+            key = (
+                None if linked else _footer_signature(footer._element),
+                section.page_width,
+            )
+            if idx > 0 and key == prev_key:
+                if not linked:
+                    footer.is_linked_to_previous = True
+                continue
+            prev_key = key
         if idx > 0:
             try:
                 section.footer.is_linked_to_previous = False
             except Exception:
                 pass
-        footer = section.footer
-        table = footer.add_table(rows=1, cols=3, width=section.page_width)
-        _clear_borders(table)
-
-        left_p = table.cell(0, 0).paragraphs[0]
-        left_p.text = "The ABNFF Journal"
-        left_p.alignment = WD_ALIGN_PARAGRAPH.LEFT
-        for r in left_p.runs:
-            r.font.size = Pt(10)
-            r.font.color.rgb = RGBColor(0, 0, 0)
-
-        center_cell = table.cell(0, 1)
-        shd = OxmlElement("w:shd")
-        shd.set(qn("w:fill"), "000000")
-        center_cell._tc.get_or_add_tcPr().append(shd)
-        center_p = center_cell.paragraphs[0]
-        center_p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        _add_page_field(center_p)
-        for r in center_p.runs:
-            r.font.size = Pt(10)
-            r.font.color.rgb = RGBColor(255, 255, 255)
-
-        right_p = table.cell(0, 2).paragraphs[0]
-        right_p.text = f"Volume {volume} ({year}), Issue {issue}"
-        right_p.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-        for r in right_p.runs:
-            r.font.size = Pt(10)
-            r.font.color.rgb = RGBColor(0, 0, 0)
+        col = str(Emu(section.page_width // 3).twips)
+        table = fragments.FOOTER_TABLE.build(
+            col=col, left="The ABNFF Journal", right=right
+        )
+        _mark_generated(table, "footer")
+        section.footer._element._insert_tbl(table)
+
+
+def mark_draft(doc: Document, label: str = "DRAFT") -> None:
+    """Stamp ``label`` in bold red at the top of every page header.
+
+    The stamp sits in a tagged content control; stamps from earlier runs are
+    replaced. First-page and even-page headers are stamped as well when the
+    section or document uses them.
+    """
+    even = doc.settings.odd_and_even_pages_header_footer
+    for idx, section in enumerate(doc.sections):
+        headers = [section.header]
+        if section.different_first_page_header_footer:
+            headers.append(section.first_page_header)
+        if even:
+            headers.append(section.even_page_header)
+        for header in headers:
+            if idx > 0 and header.is_linked_to_previous:
+                continue
+            _stamp_header(header, label)
+
+
+def _stamp_header(header, label: str) -> None:
+    remove_generated(header._element, "draft")
+    if header.paragraphs:
+        p = header.paragraphs[0].insert_paragraph_before(label)
+    else:
+        p = header.add_paragraph(label)
+    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    for r in p.runs:
+        r.font.bold = True
+        r.font.size = Pt(14)
+        r.font.color.rgb = RGBColor(255, 0, 0)
+    _wrap_generated(p._p, "draft")
+
+
+class ValidationContext:
+    """State shared by the checks during one :func:`validate_document` pass.
+
+    ``story`` is ``"body"``, ``"header"`` or ``"footer"`` and ``part`` the
+    package part being walked; ``page`` is the page of the current block in
+    the body and ``None`` elsewhere.
+    """
+
+    def __init__(self, doc: Document):
+        self.doc = doc
+        self.story = "body"
+        self.part = doc.part
+        self.page: Optional[int] = None
+        self.pages = 0
+        self.findings: List[dict] = []
+
+    def report(
+        self,
+        check: "IssueCheck",
+        message: str,
+        page: Optional[int] = None,
+        story: Optional[str] = None,
+    ) -> None:
+        """Record a finding, in the current story unless ``story`` is given."""
+        self.findings.append(
+            {
+                "check": check.name,
+                "severity": check.severity,
+                "message": message,
+                "story": story or self.story,
+                "page": page,
+            }
+        )
+
+
+class ValidationBlock:
+    """A top-level block of a story as seen by :meth:`IssueCheck.visit_block`."""
+
+    __slots__ = ("element", "kind", "text", "page", "has_graphic")
+
+    def __init__(self, element, kind: str, text: str, page: Optional[int], has_graphic: bool):
+        self.element = element
+        self.kind = kind
+        self.text = text
+        self.page = page
+        self.has_graphic = has_graphic
+
+
+class IssueCheck:
+    """Base class for a rule run by :func:`validate_document`.
+
+    ``tags`` lists the element tags passed to :meth:`visit_node` while a story
+    is walked, ``"*"`` meaning every element. :meth:`visit_block` is called
+    for each top-level block once its page is known and :meth:`finish` after
+    the last story. Checks report problems through ``ctx.report``.
+    """
+
+    name = "check"
+    severity = "error"
+    tags: Tuple[str, ...] = ()
+
+    def visit_node(self, node, ctx: ValidationContext) -> None:
+        pass
+
+    def visit_block(self, block: ValidationBlock, ctx: ValidationContext) -> None:
+        pass
+
+    def finish(self, ctx: ValidationContext) -> None:
+        pass
+
+
+class VolumeIssueCheck(IssueCheck):
+    """The volume/issue line and the year each appear in one body paragraph."""
+
+    name = "volume_issue"
+
+    def __init__(self, volume: str, issue: str, year: str):
+        self.search = f"Volume {volume}, Issue {issue}"
+        self.year = year
+        self.blocks = 0
+        self.years = 0
+
+    def visit_block(self, block, ctx):
+        if ctx.story != "body" or block.kind != "p":
+            return
+        if self.search in block.text:
+            self.blocks += 1
+        if self.year in block.text:
+            self.years += 1
+
+    def finish(self, ctx):
+        if self.blocks != 1:
+            ctx.report(
+                self, f"'{self.search}' found {self.blocks} times, expected once", story="body"
+            )
+        if self.years != 1:
+            ctx.report(
+                self, f"year {self.year} found {self.years} times, expected once", story="body"
+            )
+
+
+class PlaceholderCheck(IssueCheck):
+    """No placeholder text is left anywhere in the issue."""
+
+    name = "placeholder"
+
+    def __init__(self, placeholders: Iterable[str] = ("<<Awaiting President's message>>",)):
+        self.placeholders = tuple(placeholders)
+
+    def visit_block(self, block, ctx):
+        for text in self.placeholders:
+            if text in block.text:
+                ctx.report(self, f"placeholder {text!r} still present", block.page)
+
+
+class DuplicateLineCheck(IssueCheck):
+    """At most one horizontal separator line per page."""
+
+    name = "duplicate_lines"
+    severity = "warning"
+
+    def __init__(self):
+        self.lines: Dict[int, int] = {}
+
+    def visit_block(self, block, ctx):
+        if block.page is not None and block.kind == "p" and _is_line_element(
+            block.element, block.text
+        ):
+            self.lines[block.page] = self.lines.get(block.page, 0) + 1
+
+    def finish(self, ctx):
+        for page, count in sorted(self.lines.items()):
+            if count > 1:
+                ctx.report(self, f"{count} separator lines on one page", page, story="body")
+
+
+class EmptyPageCheck(IssueCheck):
+    """Every body page has some text, table or picture."""
+
+    name = "empty_page"
+    severity = "warning"
+
+    def __init__(self):
+        self.filled = set()
+
+    def visit_block(self, block, ctx):
+        if block.page is not None and (
+            block.text.strip() or block.has_graphic or block.kind == "tbl"
+        ):
+            self.filled.add(block.page)
+
+    def finish(self, ctx):
+        for page in range(1, ctx.pages + 1):
+            if page not in self.filled:
+                ctx.report(self, "page has no content", page, story="body")
+
+
+class RelationshipCheck(IssueCheck):
+    """Every ``r:`` reference points to an existing relationship."""
+
+    name = "dangling_relationship"
+    tags = ("*",)
+
+    _R_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+
+    def __init__(self):
+        self.pending: List[str] = []
+
+    def visit_node(self, node, ctx):
+        for attr, value in node.attrib.items():
+            if attr.startswith(self._R_NS) and value not in ctx.part.rels:
+                name = attr[len(self._R_NS):]
+                local = node.tag.rsplit("}", 1)[-1]
+                self.pending.append(f"r:{name}={value!r} on {local} has no relationship")
+
+    def visit_block(self, block, ctx):
+        for message in self.pending:
+            ctx.report(self, message, block.page)
+        self.pending.clear()
+
+
+class TocTitleCheck(IssueCheck):
+    """Every article title listed in the TOC appears as a body paragraph."""
+
+    name = "toc_titles"
+    severity = "warning"
+
+    def __init__(self):
+        self.texts: List[str] = []
+
+    def visit_block(self, block, ctx):
+        if ctx.story == "body" and block.kind == "p":
+            self.texts.append(block.text)
+
+    def finish(self, ctx):
+        body = {t.strip().upper() for t in self.texts}
+        for title in _toc_titles(self.texts):
+            if title.upper() not in body:
+                ctx.report(
+                    self, f"TOC title {title!r} has no matching heading", story="body"
+                )
+
+
+def default_checks(volume: str, issue: str, year: str) -> List[IssueCheck]:
+    """Return the checks :func:`update_journal` runs before saving."""
+    return [
+        VolumeIssueCheck(volume, issue, year),
+        PlaceholderCheck(),
+        DuplicateLineCheck(),
+        EmptyPageCheck(),
+        RelationshipCheck(),
+        TocTitleCheck(),
+    ]
+
+
+def validate_document(doc: Document, checks: Iterable[IssueCheck]) -> List[dict]:
+    """Run ``checks`` over the body, headers and footers in a single pass.
+
+    Every element of each story is visited once; pages are tracked with the
+    same rules as :func:`scan_pages`. Returns the findings as dictionaries with
+    ``check``, ``severity``, ``message``, ``story`` and ``page`` keys.
+    """
+    from docx.opc.constants import RELATIONSHIP_TYPE as RT
+
+    checks = list(checks)
+    by_tag: Dict[str, List[IssueCheck]] = {}
+    for check in checks:
+        for tag in check.tags:
+            by_tag.setdefault(tag, []).append(check)
+    every = by_tag.pop("*", [])
+
+    stories = [("body", doc.part, doc.element.body)]
+    for rel in doc.part.rels.values():
+        if rel.reltype in (RT.HEADER, RT.FOOTER) and not rel.is_external:
+            story = "header" if rel.reltype == RT.HEADER else "footer"
+            stories.append((story, rel.target_part, rel.target_part.element))
+
+    tag_tab, tag_cr, tag_type = qn("w:tab"), qn("w:cr"), qn("w:type")
+    graphic = {qn("w:drawing"), qn("w:pict"), qn("w:object")}
+    ctx = ValidationContext(doc)
+    for story, part, root in stories:
+        ctx.story, ctx.part = story, part
+        counter = _PageCounter() if story == "body" else None
+        for block in root.iterchildren():
+            if not isinstance(block.tag, str):
+                continue
+            breaks = _BlockBreaks(block)
+            text: List[str] = []
+            has_graphic = False
+            for node in block.iter():
+                tag = node.tag
+                if not isinstance(tag, str):
+                    continue
+                for check in every:
+                    check.visit_node(node, ctx)
+                for check in by_tag.get(tag, ()):
+                    check.visit_node(node, ctx)
+                if tag == _W_T:
+                    text.append(node.text or "")
+                elif tag == tag_tab:
+                    text.append("\t")
+                elif tag == tag_cr or (tag == _W_BR and node.get(tag_type) in (None, "textWrapping")):
+                    text.append("\n")
+                elif tag in graphic:
+                    has_graphic = True
+                if counter is not None and tag in _BREAK_TAGS:
+                    breaks.feed(node)
+            if counter is not None and block.tag == _W_SECTPR:
+                # the body sectPr only holds references; it is not on a page
+                page = counter.page if counter.count else None
+            elif counter is not None:
+                page = counter.place(breaks.before, breaks.after)
+            else:
+                page = None
+            ctx.page = page
+            kind = block.tag.rsplit("}", 1)[-1]
+            info = ValidationBlock(block, kind, "".join(text), page, has_graphic)
+            for check in checks:
+                check.visit_block(info, ctx)
+        if counter is not None:
+            ctx.pages = (counter.page + bool(counter.pending)) if counter.count else 0
+        ctx.page = None
+    for check in checks:
+        check.finish(ctx)
+    return ctx.findings
 
 
 def validate_issue_number_and_volume(
@@ -1110,17 +2312,10 @@ def validate_issue_number_and_volume(
 ) -> None:
     """Check volume/issue/year text appears once and matches expectations."""
 
-    search = f"Volume {expected_volume}, Issue {expected_issue}"
-    count_block = 0
-    count_year = 0
-    for p in doc.paragraphs:
-        text = p.text
-        if search in text:
-            count_block += 1
-        if expected_year in text:
-            count_year += 1
-
-    if count_block != 1 or count_year != 1:
+    findings = validate_document(
+        doc, [VolumeIssueCheck(expected_volume, expected_issue, expected_year)]
+    )
+    if findings:
         raise ValueError("Volume/issue/year text not found exactly once")
 
 
@@ -1148,6 +2343,161 @@ def save_pdf(doc_path: Path, pdf_path: Path) -> None:
             print(f"PDF export failed: {e}")
 
 
+def _plan_range(page_map: "PageMap", step: str, start: int, end: int) -> dict:
+    first = page_map.paragraph_count_before(start)
+    return {
+        "step": step,
+        "elements": (start, end),
+        "paragraphs": (first, first + len(page_map.paragraph_indices(start, end))),
+        "pages": (page_map.page_of(start), page_map.page_of(end - 1)),
+        "first_text": page_map.text(start).strip(),
+    }
+
+
+def plan_update(
+    base_path: Path,
+    content_path: Path,
+    volume: str,
+    issue: str,
+    month_year: str,
+    cover_page_num: int = 1,
+    start_page: Optional[int] = None,
+    article_files: Optional[List[Path]] = None,
+    instructions: Optional[Instructions] = None,
+) -> dict:
+    """Work out what :func:`update_journal` would do without changing anything.
+
+    The base document is parsed and analysed (TOC titles, article
+    boundaries, page map, deletion ranges) but never modified or saved. The
+    returned dictionary lists the deletions in base document coordinates,
+    the articles to import in order and the formatting steps taken from
+    ``instructions.json``. Paragraph ranges are half-open indices into
+    ``doc.paragraphs``; page ranges are inclusive.
+    """
+    doc = load_document(base_path)
+    if instructions is None:
+        instructions = Instructions.load(content_path)
+    volume = instructions.volume or volume
+    issue = instructions.issue or issue
+
+    page_map = scan_pages(doc)
+    limit = len(page_map.elements)
+    deletions = []
+    # articles imported by an earlier run go first, as in update_journal
+    imported = _imported_articles_start(page_map)
+    if imported is not None and imported < limit:
+        deletions.append(_plan_range(page_map, "remove_imported_articles", imported, limit))
+        limit = imported
+    if start_page is not None:
+        next_page = max(start_page + 1, 1)
+        if next_page in page_map:
+            cut, _ = page_map.span(next_page)
+            if cut < limit:
+                deletions.append(_plan_range(page_map, "delete_after_page", cut, limit))
+                limit = cut
+    start, found = _editorial_clear_start(page_map, limit)
+    if start is not None and start < limit:
+        step = "clear_articles_preserve_editorials" if found else "clear_articles"
+        deletions.append(_plan_range(page_map, step, start, limit))
+        limit = start
+    insert_at = page_map.paragraph_count_before(limit)
+
+    files = (
+        article_files if article_files is not None else find_article_files(content_path)
+    )
+    files = sorted((Path(p) for p in files), key=lambda p: p.name.lower())
+    reports = preflight(files, raise_on_error=False)
+    formatting = []
+    for key in ("font_size", "line_spacing", "font_family"):
+        value = getattr(instructions, key)
+        if value is not None:
+            formatting.append({"step": key, "value": value, "paragraphs": (insert_at, None)})
+    for key, field in (("font_size_from_page", "size"), ("line_spacing_from_page", "spacing")):
+        info = getattr(instructions, key)
+        if info is not None:
+            formatting.append({"step": key, "value": info[field], "from_page": info["page"]})
+    after_import = []
+    if instructions.clean_xml:
+        after_import.append({"step": "clean_xml"})
+    if instructions.optimize_images is not None:
+        settings = {"dpi": images.DEFAULT_DPI, "quality": images.DEFAULT_QUALITY}
+        settings.update(instructions.optimize_images)
+        after_import.append({"step": "optimize_images", **settings})
+    if instructions.delete_after_page is not None:
+        after_import.append(
+            {"step": "delete_after_page", "after_page": instructions.delete_after_page}
+        )
+    for key in ("delete_after_editorial", "cleanup_black_lines"):
+        if getattr(instructions, key):
+            after_import.append({"step": key})
+    if instructions.autofit_table_on_page is not None:
+        after_import.append(
+            {"step": "autofit_table_on_page", "page": instructions.autofit_table_on_page}
+        )
+
+    return {
+        "base": str(base_path),
+        "volume": volume,
+        "issue": issue,
+        "month_year": month_year,
+        "cover_page": cover_page_num,
+        "pages": len(page_map),
+        "paragraphs": page_map.paragraph_count_before(len(page_map.elements)),
+        "toc_titles": [t for t, _ in find_article_boundaries(page_map) if t != "ARTICLES"],
+        "deletions": deletions,
+        "insert_at_paragraph": insert_at,
+        "articles": [str(p) for p in files],
+        "preflight": [r.as_dict() for r in reports],
+        "formatting": formatting,
+        "after_import": after_import,
+    }
+
+
+def format_plan(plan: dict) -> str:
+    """Return a human readable report for a :func:`plan_update` result."""
+    lines = [
+        f"Plan for {plan['base']}: {plan['pages']} pages, {plan['paragraphs']} paragraphs",
+        f"Front matter: Volume {plan['volume']}, Issue {plan['issue']}, "
+        f"{plan['month_year']} (cover page {plan['cover_page']})",
+        "Old articles found: " + (", ".join(plan["toc_titles"]) or "none"),
+        "Deletions:",
+    ]
+    for d in plan["deletions"]:
+        (p0, p1), (g0, g1) = d["paragraphs"], d["pages"]
+        lines.append(
+            f"  {d['step']}: paragraphs {p0}-{p1 - 1}, pages {g0}-{g1}"
+            f" (starting with {d['first_text'][:40]!r})"
+        )
+    if not plan["deletions"]:
+        lines.append("  none")
+    lines.append(f"Articles to import at paragraph {plan['insert_at_paragraph']}:")
+    checks = {r["path"]: r for r in plan.get("preflight", [])}
+    for n, name in enumerate(plan["articles"], 1):
+        r = checks.get(name)
+        if r is None:
+            lines.append(f"  {n}. {name}")
+        elif r["ok"]:
+            lines.append(f"  {n}. {name} ({r['images']} images, {r['words']} words)")
+        else:
+            lines.append(f"  {n}. {name} FAILS PREFLIGHT: {r['error']}")
+    if not plan["articles"]:
+        lines.append("  none")
+    lines.append("Formatting:")
+    for f in plan["formatting"]:
+        where = (
+            f"from paragraph {f['paragraphs'][0]}"
+            if "paragraphs" in f
+            else f"from page {f['from_page']}"
+        )
+        lines.append(f"  {f['step']} = {f['value']} {where}")
+    for step in plan["after_import"]:
+        extra = ", ".join(f"{k}={v}" for k, v in step.items() if k != "step")
+        lines.append(f"  {step['step']}" + (f" ({extra})" if extra else ""))
+    if not plan["formatting"] and not plan["after_import"]:
+        lines.append("  none")
+    return "\n".join(lines)
+
+
 def update_journal(
     base_path: Path,
     content_path: Path,
@@ -1158,115 +2508,219 @@ def update_journal(
     cover_page_num: int = 1,
     start_page: Optional[int] = None,
     article_files: Optional[List[Path]] = None,
-) -> None:
+    draft: bool = False,
+    plan: bool = False,
+    base_doc: Optional[Document] = None,
+    instructions: Optional[Instructions] = None,
+    recursive: bool = False,
+    checkpoint: bool = False,
+    resume: bool = False,
+) -> Union[dict, List[dict]]:
     """Run the update process and append ``article_files`` if provided.
 
     ``start_page`` specifies the page number where articles should be
     inserted. If ``None`` old articles are cleared automatically based on
     editorial headings.
 
-    If ``article_files`` is ``None`` new articles are discovered using
-    :func:`find_article_files` within ``content_path``.
+    If ``article_files`` is ``None`` new articles are discovered in
+    ``content_path`` (and its subfolders with ``recursive``) by the same
+    :func:`scan_content` pass that finds the message and instructions.
+
+    With ``draft`` set a quick preview is produced instead: the footer table
+    is replaced by a :func:`mark_draft` stamp, no PDF is exported and the
+    docx is written with the fastest deflate level.
+
+    With ``plan`` set nothing is modified or written; the result of
+    :func:`plan_update` is printed and returned instead. Otherwise the
+    :func:`validate_document` findings for the finished issue are logged
+    and returned.
+
+    ``base_doc`` may hold the already parsed base document, which is then
+    updated in place instead of reading ``base_path`` again. Likewise
+    ``instructions`` replaces reading ``instructions.json`` from
+    ``content_path``; an invalid file raises :class:`InstructionsError`.
+
+    Every article is checked by :func:`preflight` before the base document
+    is loaded; :class:`PreflightError` lists the files that cannot be read.
+
+    With ``checkpoint`` set the changed parts are saved next to
+    ``output_path`` after clearing, importing, formatting and cleanup (see
+    :mod:`checkpoint`). With ``resume`` set a run continues after the last
+    stage saved by an earlier run over the same inputs; without a matching
+    checkpoint it starts over.
     """
-    doc = load_document(base_path)
-    instructions = load_instructions(content_path)
-
-    if "volume" in instructions:
-        volume = str(instructions["volume"])
-    if "issue" in instructions:
-        issue = str(instructions["issue"])
-
-    update_front_cover(doc, volume, issue, month_year, cover_page_num)
-    apply_footer_layout(doc, volume, issue, month_year.split()[-1])
-    update_business_information(
-        doc,
-        "2023",
-        "Annual subscription rates are: institutions $550, individuals $220, and students $110",
-    )
-    header_text = f"Volume {volume}, Issue {issue}\n{month_year}"
-    update_page2_header(doc, header_text, 2)
-    pres_message_path = content_path / "president_message.txt"
-    message_text = pres_message_path.read_text() if pres_message_path.exists() else ""
-    insert_presidents_message(doc, content_path / "president.jpg", message_text)
+    content = scan_content(content_path, recursive)
+    if instructions is None:
+        instructions = Instructions.load(content_path) if content.instructions else Instructions()
+    if article_files is None:
+        article_files = _content_articles(content)
+    if plan:
+        result = plan_update(
+            base_path, content_path, volume, issue, month_year,
+            cover_page_num, start_page, article_files, instructions,
+        )
+        print(format_plan(result))
+        return result
+
+    ckpt = key = None
+    resumed = None
+    if checkpoint or resume:
+        ckpt = checkpoints.checkpoint_path(output_path)
+        key = checkpoints.input_key(
+            [base_path, content.message, content.president_image, *article_files],
+            {
+                "volume": volume, "issue": issue, "month_year": month_year,
+                "cover_page": cover_page_num, "start_page": start_page, "draft": draft,
+                "instructions": instructions.to_dict(),
+            },
+        )
+        if resume:
+            resumed = checkpoints.load_checkpoint(ckpt, key, base_path)
+            if resumed is None:
+                logging.warning("No usable checkpoint at %s, starting over", ckpt)
+
+    def reached(stage: str, start_idx: int) -> None:
+        if ckpt is not None:
+            checkpoints.save_checkpoint(doc, ckpt, stage, key, {"start_idx": start_idx})
+
+    if resumed is not None:
+        doc, stage, state = resumed
+        done = checkpoints.STAGES.index(stage) + 1
+        start_idx = state["start_idx"]
+        logging.info("Resuming after the %s stage", stage)
+    else:
+        done = 0
+    if done < 2:
+        reports = preflight(article_files)
+        if reports:
+            logging.info("Article preflight:\n%s", format_report(reports))
+    if resumed is None:
+        doc = base_doc if base_doc is not None else load_document(base_path)
+    volume = instructions.volume or volume
+    issue = instructions.issue or issue
+
+    if done < 1:
+        update_front_cover(doc, volume, issue, month_year, cover_page_num)
+        if not draft:
+            apply_footer_layout(doc, volume, issue, month_year.split()[-1], shared=True)
+        update_business_information(
+            doc,
+            "2023",
+            "Annual subscription rates are: institutions $550, individuals $220, and students $110",
+        )
+        header_text = f"Volume {volume}, Issue {issue}\n{month_year}"
+        update_page2_header(doc, header_text, 2)
+        message_text = content.message.read_text() if content.message else ""
+        insert_presidents_message(
+            doc, content.president_image or content_path / "president.jpg", message_text
+        )
 
-    if start_page is not None:
-        delete_after_page(doc, start_page)
-        start_idx = len(doc.paragraphs)
-        try:
-            from docx.oxml.ns import qn
-        except Exception:
-            qn = None
-        for section in doc.sections:
-            ps = getattr(section, "page_setup", None)
-            if ps is not None and hasattr(ps, "left_border"):
-                try:
-                    ps.left_border = None
-                    ps.right_border = None
-                    ps.top_border = None
-                    ps.bottom_border = None
-                except Exception:
-                    pass
-            if qn is not None:
+        # articles imported by an earlier run on this document are replaced
+        remove_imported_articles(doc)
+        if start_page is not None:
+            delete_after_page(doc, start_page)
+            start_idx = len(doc.paragraphs)
+            for section in doc.sections:
+                ps = getattr(section, "page_setup", None)
+                if ps is not None and hasattr(ps, "left_border"):
+                    try:
+                        ps.left_border = None
+                        ps.right_border = None
+                        ps.top_border = None
+                        ps.bottom_border = None
+                    except Exception:
+                        pass
                 sectPr = section._sectPr
                 for b in list(sectPr.findall(qn("w:pgBorders"))):
                     sectPr.remove(b)
-        if start_idx == len(doc.paragraphs):
+            if start_idx == len(doc.paragraphs):
+                clear_articles_preserve_editorials(doc)
+                start_idx = len(doc.paragraphs)
+        else:
             clear_articles_preserve_editorials(doc)
             start_idx = len(doc.paragraphs)
-    else:
-        clear_articles_preserve_editorials(doc)
-        start_idx = len(doc.paragraphs)
-    files = (
-        article_files if article_files is not None else find_article_files(content_path)
+        reached("clear", start_idx)
+
+    if done < 2:
+        import_articles(doc, article_files)
+        # sizes are only measured when someone will see them
+        measure = logging.getLogger().isEnabledFor(logging.INFO)
+        if instructions.clean_xml:
+            stats = cleanup.strip_bloat(doc, measure=measure)
+            if measure:
+                logging.info(
+                    "Stripped %d revision ids, %d elements and %d embedded fonts: %d KB -> %d KB",
+                    stats["attributes"], stats["elements"], stats["fonts"],
+                    stats["bytes_before"] // 1024, stats["bytes_after"] // 1024,
+                )
+        stats = coalesce_runs(doc.element.body, measure=measure)
+        if "bytes_before" in stats:
+            logging.info(
+                "Merged runs: %d -> %d, %d proofing marks dropped, body XML %d KB -> %d KB",
+                stats["runs_before"], stats["runs_after"], stats["proof_errors"],
+                stats["bytes_before"] // 1024, stats["bytes_after"] // 1024,
+            )
+        if instructions.optimize_images is not None:
+            stats = images.optimize_images(
+                doc, cache_dir=content_path / IMAGE_CACHE, **instructions.optimize_images
+            )
+            if stats["resized"]:
+                logging.info(
+                    "Resized %d of %d images: %d KB -> %d KB",
+                    stats["resized"], stats["images"],
+                    stats["bytes_before"] // 1024, stats["bytes_after"] // 1024,
+                )
+        reached("import", start_idx)
+
+    if done < 3:
+        if instructions.font_size is not None:
+            set_font_size(doc, start_idx, int(instructions.font_size))
+        if instructions.line_spacing is not None:
+            set_line_spacing(doc, start_idx, float(instructions.line_spacing))
+        if instructions.font_family is not None:
+            set_font_family(doc, start_idx, instructions.font_family)
+        info = instructions.font_size_from_page
+        if info is not None:
+            set_font_size_from_page(doc, info["page"], int(info["size"]))
+        info = instructions.line_spacing_from_page
+        if info is not None:
+            set_line_spacing_from_page(doc, info["page"], float(info["spacing"]))
+        reached("format", start_idx)
+
+    if done < 4:
+        if instructions.delete_after_page is not None:
+            delete_after_page(doc, instructions.delete_after_page)
+        if instructions.delete_after_editorial:
+            delete_after_editorial(doc)
+        if instructions.cleanup_black_lines:
+            cleanup_black_lines(doc)
+        if instructions.autofit_table_on_page is not None:
+            autofit_first_table(doc, instructions.autofit_table_on_page)
+
+        update_table_of_contents(doc)
+        reached("cleanup", start_idx)
+
+    findings = validate_document(
+        doc, default_checks(volume, issue, month_year.split()[-1])
     )
-    import_articles(doc, files)
-
-    if "font_size" in instructions:
-        set_font_size(doc, start_idx, int(instructions["font_size"]))
-    if "line_spacing" in instructions:
-        set_line_spacing(doc, start_idx, float(instructions["line_spacing"]))
-    if "font_family" in instructions:
-        set_font_family(doc, start_idx, instructions["font_family"])
-    if "font_size_from_page" in instructions:
-        info = instructions["font_size_from_page"]
-        if isinstance(info, dict):
-            page = info.get("page")
-            size = info.get("size")
-            if page is not None and size is not None:
-                try:
-                    set_font_size_from_page(doc, int(page), int(size))
-                except Exception:
-                    pass
-    if "line_spacing_from_page" in instructions:
-        info = instructions["line_spacing_from_page"]
-        if isinstance(info, dict):
-            page = info.get("page")
-            spacing = info.get("spacing")
-            if page is not None and spacing is not None:
-                try:
-                    set_line_spacing_from_page(doc, int(page), float(spacing))
-                except Exception:
-                    pass
-    if "delete_after_page" in instructions:
-        try:
-            delete_after_page(doc, int(instructions["delete_after_page"]))
-        except Exception:
-            pass
-    if instructions.get("delete_after_editorial"):
-        delete_after_editorial(doc)
-    if instructions.get("cleanup_black_lines"):
-        cleanup_black_lines(doc)
-    if "autofit_table_on_page" in instructions:
-        try:
-            autofit_first_table(doc, int(instructions["autofit_table_on_page"]))
-        except Exception:
-            pass
-
-    update_table_of_contents(doc)
+    for finding in findings:
+        logging.warning(
+            "%s: %s%s",
+            finding["check"],
+            finding["message"],
+            f" (page {finding['page']})" if finding["page"] else "",
+        )
 
-    save_document(doc, output_path)
-    pdf_path = output_path.with_suffix(".pdf")
-    save_pdf(output_path, pdf_path)
+    if draft:
+        mark_draft(doc)
+        save_document(doc, output_path, compresslevel=1)
+    else:
+        save_document(doc, output_path)
+        pdf_path = output_path.with_suffix(".pdf")
+        save_pdf(output_path, pdf_path)
+    if ckpt is not None:
+        checkpoints.discard_checkpoint(ckpt)
+    return findings
 
 
 def main_from_gui(
@@ -1282,25 +2736,20 @@ def main_from_gui(
     font_size: Optional[int] = None,
     line_spacing: Optional[float] = None,
     font_family: Optional[str] = None,
+    draft: bool = False,
+    save_instructions: bool = False,
 ) -> None:
-    """Helper for GUI front-end."""
-    inst_file = content_folder / "instructions.json"
-    instructions = {}
-    if inst_file.exists():
-        try:
-            with inst_file.open("r", encoding="utf-8") as f:
-                instructions = json.load(f)
-        except Exception:
-            instructions = {}
-    if font_size is not None:
-        instructions["font_size"] = font_size
-    if line_spacing is not None:
-        instructions["line_spacing"] = line_spacing
-    if font_family is not None:
-        instructions["font_family"] = font_family
-    if instructions:
-        with inst_file.open("w", encoding="utf-8") as f:
-            json.dump(instructions, f)
+    """Helper for GUI front-end.
+
+    The font settings override those in ``instructions.json`` for this run;
+    they are written back to the content folder only with
+    ``save_instructions`` set.
+    """
+    instructions = Instructions.load(content_folder).merged(
+        font_size=font_size, line_spacing=line_spacing, font_family=font_family
+    )
+    if save_instructions:
+        instructions.save(content_folder)
 
     update_journal(
         base_doc,
@@ -1312,24 +2761,13 @@ def main_from_gui(
         cover_page_num,
         start_page,
         article_files,
+        draft=draft,
+        instructions=instructions,
     )
 
 
-def main():
-    parser = argparse.ArgumentParser(description="Update ABNFF Journal document")
-    parser.add_argument("base_doc")
-    parser.add_argument("content_folder")
-    parser.add_argument("output_doc")
-    parser.add_argument("--volume", required=True)
-    parser.add_argument("--issue", required=True)
-    parser.add_argument("--month-year", required=True, dest="month_year")
-    parser.add_argument("--cover-page", type=int, default=1, dest="cover_page")
-    parser.add_argument(
-        "--start-page", type=int, default=None, dest="start_page",
-        help="Page number where new articles begin"
-    )
-    args = parser.parse_args()
-
+def run_from_args(args: argparse.Namespace) -> Union[dict, List[dict]]:
+    """Run :func:`update_journal` for arguments parsed by :mod:`cli`."""
     base_path = Path(args.base_doc)
     content_path = Path(args.content_folder)
     output_path = (
@@ -1338,7 +2776,7 @@ def main():
         else base_path.with_name(base_path.stem + "_updated.docx")
     )
 
-    update_journal(
+    return update_journal(
         base_path,
         content_path,
         output_path,
@@ -1348,8 +2786,18 @@ def main():
         args.cover_page,
         args.start_page,
         None,
+        draft=args.draft,
+        plan=args.plan,
+        recursive=args.recursive,
+        # the fast preview doesn't pay for snapshots
+        checkpoint=not args.draft,
+        resume=args.resume,
     )
 
 
+def main(argv: Optional[List[str]] = None):
+    return run_from_args(cli.build_parser().parse_args(argv))
+
+
 if __name__ == "__main__":
     main()
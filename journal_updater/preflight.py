@@ -0,0 +1,142 @@
+"""Check article files before the base document is touched.
+
+Every ``article*.docx`` is opened on a thread pool: the zip must read, hold
+``[Content_Types].xml`` and ``word/document.xml``, and the document part
+must parse. The report also gives the file size, the number of images and
+a word count. :func:`preflight` raises :class:`PreflightError` with the
+whole report when any file fails, so a broken submission stops the run
+before the expensive steps start.
+"""
+
+import os
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+from lxml import etree
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_W_T = _W + "t"
+_W_P = _W + "p"
+
+# encrypted Word files are OLE compound documents, not zips
+_OLE_MAGIC = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+
+REQUIRED_MEMBERS = ("[Content_Types].xml", "word/document.xml")
+
+
+class ArticleReport:
+    """Outcome of checking one article file."""
+
+    __slots__ = ("path", "error", "size", "images", "words")
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.error: Optional[str] = None
+        self.size = 0
+        self.images = 0
+        self.words = 0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def as_dict(self) -> dict:
+        return {
+            "path": str(self.path),
+            "ok": self.ok,
+            "error": self.error,
+            "size": self.size,
+            "images": self.images,
+            "words": self.words,
+        }
+
+
+class PreflightError(ValueError):
+    """Raised when one or more article files cannot be imported."""
+
+    def __init__(self, reports: List[ArticleReport]):
+        self.reports = reports
+        failed = [r for r in reports if not r.ok]
+        super().__init__(
+            f"{len(failed)} of {len(reports)} article files failed preflight\n"
+            + format_report(reports)
+        )
+
+
+def _count_words(stream) -> int:
+    words = 0
+    text: List[str] = []
+    for _, el in etree.iterparse(stream, events=("end",), tag=(_W_T, _W_P)):
+        if el.tag == _W_T:
+            if el.text:
+                text.append(el.text)
+        else:
+            words += len("".join(text).split())
+            text.clear()
+            el.clear()
+    return words
+
+
+def check_article(path: Path) -> ArticleReport:
+    """Open ``path`` like :func:`import_articles` would and report on it."""
+    report = ArticleReport(Path(path))
+    try:
+        report.size = os.path.getsize(path)
+        with open(path, "rb") as fh:
+            magic = fh.read(len(_OLE_MAGIC))
+        if magic == _OLE_MAGIC:
+            report.error = "password protected or legacy .doc file"
+            return report
+        with zipfile.ZipFile(path) as zf:
+            names = set(zf.namelist())
+            missing = [name for name in REQUIRED_MEMBERS if name not in names]
+            if missing:
+                report.error = f"missing {', '.join(missing)}"
+                return report
+            report.images = sum(1 for name in names if name.startswith("word/media/"))
+            with zf.open("word/document.xml") as stream:
+                report.words = _count_words(stream)
+    except zipfile.BadZipFile as exc:
+        report.error = f"not a valid docx archive ({exc})"
+    except etree.XMLSyntaxError as exc:
+        report.error = f"word/document.xml does not parse ({exc})"
+    except Exception as exc:
+        # OSError, RuntimeError for an encrypted member, EOFError or
+        # zlib.error for a truncated file
+        report.error = f"{type(exc).__name__}: {exc}"
+    return report
+
+
+def preflight(
+    paths: Iterable[Path], max_workers: Optional[int] = None, raise_on_error: bool = True
+) -> List[ArticleReport]:
+    """Check every article in ``paths`` concurrently, keeping their order.
+
+    Raises :class:`PreflightError` if a file fails and ``raise_on_error``
+    is set.
+    """
+    paths = list(paths)
+    if not paths:
+        return []
+    workers = max_workers or min(8, len(paths))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        reports = list(pool.map(check_article, paths))
+    if raise_on_error and any(not r.ok for r in reports):
+        raise PreflightError(reports)
+    return reports
+
+
+def format_report(reports: List[ArticleReport]) -> str:
+    """Return one line per article."""
+    lines = []
+    for r in reports:
+        if r.ok:
+            lines.append(
+                f"  ok    {r.path.name}: {r.size / 1024:.0f} KB, "
+                f"{r.images} images, {r.words} words"
+            )
+        else:
+            lines.append(f"  FAIL  {r.path.name}: {r.error}")
+    return "\n".join(lines)
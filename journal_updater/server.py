@@ -0,0 +1,430 @@
+"""Warm worker that runs :func:`update_journal` jobs for local clients.
+
+Starting a fresh process for every update pays for the interpreter,
+python-docx/lxml imports and parsing the base document each time. The
+worker keeps all of that in memory: it listens on localhost HTTP, queues the
+submitted jobs and runs them one after another on a single thread, cloning
+recently used base documents from a cache instead of reading them again.
+
+Start it and submit jobs with::
+
+    python -m journal_updater serve [--port 8765]
+    python -m journal_updater submit BASE_DOCX CONTENT_FOLDER OUTPUT_DOCX \
+        --volume 1 --issue 1 --month-year "June 2025"
+
+Endpoints (JSON in and out):
+
+- ``POST /jobs`` queues a job; add ``?wait=1`` to answer once it finished.
+- ``GET /jobs/<id>`` returns the job state; ``?wait=1`` blocks as well.
+- ``GET /status`` reports the queue length and base document cache.
+
+Only local clients holding the session token get in. ``serve`` writes a new
+random token to a file only the user can read (see :func:`token_path`) and
+``submit`` sends it as ``Authorization: Bearer <token>``. Requests from web
+pages are refused as well: anything with an ``Origin`` header, a ``Host``
+other than a loopback name, or a job body that isn't ``application/json``.
+"""
+
+import argparse
+import json
+import logging
+import os
+import queue
+import secrets
+import sys
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import List, Optional
+from urllib import error as urlerror
+from urllib import request as urlrequest
+from urllib.parse import parse_qs, urlsplit
+
+try:
+    from . import cli
+except ImportError:  # run as a script
+    import cli
+
+DEFAULT_PORT = 8765
+
+# jobs kept around after they finished so clients can still fetch them
+KEEP_FINISHED = 100
+
+_LOOPBACK = frozenset({"127.0.0.1", "localhost", "::1"})
+
+
+def token_path(port: int = DEFAULT_PORT) -> Path:
+    """Return the file holding the session token of the worker on ``port``."""
+    return Path.home() / ".journal_updater" / f"worker-{port}.token"
+
+
+def write_token(path: Path) -> str:
+    """Write a new random token to ``path``, readable by the user only."""
+    token = secrets.token_urlsafe(32)
+    path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+    if path.exists():
+        path.unlink()
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, "w") as f:
+        f.write(token)
+    return token
+
+
+def read_token(path: Path) -> Optional[str]:
+    try:
+        return path.read_text().strip() or None
+    except OSError:
+        return None
+
+
+def _updater():
+    """Import the updater on first use; the client never needs it."""
+    try:
+        from . import journal_updater
+    except ImportError:  # run as a script
+        import journal_updater
+    return journal_updater
+
+
+class BaseCache:
+    """Parsed base documents keyed by path, least recently used dropped first.
+
+    An entry is reused only while the file keeps its size and modification
+    time; callers get a clone so jobs never see each other's changes.
+    """
+
+    def __init__(self, maxsize: int = 4):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._docs: "OrderedDict[Path, tuple]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def get(self, path: Path):
+        path = Path(path).resolve()
+        st = os.stat(path)
+        stamp = (st.st_size, st.st_mtime_ns)
+        entry = self._docs.get(path)
+        if entry is not None and entry[0] == stamp:
+            self.hits += 1
+            self._docs.move_to_end(path)
+            doc = entry[1]
+        else:
+            self.misses += 1
+            doc = _updater().load_document(path)
+            self._docs[path] = (stamp, doc)
+            self._docs.move_to_end(path)
+            while len(self._docs) > self.maxsize:
+                self._docs.popitem(last=False)
+        return _updater().clone_document(doc)
+
+
+class Job:
+    """One queued update and its outcome."""
+
+    __slots__ = ("id", "kwargs", "status", "result", "error", "seconds", "done")
+
+    def __init__(self, kwargs: dict):
+        self.id = uuid.uuid4().hex
+        self.kwargs = kwargs
+        self.status = "queued"
+        self.result: Optional[dict] = None
+        self.error: Optional[str] = None
+        self.seconds: Optional[float] = None
+        self.done = threading.Event()
+
+    def as_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "status": self.status,
+            "result": self.result,
+            "error": self.error,
+            "seconds": self.seconds,
+        }
+
+
+_REQUIRED = ("base_doc", "content_folder", "output_doc", "volume", "issue", "month_year")
+
+
+def job_arguments(params: dict) -> dict:
+    """Turn the JSON ``params`` of a job into :func:`update_journal` arguments.
+
+    Raises ``ValueError`` when a field is missing or has the wrong type.
+    """
+    if not isinstance(params, dict):
+        raise ValueError("job must be a JSON object")
+    missing = [name for name in _REQUIRED if not params.get(name)]
+    if missing:
+        raise ValueError(f"missing job fields: {', '.join(missing)}")
+    try:
+        start_page = params.get("start_page")
+        articles = params.get("article_files")
+        return {
+            "base_path": Path(params["base_doc"]),
+            "content_path": Path(params["content_folder"]),
+            "output_path": Path(params["output_doc"]),
+            "volume": str(params["volume"]),
+            "issue": str(params["issue"]),
+            "month_year": str(params["month_year"]),
+            "cover_page_num": int(params.get("cover_page", 1)),
+            "start_page": int(start_page) if start_page is not None else None,
+            "article_files": [Path(p) for p in articles] if articles is not None else None,
+            "draft": bool(params.get("draft", False)),
+            "recursive": bool(params.get("recursive", False)),
+        }
+    except (TypeError, ValueError) as exc:
+        raise ValueError(f"invalid job field: {exc}") from exc
+
+
+class Worker:
+    """Runs queued jobs on a background thread with a warm base cache."""
+
+    def __init__(self, cache_size: int = 4):
+        self.cache = BaseCache(cache_size)
+        self.jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._queue: "queue.Queue[Optional[Job]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="journal-worker", daemon=True)
+        self._thread.start()
+
+    def submit(self, params: dict) -> Job:
+        job = Job(job_arguments(params))
+        with self._lock:
+            self.jobs[job.id] = job
+            finished = [j for j in self.jobs.values() if j.done.is_set()]
+            for old in finished[: max(len(finished) - KEEP_FINISHED, 0)]:
+                del self.jobs[old.id]
+        self._queue.put(job)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self.jobs.get(job_id)
+
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def stop(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            job.status = "running"
+            start = time.perf_counter()
+            try:
+                kwargs = dict(job.kwargs)
+                base = self.cache.get(kwargs["base_path"])
+                findings = _updater().update_journal(base_doc=base, **kwargs)
+                job.result = {"findings": findings}
+                job.status = "done"
+            except Exception as exc:
+                logging.exception("job %s failed", job.id)
+                job.error = f"{type(exc).__name__}: {exc}"
+                job.status = "failed"
+            finally:
+                job.seconds = round(time.perf_counter() - start, 4)
+                job.done.set()
+
+
+def _host_name(host: str) -> str:
+    """Return the name part of a ``Host`` header (``[::1]:8765`` -> ``::1``)."""
+    if host.startswith("["):
+        return host[1:].split("]", 1)[0]
+    return host.rsplit(":", 1)[0] if host.count(":") == 1 else host
+
+
+class _Handler(BaseHTTPRequestHandler):
+    worker: Worker
+    token: Optional[str] = None
+
+    def log_message(self, format, *args):
+        logging.info("%s %s", self.address_string(), format % args)
+
+    def _reply(self, code: int, payload: dict) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _refused(self) -> bool:
+        """Reply with an error and return ``True`` unless the client may talk to us."""
+        if self.headers.get("Origin") is not None:
+            self._reply(403, {"error": "cross-origin requests are not allowed"})
+            return True
+        if _host_name(self.headers.get("Host", "")).lower() not in _LOOPBACK:
+            self._reply(403, {"error": "host not allowed"})
+            return True
+        if self.token is not None:
+            auth = self.headers.get("Authorization", "")
+            if not secrets.compare_digest(auth.encode(), f"Bearer {self.token}".encode()):
+                self._reply(401, {"error": "missing or wrong token"})
+                return True
+        return False
+
+    def _route(self):
+        url = urlsplit(self.path)
+        wait = parse_qs(url.query).get("wait", ["0"])[0] not in ("0", "")
+        return url.path.rstrip("/"), wait
+
+    def do_POST(self):
+        if self._refused():
+            return
+        content_type = self.headers.get("Content-Type", "").split(";")[0].strip().lower()
+        if content_type != "application/json":
+            self._reply(415, {"error": "jobs must be sent as application/json"})
+            return
+        path, wait = self._route()
+        if path != "/jobs":
+            self._reply(404, {"error": "not found"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            params = json.loads(self.rfile.read(length) or b"{}")
+            job = self.worker.submit(params)
+        except ValueError as exc:  # includes JSONDecodeError
+            self._reply(400, {"error": str(exc)})
+            return
+        if wait:
+            job.done.wait()
+        self._reply(200 if wait else 202, job.as_dict())
+
+    def do_GET(self):
+        if self._refused():
+            return
+        path, wait = self._route()
+        if path == "/status":
+            cache = self.worker.cache
+            self._reply(
+                200,
+                {
+                    "queued": self.worker.pending(),
+                    "cache": {"size": len(cache), "hits": cache.hits, "misses": cache.misses},
+                },
+            )
+            return
+        if path.startswith("/jobs/"):
+            job = self.worker.get(path[len("/jobs/"):])
+            if job is not None:
+                if wait:
+                    job.done.wait()
+                self._reply(200, job.as_dict())
+                return
+        self._reply(404, {"error": "not found"})
+
+
+def make_server(
+    host: str = "127.0.0.1",
+    port: int = DEFAULT_PORT,
+    worker: Optional[Worker] = None,
+    token: Optional[str] = None,
+) -> ThreadingHTTPServer:
+    """Return an HTTP server bound to ``host``/``port`` that feeds ``worker``.
+
+    With ``token`` set every request must carry it as a bearer token.
+    """
+    handler = type("Handler", (_Handler,), {"worker": worker or Worker(), "token": token})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def submit(
+    params: dict,
+    url: str = f"http://127.0.0.1:{DEFAULT_PORT}",
+    wait: bool = True,
+    token: Optional[str] = None,
+) -> dict:
+    """Send a job to a running worker and return its state as a dictionary."""
+    data = json.dumps(params).encode("utf-8")
+    headers = {"Content-Type": "application/json"}
+    if token is not None:
+        headers["Authorization"] = f"Bearer {token}"
+    req = urlrequest.Request(
+        f"{url.rstrip('/')}/jobs{'?wait=1' if wait else ''}",
+        data=data,
+        headers=headers,
+        method="POST",
+    )
+    try:
+        with urlrequest.urlopen(req) as resp:
+            return json.loads(resp.read())
+    except urlerror.HTTPError as exc:
+        detail = json.loads(exc.read() or b"{}").get("error", exc.reason)
+        raise ValueError(f"worker rejected the job: {detail}") from exc
+
+
+def serve_main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m journal_updater serve",
+        description="Keep a warm worker running for update jobs",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument(
+        "--token-file", type=Path, default=None, dest="token_file",
+        help="Where to write the session token (default: ~/.journal_updater/worker-PORT.token)",
+    )
+    parser.add_argument(
+        "--cache-size", type=int, default=4, dest="cache_size",
+        help="Number of parsed base documents kept in memory",
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    _updater()  # pay for python-docx and lxml once, before the first job
+    token_file = args.token_file or token_path(args.port)
+    token = write_token(token_file)
+    server = make_server(args.host, args.port, Worker(args.cache_size), token)
+    print(f"Serving update jobs on http://{args.host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        token_file.unlink(missing_ok=True)
+
+
+def submit_main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m journal_updater submit",
+        description="Run an update on a warm worker",
+    )
+    cli.add_update_arguments(parser, plan=False, resume=False)
+    parser.add_argument("--url", default=f"http://127.0.0.1:{DEFAULT_PORT}")
+    parser.add_argument("--token-file", type=Path, default=None, dest="token_file")
+    args = parser.parse_args(argv)
+
+    params = vars(args).copy()
+    url = params.pop("url")
+    token_file = params.pop("token_file") or token_path(urlsplit(url).port or DEFAULT_PORT)
+    token = read_token(token_file)
+    if token is None:
+        print(f"No worker token in {token_file}; is the worker running?", file=sys.stderr)
+        return 1
+    # the worker may run in another directory
+    for key in ("base_doc", "content_folder", "output_doc"):
+        params[key] = str(Path(params[key]).resolve())
+    try:
+        job = submit(params, url, token=token)
+    except (OSError, ValueError) as exc:
+        print(f"Could not run job: {exc}", file=sys.stderr)
+        return 1
+    if job["status"] != "done":
+        print(f"Job failed: {job['error']}", file=sys.stderr)
+        return 1
+    for finding in job["result"]["findings"]:
+        print(f"{finding['check']}: {finding['message']}")
+    print(f"Done in {job['seconds']:.2f}s")
+    return 0
@@ -0,0 +1,112 @@
+"""Collapse redundant whitespace in paragraphs without touching formatting.
+
+Word splits text over many runs, so two spaces are often the last character
+of one run and the first of the next. :func:`normalize_paragraph` joins the
+``w:t`` text of a paragraph (tabs included as ``\\t``), finds every fix with
+one compiled regular expression and writes the result back run by run. Each
+run keeps its formatting and only loses characters, and a paragraph without
+anything to fix is not modified.
+
+The rules:
+
+- two or more spaces or non-breaking spaces become one character, a
+  non-breaking space if all of them were, otherwise a plain space;
+- spaces next to a tab are dropped; the tab stays;
+- with ``strip`` set, leading and trailing whitespace is removed as well.
+"""
+
+import re
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
+
+from docx.oxml.ns import qn
+
+_W_P = qn("w:p")
+_W_R = qn("w:r")
+_W_T = qn("w:t")
+_W_TAB = qn("w:tab")
+_XML_SPACE = "{http://www.w3.org/XML/1998/namespace}space"
+
+NBSP = "\u00a0"
+_BLANK = " " + NBSP
+
+_FIXES = re.compile(r"[ \u00a0]*\t[ \u00a0]*|[ \u00a0]{2,}")
+_EDGES = re.compile(r"^[ \u00a0\t]+|[ \u00a0\t]+$")
+
+
+def _segments(p) -> Tuple[List[Tuple[object, int]], str]:
+    """Return ``(node, offset)`` for the text pieces of ``p`` and their text.
+
+    Text boxes nested inside ``p`` are paragraphs of their own and skipped,
+    as are the tab stops defined in ``w:pPr/w:tabs``, which are not text.
+    """
+    segments = []
+    parts = []
+    offset = 0
+    for node in p.iter(_W_T, _W_TAB):
+        if node.getparent().tag != _W_R or next(node.iterancestors(_W_P), None) is not p:
+            continue
+        text = "\t" if node.tag == _W_TAB else (node.text or "")
+        if not text:
+            continue
+        segments.append((node, offset))
+        parts.append(text)
+        offset += len(text)
+    return segments, "".join(parts)
+
+
+def _edits(text: str, strip: bool) -> Dict[int, Optional[str]]:
+    """Return ``{position: new character or None to delete}`` for ``text``."""
+    edits: Dict[int, Optional[str]] = {}
+    for m in _FIXES.finditer(text):
+        run = m.group()
+        if run == "\t":
+            continue
+        tab = run.find("\t")
+        if tab >= 0:
+            keep, char = m.start() + tab, "\t"
+        else:
+            keep = m.start()
+            char = NBSP if all(ch == NBSP for ch in run) else " "
+        for pos in range(m.start(), m.end()):
+            if pos == keep:
+                if text[pos] != char:
+                    edits[pos] = char
+            else:
+                edits[pos] = None
+    if strip:
+        for m in _EDGES.finditer(text):
+            for pos in range(m.start(), m.end()):
+                edits[pos] = None
+    return edits
+
+
+def normalize_paragraph(p, strip: bool = False) -> bool:
+    """Fix the whitespace of the ``w:p`` element ``p``; return whether it changed."""
+    segments, text = _segments(p)
+    if not text:
+        return False
+    edits = _edits(text, strip)
+    if not edits:
+        return False
+    positions = sorted(edits)
+    for node, offset in segments:
+        if node.tag == _W_TAB:
+            if edits.get(offset, "\t") is None:
+                node.getparent().remove(node)
+            continue
+        old = node.text
+        first = bisect_left(positions, offset)
+        if first == len(positions) or positions[first] >= offset + len(old):
+            continue
+        chars = []
+        for i, ch in enumerate(old):
+            new = edits.get(offset + i, ch)
+            if new is not None:
+                chars.append(new)
+        new_text = "".join(chars)
+        if new_text != old:
+            node.text = new_text
+            if new_text and (new_text[0] in _BLANK or new_text[-1] in _BLANK):
+                node.set(_XML_SPACE, "preserve")
+    return True
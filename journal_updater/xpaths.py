@@ -0,0 +1,68 @@
+"""Precompiled XPath queries over WordprocessingML.
+
+Compiling an expression costs far more than evaluating it, and
+``element.xpath()`` compiles its string on every call. The queries below are
+compiled once with the namespaces of a ``.docx`` bound, so ``PAGE_BREAKS(el)``
+is as cheap as a query can be. Besides the per-element queries there are set
+queries meant to be evaluated once on ``w:body``; they return every block
+of a kind in a single pass, which callers turn into a ``set`` for membership
+tests while walking the body.
+"""
+
+from lxml import etree
+
+NS = {
+    "w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main",
+    "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
+    "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
+    "wp": "http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing",
+    "pic": "http://schemas.openxmlformats.org/drawingml/2006/picture",
+    "wps": "http://schemas.microsoft.com/office/word/2010/wordprocessingShape",
+    "mc": "http://schemas.openxmlformats.org/markup-compatibility/2006",
+    "v": "urn:schemas-microsoft-com:vml",
+    "o": "urn:schemas-microsoft-com:office:office",
+}
+
+
+def query(path: str) -> etree.XPath:
+    """Return ``path`` compiled with the :data:`NS` prefixes bound."""
+    return etree.XPath(path, namespaces=NS)
+
+
+# -- per element -------------------------------------------------------------
+
+# manual page breaks below an element
+PAGE_BREAKS = query(".//w:br[@w:type='page']")
+# paragraph has a visible bottom border
+HAS_BOTTOM_BORDER = query("boolean(w:pPr/w:pBdr/w:bottom[not(@w:val='nil')])")
+# column widths of a table
+GRID_COLS = query("w:tblGrid/w:gridCol")
+# VML and DrawingML shapes that might draw a rule
+LINE_SHAPES = query(".//v:line | .//v:rect | .//v:shape | .//wps:wsp")
+# preset geometry and size of a DrawingML shape
+SHAPE_GEOMETRY = query(".//a:prstGeom/@prst")
+SHAPE_EXTENT = query(".//a:xfrm/a:ext")
+
+# -- whole body, evaluated on w:body -----------------------------------------
+
+# top-level paragraphs
+BODY_PARAGRAPHS = query("w:p")
+# top-level tables
+BODY_TABLES = query("w:tbl")
+# paragraphs anywhere in the body holding a manual page break
+PAGE_BREAK_PARAGRAPHS = query(".//w:p[.//w:br[@w:type='page']]")
+# top-level blocks holding anything that may start or end a page; the
+# others can be placed without looking inside them
+BREAK_BLOCKS = query(
+    "*[.//w:br[@w:type='page'] or .//w:lastRenderedPageBreak"
+    " or .//w:pageBreakBefore or .//w:sectPr]"
+)
+# top-level paragraphs drawn with a bottom border
+BORDERED_PARAGRAPHS = query("w:p[w:pPr/w:pBdr/w:bottom[not(@w:val='nil')]]")
+# top-level paragraphs that may be a separator line: bordered, or holding
+# only dash characters or shapes; _is_line_element makes the final call
+LINE_CANDIDATES = query(
+    "w:p[w:pPr/w:pBdr/w:bottom[not(@w:val='nil')]"
+    " or (not(.//w:t[translate(., '-_\u2014\u2013 \u00a0\t', '') != ''])"
+    " and (.//w:t or .//v:line or .//v:rect or .//v:shape or .//wps:wsp))]"
+)
@@ -0,0 +1,70 @@
+import os
+import sys
+
+from docx.enum.text import WD_BREAK
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import journal_updater.journal_updater as ju
+from journal_updater.archive import Archive, issue_entries
+
+
+def _issue(path, title, author, editor="Dr. Jane Roe"):
+    doc = ju.Document()
+    doc.add_paragraph("Journal of the ABNFF").add_run().add_break(WD_BREAK.PAGE)
+    doc.add_paragraph("Associate Editors")
+    doc.add_paragraph(editor).add_run().add_break(WD_BREAK.PAGE)
+    doc.add_paragraph("Table of Contents")
+    doc.add_paragraph("Editorial: Looking Ahead..........4")
+    doc.add_paragraph("ARTICLES")
+    doc.add_paragraph(f"{title}..........5")
+    doc.add_paragraph("")
+    doc.add_paragraph("Editorial: Looking Ahead").add_run().add_break(WD_BREAK.PAGE)
+    doc.add_paragraph("ARTICLES")
+    doc.add_paragraph(title)
+    doc.add_paragraph(author)
+    doc.add_paragraph("Body text.")
+    doc.save(path)
+    return path
+
+
+def test_issue_entries(tmp_path):
+    doc = ju.load_document(_issue(tmp_path / "2020-1.docx", "Nursing Care", "A. Smith, RN"))
+    entries = issue_entries(doc)
+    assert ("title", "Nursing Care", 4) in entries
+    assert ("author", "A. Smith, RN", 4) in entries
+    assert ("editorial", "Editorial: Looking Ahead", 3) in entries
+    assert ("masthead", "Dr. Jane Roe", 2) in entries
+    # the TOC line is not an editorial heading
+    assert not any(kind == "editorial" and "...." in text for kind, text, _ in entries)
+
+
+def test_search_and_incremental_index(tmp_path):
+    issues = tmp_path / "issues"
+    issues.mkdir()
+    _issue(issues / "2020-1.docx", "Nursing Care", "A. Smith, RN")
+    second = _issue(issues / "2021-1.docx", "Wound Healing", "B. Jones", editor="John Smithers")
+
+    with Archive(tmp_path / "archive.db") as archive:
+        assert archive.index_folder(issues) == 2
+        # unchanged files are not read again
+        assert archive.index_folder(issues) == 0
+
+        hits = archive.search("smith")
+        assert {(os.path.basename(h.path), h.kind) for h in hits} == {
+            ("2020-1.docx", "author"),
+            ("2021-1.docx", "masthead"),
+        }
+        assert [h.text for h in archive.search("smith", kind="author")] == ["A. Smith, RN"]
+        assert archive.search("wound heal")[0].page == 4
+        assert archive.search('"quoted" OR (') == []
+
+        _issue(second, "Pain Management", "B. Jones")
+        assert archive.index_folder(issues) == 1
+        assert archive.search("wound") == []
+        assert archive.search("pain")[0].kind == "title"
+
+        second.unlink()
+        archive.index_folder(issues)
+        assert archive.search("pain") == []
+        assert len(archive.files()) == 1
@@ -0,0 +1,152 @@
+import argparse
+import json
+import io
+import os
+import struct
+import sys
+import zipfile
+import zlib
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import journal_updater.journal_updater as ju
+from journal_updater import checkpoint, cli
+
+
+def _inputs(tmp_path):
+    base = ju.Document()
+    base.add_paragraph("Volume 1, Issue 1")
+    base.add_paragraph("ARTICLES")
+    base.add_paragraph("old article")
+    base_path = tmp_path / "base.docx"
+    base.save(base_path)
+
+    content = tmp_path / "content"
+    content.mkdir()
+    art = ju.Document()
+    art.add_paragraph("New article")
+    art.save(content / "article1.docx")
+    (content / "instructions.json").write_text(json.dumps({"font_size": 11}))
+    return base_path, content
+
+
+def test_resume_continues_after_last_stage(tmp_path, monkeypatch):
+    base_path, content = _inputs(tmp_path)
+    out_path = tmp_path / "out.docx"
+    ckpt = checkpoint.checkpoint_path(out_path)
+
+    def crash(*args):
+        raise RuntimeError("cleanup failed")
+
+    monkeypatch.setattr(ju, "save_pdf", lambda *args: None)
+    monkeypatch.setattr(ju, "update_table_of_contents", crash)
+    with pytest.raises(RuntimeError):
+        ju.update_journal(base_path, content, out_path, "2", "1", "June 2025", checkpoint=True)
+
+    with zipfile.ZipFile(ckpt) as snapshot:
+        manifest = json.loads(snapshot.read("checkpoint.json"))
+        stored = snapshot.namelist()
+    assert manifest["stage"] == "format"
+    # only changed members are kept; the unchanged styles come from the base
+    assert "word/document.xml" in stored
+    assert "word/styles.xml" not in stored
+
+    calls = []
+    monkeypatch.setattr(ju, "update_table_of_contents", lambda doc: calls.append("toc"))
+    monkeypatch.setattr(ju, "import_articles", lambda *args: calls.append("import"))
+    monkeypatch.setattr(ju, "set_font_size", lambda *args: calls.append("font"))
+    ju.update_journal(
+        base_path, content, out_path, "2", "1", "June 2025", checkpoint=True, resume=True
+    )
+
+    assert calls == ["toc"]
+    assert not ckpt.exists()
+    result = ju.Document(out_path)
+    texts = [p.text for p in result.paragraphs]
+    assert "New article" in texts and "old article" not in texts
+    assert result.paragraphs[-1].runs[0].font.size.pt == 11
+
+
+def _png():
+    def chunk(kind, data):
+        body = kind + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body))
+
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", struct.pack(">IIBBBBB", 1, 1, 8, 2, 0, 0, 0))
+        + chunk(b"IDAT", zlib.compress(b"\x00\xff\x00\x00"))
+        + chunk(b"IEND", b"")
+    )
+
+
+def test_second_resume_keeps_earlier_stages(tmp_path):
+    base_path, _ = _inputs(tmp_path)
+    ckpt = tmp_path / "out.docx.checkpoint"
+
+    doc = ju.load_document(base_path)
+    doc.styles.add_style("Imported", 1)
+    doc.add_picture(io.BytesIO(_png()))
+    checkpoint.save_checkpoint(doc, ckpt, "import", "k", {"start_idx": 2})
+
+    doc, stage, _ = checkpoint.load_checkpoint(ckpt, "k", base_path)
+    assert stage == "import"
+    doc.add_paragraph("Formatted")
+    checkpoint.save_checkpoint(doc, ckpt, "format", "k", {"start_idx": 2})
+
+    doc, stage, _ = checkpoint.load_checkpoint(ckpt, "k", base_path)
+    assert stage == "format"
+    assert "Imported" in [s.name for s in doc.styles]
+    assert doc.paragraphs[-1].text == "Formatted"
+    assert len(doc.inline_shapes) == 1
+
+
+def test_resume_starts_over_when_inputs_changed(tmp_path, monkeypatch):
+    base_path, content = _inputs(tmp_path)
+    out_path = tmp_path / "out.docx"
+
+    def crash(*args):
+        raise RuntimeError("formatting failed")
+
+    monkeypatch.setattr(ju, "save_pdf", lambda *args: None)
+    monkeypatch.setattr(ju, "set_font_size", crash)
+    with pytest.raises(RuntimeError):
+        ju.update_journal(base_path, content, out_path, "2", "1", "June 2025", checkpoint=True)
+    assert checkpoint.checkpoint_path(out_path).exists()
+    monkeypatch.undo()
+    monkeypatch.setattr(ju, "save_pdf", lambda *args: None)
+
+    art = ju.Document()
+    art.add_paragraph("Revised article")
+    art.save(content / "article1.docx")
+    ju.update_journal(base_path, content, out_path, "2", "1", "June 2025", resume=True)
+
+    texts = [p.text for p in ju.Document(out_path).paragraphs]
+    assert "Revised article" in texts and "New article" not in texts
+
+
+def test_command_line_checkpoints_except_drafts(tmp_path, monkeypatch):
+    base_path, content = _inputs(tmp_path)
+    saved = []
+    monkeypatch.setattr(ju, "save_pdf", lambda *args: None)
+    monkeypatch.setattr(
+        checkpoint, "save_checkpoint", lambda doc, path, stage, *rest: saved.append(stage)
+    )
+    args = [
+        str(base_path), str(content), str(tmp_path / "out.docx"),
+        "--volume", "2", "--issue", "1", "--month-year", "June 2025",
+    ]
+
+    ju.main(args + ["--draft"])
+    assert saved == []
+    ju.main(args)
+    assert saved == list(checkpoint.STAGES)
+
+
+def test_resume_is_a_separate_switch():
+    parser = argparse.ArgumentParser()
+    cli.add_update_arguments(parser, plan=True, resume=False)
+    options = {a.dest for a in parser._actions}
+    assert "plan" in options and "resume" not in options
@@ -0,0 +1,102 @@
+import os
+import sys
+import zipfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.opc.packuri import PackURI
+from docx.opc.part import Part
+from docx.oxml import OxmlElement
+
+import journal_updater.journal_updater as ju
+from journal_updater.cleanup import strip_bloat
+
+
+def _bookmark(p, tag, mark_id, name=None):
+    el = OxmlElement(f"w:{tag}")
+    el.set(ju.qn("w:id"), str(mark_id))
+    if name:
+        el.set(ju.qn("w:name"), name)
+    p._p.append(el)
+
+
+def _bloated():
+    doc = ju.Document()
+    p = doc.add_paragraph("Hello")
+    p._p.set(ju.qn("w:rsidR"), "00A1B2C3")
+    p._p.set(ju.qn("w:rsidRDefault"), "00A1B2C3")
+    p.runs[0]._r.set(ju.qn("w:rsidRPr"), "00D4E5F6")
+    p._p.append(OxmlElement("w:proofErr"))
+    p.runs[0]._r.append(OxmlElement("w:lastRenderedPageBreak"))
+    _bookmark(p, "bookmarkStart", 1, "_GoBack")
+    _bookmark(p, "bookmarkEnd", 1)
+    _bookmark(p, "bookmarkStart", 2, "kept")
+    _bookmark(p, "bookmarkEnd", 2)
+    _bookmark(p, "bookmarkStart", 3, "orphan")
+    _bookmark(p, "bookmarkEnd", 4)
+    settings = doc.settings.element
+    rsids = OxmlElement("w:rsids")
+    for n in range(50):
+        rsid = OxmlElement("w:rsid")
+        rsid.set(ju.qn("w:val"), f"{n:08X}")
+        rsids.append(rsid)
+    settings.append(rsids)
+    settings.append(OxmlElement("w:embedTrueTypeFonts"))
+    return doc, p
+
+
+def test_strip_bloat():
+    doc, p = _bloated()
+    stats = strip_bloat(doc, measure=True)
+
+    xml = p._p.xml
+    assert "rsid" not in xml and "proofErr" not in xml
+    assert "_GoBack" not in xml and "orphan" not in xml
+    assert 'w:name="kept"' in xml
+    assert xml.count("bookmarkEnd") == 1
+    # the body keeps Word's page markers, scan_pages needs them
+    assert "lastRenderedPageBreak" in xml
+    settings = doc.settings.element.xml
+    assert "w:rsids" not in settings and "embedTrueTypeFonts" not in settings
+
+    # the default template carries some of its own
+    assert stats["attributes"] >= 3
+    assert stats["bookmarks"] == 3
+    assert stats["bytes_after"] < stats["bytes_before"]
+    assert p.text == "Hello"
+
+
+def test_rendered_breaks_on_request(tmp_path):
+    doc, p = _bloated()
+    strip_bloat(doc, rendered_breaks=True)
+    assert "lastRenderedPageBreak" not in p._p.xml
+
+    out = tmp_path / "out.docx"
+    doc.save(out)
+    assert ju.Document(out).paragraphs[0].text == "Hello"
+
+
+def test_embedded_fonts_are_dropped(tmp_path):
+    doc = ju.Document()
+    table = doc.part.part_related_by(RT.FONT_TABLE)
+    font = Part(
+        PackURI("/word/fonts/font1.odttf"),
+        "application/vnd.openxmlformats-officedocument.obfuscatedFont",
+        b"\0" * 1000,
+    )
+    rid = table.relate_to(font, RT.FONT)
+    table._blob = table.blob.replace(
+        b"</w:font>",
+        f'<w:embedRegular r:id="{rid}" w:fontKey="{{00000000-0000-0000-0000-000000000000}}"'
+        ' xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"/>'
+        "</w:font>".encode(),
+        1,
+    )
+
+    stats = strip_bloat(doc)
+    assert stats["fonts"] == 1
+    assert b"embedRegular" not in table.blob
+    out = tmp_path / "out.docx"
+    doc.save(out)
+    assert not any(n.startswith("word/fonts/") for n in zipfile.ZipFile(out).namelist())
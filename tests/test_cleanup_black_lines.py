@@ -0,0 +1,77 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from docx.enum.text import WD_BREAK
+from docx.oxml import parse_xml
+
+import journal_updater.journal_updater as ju
+from journal_updater import xpaths
+
+_WPS_LINE = (
+    '<w:r xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+    ' xmlns:wp="http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing"'
+    ' xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main"'
+    ' xmlns:wps="http://schemas.microsoft.com/office/word/2010/wordprocessingShape">'
+    "<w:drawing><wp:anchor><a:graphic><a:graphicData><wps:wsp>"
+    '<wps:spPr><a:xfrm><a:off x="0" y="0"/><a:ext cx="5943600" cy="0"/></a:xfrm>'
+    '<a:prstGeom prst="line"/></wps:spPr>'
+    "</wps:wsp></a:graphicData></a:graphic></wp:anchor></w:drawing></w:r>"
+)
+
+
+def _shape_line(doc, pict):
+    p = doc.add_paragraph()
+    p._p.append(pict)
+    return p
+
+
+def _texts(doc):
+    return [p.text for p in doc.paragraphs]
+
+
+def test_keeps_first_line_per_page():
+    doc = ju.Document()
+    doc.add_paragraph("one")
+    doc.add_paragraph("-----")
+    doc.add_paragraph("_____")
+    doc.add_paragraph("end").add_run().add_break(WD_BREAK.PAGE)
+    doc.add_paragraph("-----")
+    doc.add_paragraph("two")
+
+    ju.cleanup_black_lines(doc)
+    assert _texts(doc) == ["one", "-----", "end", "-----", "two"]
+
+
+def test_vml_and_drawingml_rules_count_as_lines():
+    doc = ju.Document()
+    first = _shape_line(doc, ju.make_article_title())
+    title = doc.add_paragraph("Article title")
+    title._p.append(ju.make_article_title())
+    column = _shape_line(doc, ju.make_columns())
+    drawing = doc.add_paragraph()
+    drawing._p.append(parse_xml(_WPS_LINE))
+    dashes = doc.add_paragraph("---")
+
+    body = doc.element.body
+    assert ju._is_line_element(first._p, "")
+    assert not ju._is_line_element(title._p, "Article title")
+    assert not ju._is_line_element(column._p, "")
+    assert ju._is_line_element(drawing._p, "")
+
+    ju.cleanup_black_lines(doc)
+    remaining = list(body.iterchildren(ju.qn("w:p")))
+    assert first._p in remaining and title._p in remaining and column._p in remaining
+    assert drawing._p not in remaining and dashes._p not in remaining
+
+
+def test_candidates_come_from_one_query():
+    doc = ju.Document()
+    doc.add_paragraph("text - with dashes")
+    doc.add_paragraph("-- ")
+    dash = doc.add_paragraph("———")
+    shape = _shape_line(doc, ju.make_article_title())
+    assert xpaths.LINE_CANDIDATES(doc.element.body)[-2:] == [dash._p, shape._p]
+    page_map = ju.scan_pages(doc)
+    assert page_map.pages_of([dash._p, shape._p]) == [1, 1]
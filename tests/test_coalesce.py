@@ -0,0 +1,61 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from docx.oxml import OxmlElement
+from docx.shared import Pt
+
+import journal_updater.journal_updater as ju
+from journal_updater.coalesce import coalesce_runs
+
+
+def test_merges_runs_with_equal_properties():
+    doc = ju.Document()
+    p = doc.add_paragraph()
+    for ch in "Hello ":
+        p.add_run(ch).font.size = Pt(10)
+    p._p.append(OxmlElement("w:proofErr"))
+    for ch in "world":
+        run = p.add_run(ch)
+        run.font.size = Pt(10)
+        run.bold = True
+    p.add_run().add_tab()
+    p.add_run("end")
+
+    stats = coalesce_runs(doc.element.body, measure=True)
+
+    assert p.text == "Hello world\tend"
+    assert [r.text for r in p.runs] == ["Hello ", "world", "\tend"]
+    assert p.runs[0]._r.find(ju.qn("w:t")).get(
+        "{http://www.w3.org/XML/1998/namespace}space"
+    ) == "preserve"
+    assert p.runs[1].bold and not p.runs[0].bold
+    assert stats["runs_before"] == 13 and stats["runs_after"] == 3
+    assert stats["proof_errors"] == 1
+    assert stats["bytes_after"] < stats["bytes_before"]
+
+
+def test_keeps_fields_and_pictures_apart():
+    doc = ju.Document()
+    p = doc.add_paragraph("before ")
+    field = p.add_run()
+    field._r.append(OxmlElement("w:fldChar"))
+    p.add_run("after")
+
+    stats = coalesce_runs(doc.element.body)
+    assert stats["runs_after"] == 3
+    assert [r.text for r in p.runs] == ["before ", "", "after"]
+
+
+def test_attribute_order_does_not_matter():
+    doc = ju.Document()
+    p = doc.add_paragraph()
+    for order in (("w:ascii", "w:hAnsi"), ("w:hAnsi", "w:ascii")):
+        run = p.add_run("x")
+        fonts = OxmlElement("w:rFonts")
+        for name in order:
+            fonts.set(ju.qn(name), "Arial")
+        run._r.get_or_add_rPr().append(fonts)
+    coalesce_runs(doc.element.body)
+    assert [r.text for r in p.runs] == ["xx"]
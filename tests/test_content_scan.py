@@ -0,0 +1,100 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import journal_updater.journal_updater as ju
+from journal_updater import content as content_scan
+
+
+def _touch(path, data=b"x"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+
+
+def _bump(directory):
+    st = os.stat(directory)
+    os.utime(directory, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def test_scan_content_classifies_in_one_pass(tmp_path):
+    for name in (
+        "Article2.docx",
+        "article1.DOCX",
+        "~$article1.docx",
+        ".hidden.docx",
+        "president_message.txt",
+        "president.jpg",
+        "logo.png",
+        "instructions.json",
+        "notes.pdf",
+    ):
+        _touch(tmp_path / name)
+    _touch(tmp_path / "smith" / "article_smith.docx")
+    _touch(tmp_path / "smith" / "instructions.json")
+
+    folder = content_scan.scan_content(tmp_path, manifest={})
+    assert [p.name for p in folder.articles] == ["Article2.docx", "article1.DOCX"]
+    assert folder.message == tmp_path / "president_message.txt"
+    assert folder.president_image == tmp_path / "president.jpg"
+    assert folder.instructions == tmp_path / "instructions.json"
+    assert [p.name for p in folder.images] == ["logo.png"]
+    assert [f.path.name for f in folder.of_kind("other")] == ["notes.pdf"]
+
+    nested = content_scan.scan_content(tmp_path, recursive=True, manifest={})
+    assert tmp_path / "smith" / "article_smith.docx" in nested.articles
+    # instructions are only read from the top of the folder
+    assert nested.instructions == tmp_path / "instructions.json"
+    smith = sorted(f.kind for f in nested.files if f.path.parent.name == "smith")
+    assert smith == ["article", "other"]
+
+
+def test_manifest_skips_unchanged_directories(tmp_path, monkeypatch):
+    _touch(tmp_path / "article1.docx", b"abc")
+    _touch(tmp_path / "sub" / "article2.docx")
+    listed = []
+    real_scandir = os.scandir
+
+    def counting_scandir(path):
+        listed.append(os.path.basename(path))
+        return real_scandir(path)
+
+    monkeypatch.setattr(content_scan.os, "scandir", counting_scandir)
+    manifest = {}
+    first = content_scan.scan_content(tmp_path, recursive=True, manifest=manifest)
+    assert len(listed) == 2
+    assert first.files[0].size == 3
+
+    again = content_scan.scan_content(tmp_path, recursive=True, manifest=manifest)
+    assert len(listed) == 2
+    assert again.articles == first.articles
+
+    _touch(tmp_path / "sub" / "article3.docx")
+    _bump(tmp_path / "sub")
+    changed = content_scan.scan_content(tmp_path, recursive=True, manifest=manifest)
+    assert len(listed) == 3
+    assert [p.name for p in changed.articles] == ["article1.docx", "article2.docx", "article3.docx"]
+
+    content_scan.scan_content(tmp_path, recursive=True, refresh=True, manifest=manifest)
+    assert len(listed) == 5
+
+
+def test_missing_folder_is_empty(tmp_path, monkeypatch):
+    folder = content_scan.scan_content(tmp_path / "missing", recursive=True, manifest={})
+    assert folder.files == [] and folder.message is None
+
+    monkeypatch.setattr(ju, "save_pdf", lambda *args: None)
+    base = ju.Document()
+    base.add_paragraph("Volume 1, Issue 1")
+    base.add_paragraph("ARTICLES")
+    base.save(tmp_path / "base.docx")
+    art = ju.Document()
+    art.add_paragraph("Given article")
+    art.save(tmp_path / "a.docx")
+
+    out = tmp_path / "out.docx"
+    ju.update_journal(
+        tmp_path / "base.docx", tmp_path / "missing", out, "2", "1", "June 2025",
+        article_files=[tmp_path / "a.docx"],
+    )
+    assert "Given article" in [p.text for p in ju.Document(out).paragraphs]
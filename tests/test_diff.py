@@ -0,0 +1,48 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from docx.enum.text import WD_BREAK
+
+import journal_updater.journal_updater as ju
+from journal_updater import diff
+
+
+def _issue(texts):
+    doc = ju.Document()
+    for text in texts:
+        if text == "<break>":
+            doc.paragraphs[-1].add_run().add_break(WD_BREAK.PAGE)
+        elif text == "<table>":
+            doc.add_table(rows=1, cols=2).cell(0, 0).text = "cell"
+        else:
+            doc.add_paragraph(text)
+    return doc
+
+
+def test_diff_documents_reports_ops_per_page(tmp_path):
+    old = _issue(["Cover", "<break>", "Intro", "Old article", "Old text", "Same end"])
+    new = _issue(["Cover", "<break>", "Intro", "New article", "<table>", "Same end"])
+    new.paragraphs[0].runs[0].font.bold = True
+
+    changes = diff.diff_documents(old, new)
+    ops = [(c["op"], c["text"]) for c in changes]
+    assert ("changed", "Cover") in ops
+    assert ("changed", "New article") in ops
+    assert ("removed", "Old text") in ops
+    assert ("inserted", "cell | ") in ops
+    assert ("changed", "Same end") not in ops
+    assert all(c["new_page"] == 2 for c in changes if c["text"] != "Cover")
+
+    old.save(tmp_path / "old.docx")
+    new.save(tmp_path / "new.docx")
+    text = diff.format_diff(diff.diff_files(tmp_path / "old.docx", tmp_path / "new.docx"))
+    assert text.splitlines()[0] == "Page 1:"
+    assert "  + cell | " in text
+
+
+def test_diff_identical_documents():
+    doc = _issue(["a", "b", "a"])
+    assert diff.diff_documents(doc, doc) == []
+    assert diff.format_diff([]) == "No differences"
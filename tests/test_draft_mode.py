@@ -0,0 +1,57 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from docx.oxml.ns import qn
+from docx.text.paragraph import Paragraph
+
+import journal_updater.journal_updater as ju
+
+
+def test_update_journal_draft(tmp_path, monkeypatch):
+    base = ju.Document()
+    base.add_paragraph("Volume 1, Issue 1")
+    base.add_paragraph("ARTICLES")
+    base_path = tmp_path / "base.docx"
+    base.save(base_path)
+
+    content = tmp_path / "content"
+    content.mkdir()
+    art = ju.Document()
+    art.add_paragraph("Draft article")
+    art.save(content / "article1.docx")
+
+    exported = []
+    monkeypatch.setattr(ju, "save_pdf", lambda *args: exported.append(args))
+
+    out_path = tmp_path / "out.docx"
+    ju.update_journal(
+        base_path, content, out_path, "2", "1", "June 2025", draft=True
+    )
+
+    assert exported == []
+    result = ju.Document(out_path)
+    header = result.sections[0].header
+    stamps = ju.find_generated(header._element, "draft")
+    assert len(stamps) == 1 and header._element[0] is stamps[0]
+    stamp = Paragraph(stamps[0].find(qn("w:sdtContent"))[0], header)
+    assert stamp.text == "DRAFT"
+    assert stamp.runs[0].font.bold
+    assert len(result.sections[0].footer.tables) == 0
+    assert "Draft article" in [p.text for p in result.paragraphs]
+
+
+def test_mark_draft_stamps_first_and_even_page_headers():
+    doc = ju.Document()
+    doc.add_paragraph("cover")
+    doc.settings.odd_and_even_pages_header_footer = True
+    section = doc.sections[0]
+    section.different_first_page_header_footer = True
+    section.first_page_header.add_paragraph("Cover header")
+
+    for _ in range(2):
+        ju.mark_draft(doc)
+
+    for header in (section.header, section.first_page_header, section.even_page_header):
+        assert len(ju.find_generated(header._element, "draft")) == 1
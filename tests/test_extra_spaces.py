@@ -4,6 +4,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")
 
 import journal_updater.journal_updater as ju
 from docx.enum.text import WD_BREAK
+from docx.shared import Inches
 
 
 def _build_doc():
@@ -30,3 +31,68 @@ def test_map_pages_to_paragraphs():
     assert 1 in pages and 2 in pages
     assert any(p.text.startswith("Page 1") for p in pages[1])
     assert any(p.text.startswith("Page 2") for p in pages[2])
+
+
+def test_spaces_across_runs_keep_formatting():
+    doc = ju.Document()
+    p = doc.add_paragraph("Smith  ")
+    bold = p.add_run("  and  Jones")
+    bold.bold = True
+    p.add_run("  x ")
+    tabbed = doc.add_paragraph("a  ")
+    tabbed.add_run().add_tab()
+    tabbed.add_run("  b")
+    untouched = doc.add_paragraph("one space only")
+    before = untouched._p.xml
+
+    assert ju.normalize_whitespace(doc) == 2
+    assert p.text == "Smith and Jones x "
+    assert [r.text for r in p.runs] == ["Smith ", "and Jones", " x "]
+    assert p.runs[1].bold
+    assert tabbed.text == "a\tb"
+    assert untouched._p.xml == before
+
+
+def test_long_run_of_spaces_is_linear():
+    doc = ju.Document()
+    p = doc.add_paragraph("a" + " " * 200000 + "b")
+    ju.normalize_whitespace(doc)
+    assert p.text == "a b"
+
+
+def test_author_line():
+    doc = ju.Document()
+    doc.add_paragraph("Table of Contents")
+    doc.add_paragraph("ARTICLES")
+    doc.add_paragraph("First Study.....3")
+    doc.add_paragraph("Second Study.....4").add_run().add_break(WD_BREAK.PAGE)
+    doc.add_paragraph("ARTICLES")
+    doc.add_paragraph("First Study")
+    doc.add_paragraph("")
+    doc.add_paragraph("  Jane  Doe,  PhD ")
+    doc.add_paragraph("Body  text")
+    doc.add_paragraph("Second Study")
+    doc.add_paragraph("John   Roe")
+
+    assert ju.remove_extra_spaces_in_author_line(doc, 2, 0)
+    assert ju.remove_extra_spaces_in_author_line(doc, 2, 1)
+    assert not ju.remove_extra_spaces_in_author_line(doc, 2, 2)
+    texts = [p.text for p in doc.paragraphs]
+    assert texts[7] == "Jane Doe, PhD"
+    assert texts[8] == "Body  text"
+    assert texts[10] == "John Roe"
+
+
+def test_tab_stops_are_not_text():
+    doc = ju.Document()
+    indented = doc.add_paragraph(" indented")
+    indented.paragraph_format.tab_stops.add_tab_stop(Inches(1))
+    author = doc.add_paragraph(" Jane Doe")
+    author.paragraph_format.tab_stops.add_tab_stop(Inches(1))
+
+    ju.normalize_whitespace(doc)
+    assert indented.text == " indented"
+    assert ju.whitespace.normalize_paragraph(author._p, strip=True)
+    assert author.text == "Jane Doe"
+    for p in (indented, author):
+        assert len(p.paragraph_format.tab_stops) == 1
@@ -0,0 +1,62 @@
+import os
+import sys
+import zipfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from docx.enum.section import WD_SECTION
+from docx.shared import Inches
+
+import journal_updater.journal_updater as ju
+
+
+def _footer_parts(path):
+    with zipfile.ZipFile(path) as zf:
+        return [n for n in zf.namelist() if n.startswith("word/footer")]
+
+
+def _issue(sections=4):
+    doc = ju.Document()
+    doc.add_paragraph("s0")
+    for n in range(1, sections):
+        doc.add_section(WD_SECTION.NEW_PAGE)
+        doc.add_paragraph(f"s{n}")
+    return doc
+
+
+def _footer_texts(doc):
+    return [
+        [c.text for c in s.footer.tables[0].rows[0].cells] if s.footer.tables else []
+        for s in doc.sections
+    ]
+
+
+def test_shared_footer_builds_one_part(tmp_path):
+    per_section = _issue()
+    ju.apply_footer_layout(per_section, "3", "2", "2025")
+    per_section.save(tmp_path / "copies.docx")
+
+    shared = _issue()
+    ju.apply_footer_layout(shared, "3", "2", "2025", shared=True)
+    shared.save(tmp_path / "shared.docx")
+
+    assert len(_footer_parts(tmp_path / "copies.docx")) == 4
+    assert len(_footer_parts(tmp_path / "shared.docx")) == 1
+    result = ju.Document(tmp_path / "shared.docx")
+    assert _footer_texts(result) == _footer_texts(ju.Document(tmp_path / "copies.docx"))
+    assert result.sections[0].different_first_page_header_footer
+
+
+def test_shared_footer_splits_on_width_and_content(tmp_path):
+    doc = _issue(5)
+    doc.sections[2].page_width = Inches(11)
+    doc.sections[4].footer.is_linked_to_previous = False
+    doc.sections[4].footer.paragraphs[0].text = "Erratum"
+
+    ju.apply_footer_layout(doc, "3", "2", "2025", shared=True)
+    linked = [s.footer.is_linked_to_previous for s in doc.sections]
+    assert linked == [False, True, False, False, False]
+    assert doc.sections[4].footer.paragraphs[0].text == "Erratum"
+    assert doc.sections[2].footer.tables[0]._tbl is not doc.sections[0].footer.tables[0]._tbl
+    doc.save(tmp_path / "out.docx")
+    assert len(_footer_parts(tmp_path / "out.docx")) == 4
@@ -0,0 +1,137 @@
+import io
+import os
+import struct
+import sys
+import zlib
+
+from docx.enum.text import WD_BREAK
+from docx.shared import Inches
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import journal_updater.journal_updater as ju
+from journal_updater import fragment_store
+from journal_updater.fragment_store import FragmentStore
+
+
+def _png(width, height):
+    def chunk(kind, data):
+        body = kind + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body))
+
+    row = b"\0" + bytes(x * 5 % 256 for x in range(width * 3))
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+        + chunk(b"IDAT", zlib.compress(row * height))
+        + chunk(b"IEND", b"")
+    )
+
+
+def _source_issue(path):
+    doc = ju.Document()
+    doc.add_paragraph("Table of Contents")
+    doc.add_paragraph("Information for Authors..........3")
+    doc.add_paragraph("Issue body").add_run().add_break(WD_BREAK.PAGE)
+    doc.add_paragraph("Information for Authors")
+    doc.add_paragraph("Manuscripts are submitted online.")
+    doc.add_picture(io.BytesIO(_png(20, 20)), width=Inches(1))
+    doc.paragraphs[-1].add_run().add_break(WD_BREAK.PAGE)
+    doc.add_paragraph("Membership Application")
+    doc.add_paragraph("Name: ________")
+    doc.save(path)
+    return path
+
+
+def _texts(doc):
+    return [p.text for p in doc.paragraphs]
+
+
+def test_info_for_authors_copies_section_and_picture(tmp_path):
+    source = _source_issue(tmp_path / "previous.docx")
+    store = FragmentStore(tmp_path / "store")
+    doc = ju.Document()
+    doc.add_paragraph("New issue")
+
+    assert ju.reuse_info_for_authors(doc, source, store)
+
+    texts = _texts(doc)
+    assert "Information for Authors" in texts
+    assert "Manuscripts are submitted online." in texts
+    assert "Membership Application" not in texts
+    first = doc.paragraphs[texts.index("Information for Authors")]
+    assert first.paragraph_format.page_break_before
+    blip = next(doc.element.body.iter(ju.qn("a:blip")))
+    image = doc.part.rels[blip.get(ju.qn("r:embed"))].target_part
+    assert image.blob == _png(20, 20)
+    assert store.names(source) == ["info-for-authors"]
+
+
+def test_cached_fragment_does_not_parse_source(tmp_path, monkeypatch):
+    source = _source_issue(tmp_path / "previous.docx")
+    store = FragmentStore(tmp_path / "store")
+    ju.reuse_membership_app(ju.Document(), source, store)
+
+    def fail(path):
+        raise AssertionError("source parsed again")
+
+    monkeypatch.setattr(ju, "load_document", fail)
+    # a fresh store reads the fragment from disk
+    doc = ju.Document()
+    assert ju.reuse_membership_app(doc, source, FragmentStore(tmp_path / "store"))
+    assert "Name: ________" in _texts(doc)
+    # inserting twice clones the cached blocks
+    assert ju.reuse_membership_app(doc, source, store)
+    assert _texts(doc).count("Membership Application") == 2
+
+
+def test_changed_source_is_extracted_again(tmp_path):
+    source = _source_issue(tmp_path / "previous.docx")
+    store = FragmentStore(tmp_path / "store")
+    ju.reuse_journal_page(ju.Document(), source, 3, store)
+
+    edited = ju.Document(str(source))
+    edited.paragraphs[-1].text = "Name and address"
+    edited.save(source)
+
+    doc = ju.Document()
+    assert ju.reuse_journal_page(doc, source, 3, store)
+    assert "Name and address" in _texts(doc)
+
+
+def test_missing_section_returns_false(tmp_path):
+    source = tmp_path / "plain.docx"
+    src = ju.Document()
+    src.add_paragraph("Nothing to reuse")
+    src.save(source)
+    doc = ju.Document()
+    assert not ju.reuse_info_for_authors(doc, ju.load_document(source), FragmentStore())
+    assert not ju.reuse_journal_page(doc, source, 5, FragmentStore())
+
+
+def test_unwritable_store_still_inserts(tmp_path, monkeypatch):
+    source = _source_issue(tmp_path / "previous.docx")
+
+    def fail(path, data):
+        raise PermissionError("read-only folder")
+
+    monkeypatch.setattr(fragment_store, "_write_atomic", fail)
+    store = FragmentStore(tmp_path / "store")
+    doc = ju.Document()
+    assert ju.reuse_membership_app(doc, source, store)
+    assert "Name: ________" in _texts(doc)
+    # the memory copy is still used
+    assert store.get(source, "membership-app") is not None
+
+
+def test_default_store_is_shared(tmp_path, monkeypatch):
+    source = _source_issue(tmp_path / "previous.docx")
+    store = FragmentStore.next_to(source)
+    assert FragmentStore.next_to(tmp_path / "other.docx") is store
+    assert store.directory == tmp_path.resolve() / ".fragments"
+
+    ju.reuse_info_for_authors(ju.Document(), source)
+    hashed = []
+    monkeypatch.setattr(fragment_store.hashlib, "sha256", lambda *a: hashed.append(a))
+    assert ju.reuse_info_for_authors(ju.Document(), source)
+    assert hashed == []
@@ -0,0 +1,37 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pytest
+from docx.oxml.ns import qn
+from docx.table import Table
+
+import journal_updater.journal_updater as ju
+from journal_updater import fragments
+
+
+def test_fragment_build_fills_copies():
+    first = fragments.SHAPE.build(style="width:1pt", fill="white", stroke="000000")
+    second = fragments.SHAPE.build(style="width:2pt", fill="none", stroke="FF0000")
+    shape = first[0]
+    assert shape.get("style") == "width:1pt" and shape.get("fillcolor") == "white"
+    assert second[0].get("strokecolor") == "FF0000"
+    assert fragments.SHAPE.template[0].get("style") == "{style}"
+    with pytest.raises(KeyError):
+        fragments.SHAPE.build(style="width:1pt")
+
+
+def test_footer_table_fragment_matches_layout():
+    tbl = fragments.FOOTER_TABLE.build(col="3000", left="Left", right="Right")
+    table = Table(tbl, None)
+    assert [c.text for c in table.rows[0].cells] == ["Left", "1", "Right"]
+    assert [c.get(qn("w:w")) for c in tbl.iter(qn("w:gridCol"))] == ["3000"] * 3
+    instr = next(tbl.iter(qn("w:instrText")))
+    assert instr.text == "PAGE"
+
+    doc = ju.Document()
+    ju.apply_footer_layout(doc, "3", "2", "2025")
+    cells = doc.sections[0].footer.tables[0].rows[0].cells
+    assert [c.text for c in cells] == ["The ABNFF Journal", "1", "Volume 3 (2025), Issue 2"]
+    assert cells[2].paragraphs[0].runs[0].font.size == ju.Pt(10)
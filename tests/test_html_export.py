@@ -0,0 +1,161 @@
+import io
+import os
+import struct
+import sys
+import zlib
+
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.oxml import OxmlElement
+from docx.shared import Inches
+from lxml import etree
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import journal_updater.journal_updater as ju
+from journal_updater.html_export import export_html
+
+_MC = "http://schemas.openxmlformats.org/markup-compatibility/2006"
+
+
+def _png(width, height):
+    def chunk(kind, data):
+        body = kind + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body))
+
+    row = b"\0" + bytes(x * 3 % 256 for x in range(width * 3))
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+        + chunk(b"IDAT", zlib.compress(row * height))
+        + chunk(b"IEND", b"")
+    )
+
+
+def _issue():
+    doc = ju.Document()
+    doc.add_heading("Journal of the ABNFF", level=1)
+    doc.add_paragraph("Table of Contents")
+    doc.add_paragraph("ARTICLES")
+    doc.add_paragraph("Caring & Curing..........3")
+    doc.add_paragraph("Second Study..........5")
+    doc.add_paragraph("")
+    doc.add_paragraph("ARTICLES")
+    doc.add_paragraph("Caring & Curing")
+    p = doc.add_paragraph("Plain ")
+    p.add_run("bold").bold = True
+    p.add_run(" and ")
+    p.add_run("italic").italic = True
+    doc.add_paragraph("First point", style="List Bullet")
+    doc.add_paragraph("Second point", style="List Bullet")
+    doc.add_picture(io.BytesIO(_png(8, 8)), width=Inches(1))
+    table = doc.add_table(rows=2, cols=2)
+    table.cell(0, 0).merge(table.cell(0, 1)).text = "Header"
+    table.cell(1, 0).text = "a < b"
+    doc.add_paragraph("Second Study")
+    doc.add_heading("Methods", level=2)
+    doc.add_picture(io.BytesIO(_png(8, 8)), width=Inches(1))
+    return doc
+
+
+def test_export_writes_index_and_article_pages(tmp_path):
+    pages = export_html(_issue(), tmp_path, title="June 2025")
+    names = [p.name for p in pages]
+    assert names == [
+        "index.html",
+        "article-01-caring-curing.html",
+        "article-02-second-study.html",
+    ]
+
+    index = pages[0].read_text(encoding="utf-8")
+    assert "<h1>Journal of the ABNFF</h1>" in index
+    assert '<a href="article-01-caring-curing.html">Caring &amp; Curing</a>' in index
+    assert "Plain" not in index
+
+    first = pages[1].read_text(encoding="utf-8")
+    assert "<h1>Caring &amp; Curing</h1>" in first
+    assert "<p>Plain <strong>bold</strong> and <em>italic</em></p>" in first
+    assert "<ul>\n<li>First point</li>\n<li>Second point</li>\n</ul>" in first
+    assert '<td colspan="2"><p>Header</p></td>' in first
+    assert "<p>a &lt; b</p>" in first
+    assert "Second Study" not in first.split("<main>")[1].split("</main>")[0]
+
+    second = pages[2].read_text(encoding="utf-8")
+    assert "<h2>Methods</h2>" in second
+
+    # the same picture used twice is written once
+    media = list((tmp_path / "media").iterdir())
+    assert len(media) == 1
+    assert f'src="media/{media[0].name}"' in first
+    assert f'src="media/{media[0].name}"' in second
+
+
+def test_export_without_toc_writes_index_only(tmp_path):
+    doc = ju.Document()
+    doc.add_paragraph("Just text")
+    pages = export_html(doc, tmp_path)
+    assert [p.name for p in pages] == ["index.html"]
+    assert "<p>Just text</p>" in pages[0].read_text(encoding="utf-8")
+
+
+def _link(paragraph, text, url=None, anchor=None):
+    link = OxmlElement("w:hyperlink")
+    if url is not None:
+        link.set(ju.qn("r:id"), paragraph.part.relate_to(url, RT.HYPERLINK, is_external=True))
+    if anchor is not None:
+        link.set(ju.qn("w:anchor"), anchor)
+    run = OxmlElement("w:r")
+    t = OxmlElement("w:t")
+    t.text = text
+    run.append(t)
+    link.append(run)
+    paragraph._p.append(link)
+
+
+def test_links_are_safe_and_anchors_resolve(tmp_path):
+    doc = _issue()
+    p = doc.paragraphs[8]
+    _link(p, "site", url="https://abnff.org/?a=1&b=2")
+    _link(p, "mail", url="mailto:editor@abnff.org")
+    _link(p, "evil", url="javascript:alert(1)")
+    _link(p, "blob", url="data:text/html,<script>alert(1)</script>")
+    _link(p, "see methods", anchor="methods")
+    _link(p, "nowhere", anchor="missing")
+    methods = doc.paragraphs[-2]._p
+    mark = OxmlElement("w:bookmarkStart")
+    mark.set(ju.qn("w:id"), "1")
+    mark.set(ju.qn("w:name"), "methods")
+    methods.insert(1, mark)
+
+    pages = export_html(doc, tmp_path)
+    first = pages[1].read_text(encoding="utf-8")
+    assert '<a href="https://abnff.org/?a=1&amp;b=2">site</a>' in first
+    assert '<a href="mailto:editor@abnff.org">mail</a>' in first
+    assert "javascript:" not in first and "data:" not in first
+    assert "evil" in first and "blob" in first
+    assert f'<a href="{pages[2].name}#methods">see methods</a>' in first
+    assert "nowhere" in first and "#missing" not in first
+    assert '<a id="methods"></a>' in pages[2].read_text(encoding="utf-8")
+
+
+def test_wrapped_text_and_deep_headings(tmp_path):
+    doc = ju.Document()
+    p = doc.add_paragraph("See ")
+    for tag, text in (
+        ("w:fldSimple", "page 3"),
+        ("w:customXml", " by Smith"),
+        ("w:moveTo", " moved"),
+    ):
+        wrapper = etree.SubElement(p._p, ju.qn(tag))
+        etree.SubElement(etree.SubElement(wrapper, ju.qn("w:r")), ju.qn("w:t")).text = text
+    alternate = etree.SubElement(p._p, f"{{{_MC}}}AlternateContent")
+    choice = etree.SubElement(alternate, f"{{{_MC}}}Choice")
+    etree.SubElement(etree.SubElement(choice, ju.qn("w:r")), ju.qn("w:t")).text = " chosen"
+    fallback = etree.SubElement(alternate, f"{{{_MC}}}Fallback")
+    etree.SubElement(etree.SubElement(fallback, ju.qn("w:r")), ju.qn("w:t")).text = " old"
+    doc.add_heading("Deep", level=7)
+    doc.add_heading("Sixth", level=6)
+
+    html = export_html(doc, tmp_path)[0].read_text(encoding="utf-8")
+    assert "<p>See page 3 by Smith moved chosen</p>" in html
+    assert "<h6>Sixth</h6>" in html
+    assert "<h7>" not in html and "<p>Deep</p>" in html
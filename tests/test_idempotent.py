@@ -0,0 +1,60 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from docx.enum.section import WD_SECTION
+
+import journal_updater.journal_updater as ju
+
+
+def test_generated_elements_are_replaced():
+    doc = ju.Document()
+    doc.add_paragraph("intro")
+    doc.add_section(WD_SECTION.NEW_PAGE)
+    doc.add_paragraph("body")
+
+    for _ in range(2):
+        ju.apply_footer_layout(doc, "3", "2", "2025")
+        ju.add_page_borders_with_rule(doc, 0, add_center_line=True)
+        ju.insert_article_title(doc, "First Article")
+        ju.mark_draft(doc)
+
+    for section in doc.sections:
+        assert len(section.footer.tables) == 1
+        assert len(ju.find_generated(section.header._element, "center_rule")) == 1
+        assert len(ju.find_generated(section.header._element, "draft")) == 1
+    titles = ju.find_generated(doc.element.body, "article_title")
+    assert len(titles) == 1
+    assert titles[0] is doc.element.body[-2]
+
+    ju.insert_article_title(doc, "Second Article")
+    assert len(ju.find_generated(doc.element.body, "article_title")) == 2
+
+
+def test_update_journal_on_own_output(tmp_path, monkeypatch):
+    monkeypatch.setattr(ju, "save_pdf", lambda *args: None)
+    base = ju.Document()
+    base.add_paragraph("Volume 1, Issue 1")
+    base.add_paragraph("June 2024")
+    base.add_section(WD_SECTION.NEW_PAGE)
+    base.add_paragraph("ARTICLES")
+    base.add_paragraph("old article")
+    base_path = tmp_path / "base.docx"
+    base.save(base_path)
+
+    content = tmp_path / "content"
+    content.mkdir()
+    art = ju.Document()
+    art.add_paragraph("New article")
+    art.save(content / "article1.docx")
+
+    first = tmp_path / "first.docx"
+    second = tmp_path / "second.docx"
+    ju.update_journal(base_path, content, first, "2", "1", "June 2025")
+    ju.update_journal(first, content, second, "2", "1", "June 2025")
+
+    once, twice = ju.Document(first), ju.Document(second)
+    assert len(twice.element.body) == len(once.element.body)
+    assert [len(s.footer.tables) for s in twice.sections] == [1, 1]
+    assert [p.text for p in twice.paragraphs][-1] == "New article"
@@ -0,0 +1,112 @@
+import io
+import os
+import struct
+import sys
+import zlib
+
+import pytest
+from docx.shared import Inches
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import journal_updater.journal_updater as ju
+from journal_updater import images
+
+
+def _png(width, height):
+    def chunk(kind, data):
+        body = kind + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body))
+
+    row = b"\0" + bytes(x * 7 % 256 for x in range(width * 3))
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+        + chunk(b"IDAT", zlib.compress(row * height))
+        + chunk(b"IEND", b"")
+    )
+
+
+def _article_with_picture(path, width=400, height=400, inches=1):
+    doc = ju.Document()
+    doc.add_paragraph("Article text")
+    doc.add_picture(io.BytesIO(_png(width, height)), width=Inches(inches))
+    doc.save(path)
+    return path
+
+
+def _blip_targets(doc):
+    rels = doc.part.rels
+    return [
+        rels[blip.get(images._EMBED)].target_part
+        for blip in doc.element.body.iter(images._BLIP)
+    ]
+
+
+def test_import_articles_copies_pictures(tmp_path):
+    article = _article_with_picture(tmp_path / "article1.docx")
+    doc = ju.Document()
+    doc.add_paragraph("Base")
+    ju.import_articles(doc, [article])
+
+    [part] = _blip_targets(doc)
+    assert part.content_type == "image/png"
+    assert part.image.px_width == 400
+
+    out = tmp_path / "out.docx"
+    doc.save(out)
+    assert len(_blip_targets(ju.Document(out))) == 1
+
+
+def test_displayed_extent_per_image_part(tmp_path):
+    doc = ju.Document()
+    doc.add_picture(io.BytesIO(_png(400, 200)), width=Inches(2))
+    [(part, extent)] = images.displayed_extents(doc).items()
+    assert extent == (Inches(2), Inches(1))
+    assert images._target_pixels(extent, 100) == (200, 100)
+
+
+def test_without_pillow_nothing_changes(tmp_path, monkeypatch, caplog):
+    monkeypatch.setattr(images, "Image", None)
+    doc = ju.Document()
+    doc.add_picture(io.BytesIO(_png(400, 400)), width=Inches(1))
+    before = _blip_targets(doc)[0].blob
+    stats = images.optimize_images(doc, dpi=50)
+    assert stats["images"] == 1 and stats["resized"] == 0
+    assert _blip_targets(doc)[0].blob is before
+    assert "Pillow" in caplog.text
+
+
+def test_optimize_images_resizes_and_caches(tmp_path):
+    pytest.importorskip("PIL")
+    cache = tmp_path / "cache"
+
+    def run():
+        doc = ju.Document()
+        doc.add_picture(io.BytesIO(_png(800, 800)), width=Inches(1))
+        stats = images.optimize_images(doc, dpi=100, cache_dir=cache)
+        return doc, stats
+
+    doc, stats = run()
+    assert stats["resized"] == 1 and stats["cached"] == 0
+    assert _blip_targets(doc)[0].image.px_width == 100
+    assert len(list(cache.iterdir())) == 1
+
+    images._MEMORY.clear()
+    _, stats = run()
+    assert stats["resized"] == 1 and stats["cached"] == 1
+
+
+def test_optimize_images_instruction():
+    assert ju.Instructions(optimize_images=True).optimize_images == {}
+    assert ju.Instructions(optimize_images={"dpi": 150}).optimize_images == {"dpi": 150}
+    with pytest.raises(ju.InstructionsError):
+        ju.Instructions(optimize_images={"quality": 101})
+    for value in ("85", 85.0, "85.0", 85):
+        assert ju.Instructions(optimize_images={"quality": value}).optimize_images == {
+            "quality": 85
+        }
+    assert ju.Instructions(optimize_images={"dpi": "150.0"}).optimize_images == {"dpi": 150}
+    for bad in ({"dpi": 0.5}, {"dpi": 0}, {"dpi": 149.5}, {"dpi": True}, {"quality": 0}):
+        with pytest.raises(ju.InstructionsError):
+            ju.Instructions(optimize_images=bad)
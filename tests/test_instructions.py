@@ -0,0 +1,92 @@
+import json
+import os
+import stat
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pytest
+
+from journal_updater.instructions import Instructions, InstructionsError
+
+
+def test_instructions_validate_and_round_trip(tmp_path):
+    (tmp_path / "instructions.json").write_text(
+        json.dumps(
+            {
+                "volume": 4,
+                "font_size": "12",
+                "line_spacing": 1.5,
+                "font_size_from_page": {"page": 3, "size": 10},
+                "format_front_and_footer": True,
+                "cleanup_black_lines": False,
+                "unused": 1,
+            }
+        )
+    )
+    inst = Instructions.load(tmp_path)
+    assert inst.volume == "4" and inst.issue is None
+    assert inst.font_size == 12
+    assert inst.font_size_from_page == {"page": 3, "size": 10}
+    assert inst.format_front_and_footer == {}
+    assert not hasattr(inst, "__dict__")
+
+    merged = inst.merged(font_family="Arial", font_size=None)
+    assert merged.font_family == "Arial" and merged.font_size == 12
+    assert inst.font_family is None
+
+    out = tmp_path / "saved"
+    out.mkdir()
+    merged.save(out)
+    assert Instructions.load(out) == merged
+    assert Instructions.load(tmp_path / "missing").to_dict() == {}
+
+
+@pytest.mark.parametrize(
+    "data, message",
+    [
+        ({"font_size": -2}, "font_size must be a positive number"),
+        ({"delete_after_page": True}, "delete_after_page must be a page number"),
+        ({"cleanup_black_lines": "yes"}, "cleanup_black_lines must be true or false"),
+        ({"line_spacing_from_page": {"page": 2}}, "'page' and 'spacing'"),
+    ],
+)
+def test_instructions_reject_bad_values(tmp_path, data, message):
+    (tmp_path / "instructions.json").write_text(json.dumps(data))
+    with pytest.raises(InstructionsError, match=message):
+        Instructions.load(tmp_path)
+    with pytest.raises(InstructionsError):
+        Instructions(**data)
+
+
+def test_instructions_attribute_checks(tmp_path):
+    inst = Instructions()
+    inst.autofit_table_on_page = "2"
+    assert inst.autofit_table_on_page == 2
+    with pytest.raises(AttributeError):
+        inst.colour = "red"
+    (tmp_path / "instructions.json").write_text("{not json")
+    with pytest.raises(InstructionsError, match="Failed to read"):
+        Instructions.load(tmp_path)
+
+
+def test_unknown_keys_survive_save(tmp_path):
+    (tmp_path / "instructions.json").write_text(
+        json.dumps({"font_size": 11, "future_setting": {"keep": [1, 2]}})
+    )
+    loaded = Instructions.load(tmp_path)
+    assert loaded.extra == {"future_setting": {"keep": [1, 2]}}
+    assert "future_setting" not in loaded.to_dict()
+
+    loaded.merged(font_size=12).save(tmp_path)
+    saved = json.loads((tmp_path / "instructions.json").read_text())
+    assert saved == {"font_size": 12, "future_setting": {"keep": [1, 2]}}
+
+
+def test_save_keeps_the_file_shared(tmp_path):
+    path = tmp_path / "instructions.json"
+    path.write_text("{}")
+    os.chmod(path, 0o664)
+    Instructions(font_size=10).save(tmp_path)
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o664
+    assert not [p for p in tmp_path.iterdir() if p != path]
@@ -57,3 +57,30 @@ def test_instructions_override(tmp_path):
     assert "Volume 4, Issue 6" in texts[0]
     assert "New Article Body" in texts
     assert "Old Article" not in texts
+
+
+def test_instructions_object_skips_file(tmp_path):
+    base_path = tmp_path / "base.docx"
+    _build_old_journal(base_path)
+
+    content = tmp_path / "content"
+    content.mkdir()
+    _build_blank_article(content / "article1.docx")
+    (content / "instructions.json").write_text("{broken")
+
+    out_path = tmp_path / "out.docx"
+    ju.update_journal(
+        base_path,
+        content,
+        out_path,
+        volume="1",
+        issue="2",
+        month_year="July 2025",
+        start_page=3,
+        instructions=ju.Instructions(volume="5", font_size=9),
+    )
+
+    result = ju.Document(out_path)
+    assert "Volume 5, Issue 2" in result.paragraphs[0].text
+    para = next(p for p in result.paragraphs if "New Article Body" in p.text)
+    assert para.runs[0].font.size.pt == 9
@@ -55,6 +55,7 @@ def test_main_from_gui(tmp_path):
     assert "Volume 2, Issue 3" in texts[0]
     assert "New Article Body" in texts
     assert "Old Article" not in texts
+    assert not (content / "instructions.json").exists()
 
 
 def test_main_from_gui_font_options(tmp_path):
@@ -79,6 +80,7 @@ def test_main_from_gui_font_options(tmp_path):
         font_size=14,
         line_spacing=1.5,
         font_family="Arial",
+        save_instructions=True,
     )
 
     inst = json.load((content / "instructions.json").open())
@@ -0,0 +1,84 @@
+import os
+import sys
+import json
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from docx.enum.text import WD_BREAK
+
+import journal_updater.journal_updater as ju
+
+
+def test_update_journal_plan(tmp_path, capsys):
+    base = ju.Document()
+    base.add_paragraph("Volume 1, Issue 1")
+    base.add_paragraph("Table of Contents")
+    base.add_paragraph("ARTICLES")
+    base.add_paragraph("Old Article................3")
+    base.add_paragraph("OTHER").add_run().add_break(WD_BREAK.PAGE)
+    base.add_paragraph("ARTICLES")
+    base.add_paragraph("Old Article")
+    base.add_paragraph("Old article text")
+    base_path = tmp_path / "base.docx"
+    base.save(base_path)
+    before = base_path.read_bytes()
+
+    content = tmp_path / "content"
+    content.mkdir()
+    for name in ("articleB.docx", "articleA.docx"):
+        ju.Document().save(content / name)
+    (content / "instructions.json").write_text(
+        json.dumps({"font_size": 12, "font_size_from_page": {"page": 2, "size": 9}})
+    )
+
+    out_path = tmp_path / "out.docx"
+    plan = ju.update_journal(
+        base_path, content, out_path, "2", "1", "June 2025", plan=True
+    )
+
+    assert not out_path.exists()
+    assert base_path.read_bytes() == before
+    assert plan["toc_titles"] == ["Old Article"]
+    assert [d["step"] for d in plan["deletions"]] == ["clear_articles"]
+    assert plan["deletions"][0]["paragraphs"] == (5, 8)
+    assert plan["deletions"][0]["pages"] == (2, 2)
+    assert [os.path.basename(a) for a in plan["articles"]] == [
+        "articleA.docx",
+        "articleB.docx",
+    ]
+    assert [r["ok"] for r in plan["preflight"]] == [True, True]
+    assert plan["formatting"][0] == {
+        "step": "font_size", "value": 12, "paragraphs": (5, None)
+    }
+    assert plan["formatting"][1]["from_page"] == 2
+
+    out = capsys.readouterr().out
+    assert "clear_articles: paragraphs 5-7, pages 2-2" in out
+    assert "1. " in out and "articleA.docx" in out
+
+
+def test_plan_models_removal_of_imported_articles(tmp_path, monkeypatch):
+    monkeypatch.setattr(ju, "save_pdf", lambda *args: None)
+    base = ju.Document()
+    base.add_paragraph("Volume 1, Issue 1")
+    base.add_paragraph("ARTICLES")
+    base.add_paragraph("old article")
+    base_path = tmp_path / "base.docx"
+    base.save(base_path)
+    content = tmp_path / "content"
+    content.mkdir()
+    art = ju.Document()
+    art.add_paragraph("Imported article")
+    art.save(content / "article1.docx")
+
+    first = tmp_path / "first.docx"
+    ju.update_journal(base_path, content, first, "2", "1", "June 2025")
+    texts = [p.text for p in ju.Document(first).paragraphs]
+    imported = texts.index("Imported article")
+
+    plan = ju.plan_update(first, content, "2", "2", "June 2025")
+    assert plan["deletions"][0]["step"] == "remove_imported_articles"
+    assert plan["deletions"][0]["paragraphs"] == (imported, len(texts))
+    # later steps only see what is left after the removal
+    assert all(d["paragraphs"][1] <= imported for d in plan["deletions"][1:])
+    assert plan["insert_at_paragraph"] <= imported
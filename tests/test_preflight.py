@@ -0,0 +1,73 @@
+import os
+import sys
+import zipfile
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import journal_updater.journal_updater as ju
+from journal_updater.preflight import PreflightError, check_article, preflight
+
+
+def _article(path, *texts):
+    doc = ju.Document()
+    for text in texts:
+        doc.add_paragraph(text)
+    doc.save(path)
+    return path
+
+
+def test_preflight_reports_words_and_size(tmp_path):
+    path = _article(tmp_path / "articleA.docx", "Three short words", "and two")
+    [report] = preflight([path])
+    assert report.ok
+    assert report.words == 5
+    assert report.images == 0
+    assert report.size == path.stat().st_size
+
+
+def test_preflight_lists_every_broken_file(tmp_path):
+    good = _article(tmp_path / "articleA.docx", "fine")
+    bad_zip = tmp_path / "articleB.docx"
+    bad_zip.write_bytes(b"not a zip at all")
+    no_doc = tmp_path / "articleC.docx"
+    with zipfile.ZipFile(no_doc, "w") as zf:
+        zf.writestr("[Content_Types].xml", "<Types/>")
+    encrypted = tmp_path / "articleD.docx"
+    encrypted.write_bytes(b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1" + b"\0" * 512)
+
+    with pytest.raises(PreflightError) as info:
+        preflight([good, bad_zip, no_doc, encrypted])
+
+    reports = info.value.reports
+    assert [r.path for r in reports] == [good, bad_zip, no_doc, encrypted]
+    assert [r.ok for r in reports] == [True, False, False, False]
+    assert "word/document.xml" in reports[2].error
+    assert "password" in reports[3].error
+    message = str(info.value)
+    assert "3 of 4" in message and "articleB.docx" in message
+
+
+def test_unparsable_document_part(tmp_path):
+    path = tmp_path / "articleA.docx"
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("[Content_Types].xml", "<Types/>")
+        zf.writestr("word/document.xml", "<w:document")
+    report = check_article(path)
+    assert not report.ok and "parse" in report.error
+
+
+def test_update_journal_stops_before_loading_base(tmp_path):
+    content = tmp_path / "content"
+    content.mkdir()
+    _article(content / "articleA.docx", "ok")
+    (content / "articleB.docx").write_bytes(b"broken")
+    out = tmp_path / "out.docx"
+
+    # the base document does not exist: preflight must fail first
+    with pytest.raises(PreflightError):
+        ju.update_journal(
+            tmp_path / "missing.docx", content, out, "1", "1", "June 2025", draft=True
+        )
+    assert not out.exists()
@@ -0,0 +1,152 @@
+import os
+import stat
+import struct
+import sys
+import zipfile
+import zlib
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import journal_updater.journal_updater as ju
+
+
+def _png_bytes(width=4, height=4):
+    def chunk(kind, data):
+        body = kind + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body))
+
+    raw = b"".join(b"\x00" + b"\xff\x00\x00" * width for _ in range(height))
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+        + chunk(b"IDAT", zlib.compress(raw))
+        + chunk(b"IEND", b"")
+    )
+
+
+def _raw_member(path, name):
+    with zipfile.ZipFile(path) as zf:
+        info = zf.getinfo(name)
+        with open(path, "rb") as fh:
+            fh.seek(info.header_offset)
+            header = fh.read(30)
+            name_len, extra_len = struct.unpack("<HH", header[26:30])
+            fh.seek(info.header_offset + 30 + name_len + extra_len)
+            return fh.read(info.compress_size)
+
+
+def test_save_document_copies_untouched_parts(tmp_path):
+    image = tmp_path / "red.png"
+    image.write_bytes(_png_bytes())
+    base = ju.Document()
+    base.add_paragraph("Old text")
+    base.add_picture(str(image))
+    base_path = tmp_path / "base.docx"
+    base.save(base_path)
+
+    doc = ju.load_document(base_path)
+    doc.paragraphs[0].text = "New text"
+    out_path = tmp_path / "out.docx"
+    stats = ju.save_document(doc, out_path)
+
+    assert stats["written"] >= 1
+    assert stats["copied"] > stats["written"]
+    for name in ("word/media/image1.png", "word/styles.xml"):
+        assert _raw_member(out_path, name) == _raw_member(base_path, name)
+    assert _raw_member(out_path, "word/document.xml") != _raw_member(
+        base_path, "word/document.xml"
+    )
+
+    result = ju.Document(out_path)
+    assert result.paragraphs[0].text == "New text"
+    assert len(result.inline_shapes) == 1
+
+
+def test_save_document_over_source_and_without_source(tmp_path):
+    base_path = tmp_path / "base.docx"
+    ju.Document().save(base_path)
+
+    doc = ju.load_document(base_path)
+    doc.add_paragraph("Added")
+    ju.save_document(doc, base_path)
+    assert ju.Document(base_path).paragraphs[-1].text == "Added"
+
+    fresh = ju.Document()
+    fresh.add_paragraph("Fresh")
+    stats = ju.save_document(fresh, tmp_path / "fresh.docx", compresslevel=1)
+    assert stats["copied"] == 0
+    assert ju.Document(tmp_path / "fresh.docx").paragraphs[0].text == "Fresh"
+
+
+def test_xml_parts_are_fingerprinted_when_saving(tmp_path):
+    base = ju.Document()
+    base.add_paragraph("Text")
+    saved = tmp_path / "saved.docx"
+    base.save(saved)
+    # rewrite styles.xml the way another editor might, with the same content
+    base_path = tmp_path / "base.docx"
+    with zipfile.ZipFile(saved) as src, zipfile.ZipFile(base_path, "w") as dst:
+        for info in src.infolist():
+            data = src.read(info)
+            if info.filename == "word/styles.xml":
+                data = data.replace(b"'", b'"', 4)
+            dst.writestr(info, data)
+
+    doc = ju.load_document(base_path)
+    source = ju._SOURCES[doc.part.package]
+    assert source.fingerprints["word/document.xml"] is None
+    assert source.fingerprints["word/styles.xml"] is None
+
+    stats = ju.save_document(doc, tmp_path / "out.docx")
+    assert stats["written"] == 0
+    # identical bytes need no fingerprint, the rewritten part is parsed once
+    assert source.fingerprints["word/document.xml"] is None
+    assert source.fingerprints["word/styles.xml"] is not None
+    assert _raw_member(tmp_path / "out.docx", "word/styles.xml") == _raw_member(
+        base_path, "word/styles.xml"
+    )
+
+
+def test_save_document_falls_back_to_writestr(tmp_path, monkeypatch):
+    base_path = tmp_path / "base.docx"
+    base = ju.Document()
+    base.add_paragraph("Kept")
+    base.save(base_path)
+
+    def broken(src, info, dst):
+        dst.fp.write(b"partial header")
+        raise AttributeError("'ZipFile' object has no attribute 'start_dir'")
+
+    monkeypatch.setattr(ju, "_copy_raw_member", broken)
+    doc = ju.load_document(base_path)
+    doc.add_paragraph("Added")
+    stats = ju.save_document(doc, tmp_path / "out.docx")
+
+    assert stats["copied"] == 0
+    with zipfile.ZipFile(tmp_path / "out.docx") as zf:
+        assert zf.testzip() is None
+    texts = [p.text for p in ju.Document(tmp_path / "out.docx").paragraphs]
+    assert texts == ["Kept", "Added"]
+
+
+def test_content_types_without_python_docx_helper(tmp_path, monkeypatch):
+    from docx.opc import pkgwriter
+
+    doc = ju.Document()
+    doc.add_paragraph("Text")
+    monkeypatch.delattr(pkgwriter, "_ContentTypesItem")
+    ju.save_document(doc, tmp_path / "out.docx")
+    assert ju.Document(tmp_path / "out.docx").paragraphs[0].text == "Text"
+
+
+def test_save_document_keeps_file_modes(tmp_path):
+    base_path = tmp_path / "base.docx"
+    ju.Document().save(base_path)
+    os.chmod(base_path, 0o640)
+
+    doc = ju.load_document(base_path)
+    ju.save_document(doc, tmp_path / "new.docx")
+    ju.save_document(doc, base_path)
+    # a new file gets the mode open() would give it, not mkstemp's 0600
+    assert stat.S_IMODE(os.stat(tmp_path / "new.docx").st_mode) == 0o666 & ~ju.atomic._UMASK
+    assert stat.S_IMODE(os.stat(base_path).st_mode) == 0o640
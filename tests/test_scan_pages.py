@@ -0,0 +1,98 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from docx.enum.section import WD_SECTION
+from docx.enum.text import WD_BREAK
+from docx.oxml import OxmlElement
+
+import journal_updater.journal_updater as ju
+
+
+def _texts(page_map, page):
+    return [p.text for p in page_map.paragraphs_on(page)]
+
+
+def test_scan_pages_all_break_sources():
+    doc = ju.Document()
+    doc.add_paragraph("p1").add_run().add_break(WD_BREAK.PAGE)
+    doc.add_paragraph("p2").paragraph_format.page_break_before = False
+    doc.add_paragraph("p3").paragraph_format.page_break_before = True
+    doc.add_section(WD_SECTION.NEW_PAGE)
+    doc.add_paragraph("p4")
+
+    page_map = ju.scan_pages(doc)
+    assert len(page_map) == 4
+    assert _texts(page_map, 1) == ["p1"]
+    assert _texts(page_map, 2) == ["p2"]
+    # add_section() closes page 3 with an empty paragraph holding the sectPr
+    assert _texts(page_map, 3)[0] == "p3"
+    assert _texts(page_map, 4) == ["p4"]
+
+
+def test_scan_pages_counts_rendered_break_once():
+    doc = ju.Document()
+    doc.add_paragraph("p1").add_run().add_break(WD_BREAK.PAGE)
+    p2 = doc.add_paragraph()
+    run = p2.add_run()
+    run._r.append(OxmlElement("w:lastRenderedPageBreak"))
+    run.add_text("p2")
+    p3 = doc.add_paragraph("p3 starts")
+    marker = p3.add_run()
+    marker._r.append(OxmlElement("w:lastRenderedPageBreak"))
+    marker.add_text(" and continues")
+    doc.add_paragraph("p4")
+
+    page_map = ju.scan_pages(doc)
+    assert len(page_map) == 3
+    assert _texts(page_map, 2) == ["p2", "p3 starts and continues"]
+    assert _texts(page_map, 3) == ["p4"]
+
+
+def test_scan_pages_includes_tables():
+    doc = ju.Document()
+    doc.add_paragraph("intro").add_run().add_break(WD_BREAK.PAGE)
+    table = doc.add_table(rows=1, cols=1)
+    table.cell(0, 0).paragraphs[0].add_run("cell").add_break(WD_BREAK.PAGE)
+    doc.add_paragraph("after")
+
+    page_map = ju.scan_pages(doc)
+    assert len(page_map) == 3
+    assert page_map.elements_on(2) == [table._tbl]
+    assert _texts(page_map, 3) == ["after"]
+
+    pages = ju.map_pages_to_paragraphs(doc)
+    assert sorted(pages) == [1, 2, 3]
+    assert pages[2] == []
+
+
+def test_page_map_lookups_and_ranges():
+    doc = ju.Document()
+    doc.add_paragraph("a").add_run().add_break(WD_BREAK.PAGE)
+    doc.add_paragraph("b")
+    table = doc.add_table(rows=1, cols=1)
+    doc.add_paragraph("c").add_run().add_break(WD_BREAK.PAGE)
+    doc.add_paragraph("d")
+
+    page_map = ju.scan_pages(doc)
+    assert page_map.starts.typecode == "I"
+    assert list(page_map.starts) == [0, 1, 4]
+    assert [page_map.page_of(i) for i in range(5)] == [1, 2, 2, 2, 3]
+    cell_p = table.cell(0, 0).paragraphs[0]._p
+    assert page_map.index_of(cell_p) == 2
+    assert page_map.page_of_element(cell_p) == 2
+    assert page_map.paragraph_indices(*page_map.span(2)) == [1, 3]
+    assert page_map.paragraph(3).text == "c"
+
+
+def test_delete_after_page_removes_tables():
+    doc = ju.Document()
+    doc.add_paragraph("keep").add_run().add_break(WD_BREAK.PAGE)
+    doc.add_table(rows=1, cols=1)
+    doc.add_paragraph("drop")
+
+    ju.delete_after_page(doc, 1)
+    assert [p.text for p in doc.paragraphs] == ["keep"]
+    assert len(doc.tables) == 0
+    assert doc.element.body.sectPr is not None
@@ -0,0 +1,126 @@
+import json
+import os
+import sys
+import threading
+from urllib import error as urlerror
+from urllib import request as urlrequest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pytest
+
+import journal_updater.journal_updater as ju
+from journal_updater import server
+
+
+TOKEN = "test-token"
+
+
+@pytest.fixture
+def worker_url():
+    worker = server.Worker()
+    httpd = server.make_server("127.0.0.1", 0, worker, token=TOKEN)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}", worker
+    httpd.shutdown()
+    httpd.server_close()
+    worker.stop()
+
+
+def _issue(tmp_path):
+    base = ju.Document()
+    base.add_paragraph("Volume 1, Issue 1")
+    base.add_paragraph("ARTICLES")
+    base.add_paragraph("Old article")
+    base_path = tmp_path / "base.docx"
+    base.save(base_path)
+    content = tmp_path / "content"
+    content.mkdir()
+    art = ju.Document()
+    art.add_paragraph("Fresh article")
+    art.save(content / "article1.docx")
+    return base_path, content
+
+
+def test_worker_runs_jobs_with_warm_base(tmp_path, worker_url, monkeypatch):
+    monkeypatch.setattr(ju, "save_pdf", lambda *args: None)
+    url, worker = worker_url
+    base_path, content = _issue(tmp_path)
+
+    for n in (1, 2):
+        job = server.submit(
+            {
+                "base_doc": str(base_path),
+                "content_folder": str(content),
+                "output_doc": str(tmp_path / f"out{n}.docx"),
+                "volume": "2",
+                "issue": str(n),
+                "month_year": "June 2025",
+            },
+            url,
+            token=TOKEN,
+        )
+        assert job["status"] == "done", job["error"]
+        texts = [p.text for p in ju.Document(tmp_path / f"out{n}.docx").paragraphs]
+        assert "Fresh article" in texts and "Old article" not in texts
+
+    req = urlrequest.Request(f"{url}/status", headers={"Authorization": f"Bearer {TOKEN}"})
+    with urlrequest.urlopen(req) as resp:
+        status = json.loads(resp.read())
+    assert status["cache"] == {"size": 1, "hits": 1, "misses": 1}
+    # the cached base itself is never modified by a job
+    assert worker.cache.get(base_path).paragraphs[-1].text == "Old article"
+
+
+def test_worker_reports_bad_and_failed_jobs(tmp_path, worker_url):
+    url, _ = worker_url
+    with pytest.raises(ValueError, match="missing job fields"):
+        server.submit({"base_doc": "x.docx"}, url, token=TOKEN)
+
+    job = server.submit(
+        {
+            "base_doc": str(tmp_path / "missing.docx"),
+            "content_folder": str(tmp_path),
+            "output_doc": str(tmp_path / "out.docx"),
+            "volume": "1",
+            "issue": "1",
+            "month_year": "June 2025",
+        },
+        url,
+        token=TOKEN,
+    )
+    assert job["status"] == "failed"
+    assert "FileNotFoundError" in job["error"]
+
+
+def _post(url, headers, body=b'{"base_doc": "x.docx"}'):
+    req = urlrequest.Request(f"{url}/jobs", data=body, headers=headers, method="POST")
+    try:
+        with urlrequest.urlopen(req) as resp:
+            return resp.status
+    except urlerror.HTTPError as exc:
+        return exc.code
+
+
+def test_worker_refuses_untrusted_requests(worker_url):
+    url, worker = worker_url
+    auth = {"Authorization": f"Bearer {TOKEN}"}
+    json_type = {"Content-Type": "application/json"}
+    # a form or text/plain POST from a web page
+    assert _post(url, {**auth, "Content-Type": "text/plain"}) == 415
+    assert _post(url, {**auth, **json_type, "Origin": "http://evil.example"}) == 403
+    assert _post(url, {**auth, **json_type, "Host": "evil.example:8765"}) == 403
+    assert _post(url, json_type) == 401
+    assert _post(url, {**json_type, "Authorization": "Bearer wrong"}) == 401
+    # the request that passes all checks reaches the job validation
+    assert _post(url, {**auth, **json_type}) == 400
+    assert worker.pending() == 0 and not worker.jobs
+
+
+def test_token_file_is_private(tmp_path):
+    path = tmp_path / "tokens" / "worker.token"
+    token = server.write_token(path)
+    assert server.read_token(path) == token
+    assert path.stat().st_mode & 0o077 == 0
+    assert server.write_token(path) != token
@@ -0,0 +1,32 @@
+import os
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+def _loaded_after(code):
+    probe = code + "\nimport sys\nprint(sorted({'docx', 'lxml'} & set(sys.modules)))"
+    result = subprocess.run(
+        [sys.executable, "-c", probe], cwd=ROOT, capture_output=True, text=True
+    )
+    return result.stdout.strip().splitlines()[-1]
+
+
+def test_help_and_bad_arguments_skip_docx():
+    for argv in (["--help"], ["a", "b", "c"], ["submit", "--help"], ["serve", "--help"]):
+        code = (
+            "from journal_updater.__main__ import main\n"
+            "try:\n"
+            f"    main({argv!r})\n"
+            "except SystemExit:\n"
+            "    pass"
+        )
+        assert _loaded_after(code) == "[]", argv
+
+
+def test_gui_module_skips_docx():
+    assert _loaded_after("import journal_updater.gui") == "[]"
+    assert _loaded_after(
+        "import journal_updater.gui as gui\ngui._load_updater()"
+    ) == "['docx', 'lxml']"
@@ -0,0 +1,96 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from docx.enum.text import WD_BREAK
+from docx.oxml.ns import qn
+
+import journal_updater.journal_updater as ju
+
+
+def _checks(findings):
+    return sorted((f["check"], f["page"]) for f in findings)
+
+
+def test_validate_document_single_pass_findings():
+    doc = ju.Document()
+    doc.add_paragraph("Volume 3, Issue 2")
+    doc.add_paragraph("June 2025").add_run().add_break(WD_BREAK.PAGE)
+    doc.add_paragraph("-----")
+    doc.add_paragraph("_____")
+    doc.add_paragraph("<<Awaiting President's message>>").add_run().add_break(WD_BREAK.PAGE)
+    doc.add_paragraph("").add_run().add_break(WD_BREAK.PAGE)
+    blip = doc.add_paragraph("last")._p
+    blip.set(qn("r:id"), "rId999")
+
+    findings = ju.validate_document(doc, ju.default_checks("3", "2", "2025"))
+    assert _checks(findings) == [
+        ("dangling_relationship", 4),
+        ("duplicate_lines", 2),
+        ("empty_page", 3),
+        ("placeholder", 2),
+    ]
+
+
+def test_validate_document_headers_and_toc():
+    doc = ju.Document()
+    doc.add_paragraph("TABLE OF CONTENTS")
+    doc.add_paragraph("ARTICLES")
+    doc.add_paragraph("Present Article.....3")
+    doc.add_paragraph("Missing Article.....4")
+    doc.add_paragraph("")
+    doc.add_paragraph("Present Article")
+    doc.sections[0].header.paragraphs[0].text = "Volume 3, Issue 2"
+    doc.sections[0].footer.paragraphs[0].text = "<<Awaiting President's message>>"
+
+    findings = ju.validate_document(doc, ju.default_checks("3", "2", "2025"))
+    by_check = {f["check"]: f for f in findings}
+    assert by_check["placeholder"]["story"] == "footer"
+    # the header copy does not count towards the body occurrence
+    assert [f["message"] for f in findings if f["check"] == "volume_issue"] == [
+        "'Volume 3, Issue 2' found 0 times, expected once",
+        "year 2025 found 0 times, expected once",
+    ]
+    toc = [f["message"] for f in findings if f["check"] == "toc_titles"]
+    assert toc == ["TOC title 'Missing Article' has no matching heading"]
+    # findings made after the walk belong to the body, not the last footer
+    assert {f["story"] for f in findings if f["check"] != "placeholder"} == {"body"}
+
+
+def test_finish_does_not_change_the_story():
+    stories = []
+
+    class LastStory(ju.IssueCheck):
+        name = "last_story"
+
+        def finish(self, ctx):
+            stories.append(ctx.story)
+
+    doc = ju.Document()
+    doc.add_paragraph("")
+    doc.sections[0].footer.paragraphs[0].text = "footer"
+    checks = ju.default_checks("3", "2", "2025") + [LastStory()]
+    ju.validate_document(doc, checks)
+    assert stories == ["footer"]
+
+
+def test_custom_check_sees_every_node_once():
+    class CountRuns(ju.IssueCheck):
+        name = "runs"
+        tags = (qn("w:r"),)
+
+        def __init__(self):
+            self.seen = 0
+
+        def visit_node(self, node, ctx):
+            self.seen += 1
+
+    doc = ju.Document()
+    p = doc.add_paragraph("a")
+    p.add_run("b")
+    table = doc.add_table(rows=1, cols=1)
+    table.cell(0, 0).paragraphs[0].add_run("c")
+    check = CountRuns()
+    assert ju.validate_document(doc, [check]) == []
+    assert check.seen == 3
@@ -0,0 +1,49 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from docx.enum.text import WD_BREAK
+from docx.oxml import OxmlElement
+
+import journal_updater.journal_updater as ju
+from journal_updater import xpaths
+
+
+def test_set_queries_match_per_element_checks():
+    doc = ju.Document()
+    doc.add_paragraph("one")
+    doc.add_paragraph("two").add_run().add_break(WD_BREAK.PAGE)
+    table = doc.add_table(rows=1, cols=1)
+    table.cell(0, 0).paragraphs[0].add_run().add_break(WD_BREAK.PAGE)
+    body = doc.element.body
+
+    breaks = xpaths.PAGE_BREAK_PARAGRAPHS(body)
+    assert breaks == [p for p in body.iter(ju.qn("w:p")) if xpaths.PAGE_BREAKS(p)]
+    assert len(breaks) == 2
+
+    blocks = xpaths.BREAK_BLOCKS(body)
+    assert blocks == [body[1], table._tbl]
+    assert xpaths.BODY_TABLES(body) == [table._tbl]
+    assert len(xpaths.BODY_PARAGRAPHS(body)) == 2
+
+
+def _bottom_border(paragraph, val):
+    border = OxmlElement("w:pBdr")
+    bottom = OxmlElement("w:bottom")
+    bottom.set(ju.qn("w:val"), val)
+    border.append(bottom)
+    paragraph._p.get_or_add_pPr().append(border)
+
+
+def test_bordered_paragraphs():
+    doc = ju.Document()
+    doc.add_paragraph("text")
+    line = doc.add_paragraph("")
+    _bottom_border(line, "single")
+    nil = doc.add_paragraph("")
+    _bottom_border(nil, "nil")
+
+    assert xpaths.BORDERED_PARAGRAPHS(doc.element.body) == [line._p]
+    assert ju._is_line_paragraph(line)
+    assert not ju._is_line_paragraph(nil)